@@ -10,7 +10,7 @@ from sqlalchemy import Select, func, distinct, select
 # from collections import Counter
 
 from mavito_common.models.term import Term
-from mavito_common.db.session import get_db
+from mavito_common.db.replicas import get_read_db
 
 router = APIRouter()
 
@@ -52,7 +52,7 @@ async def get_domain_statistics(
 
 @router.get("/descriptive")
 async def get_descriptive_analytics(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, Union[Dict[str, int], Dict[str, float]]]:
     """Get all descriptive analytics (legacy endpoint).
     This endpoint combines all analytics for backward compatibility."""
@@ -77,14 +77,16 @@ async def get_descriptive_analytics(
 @router.get("/descriptive/category-frequency")
 async def get_category_frequency(
     language: Annotated[Optional[str], Query()] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, int]:
     """Get frequency distribution of terms across different categories."""
     return await get_domain_statistics(db, language)
 
 
 @router.get("/descriptive/language-coverage")
-async def get_language_coverage(db: AsyncSession = Depends(get_db)) -> Dict[str, float]:
+async def get_language_coverage(
+    db: AsyncSession = Depends(get_read_db),
+) -> Dict[str, float]:
     """Get coverage percentage for each language (% of non-empty terms)."""
     # Get total terms count
     total_query = select(func.count(Term.id))
@@ -107,7 +109,7 @@ async def get_language_coverage(db: AsyncSession = Depends(get_db)) -> Dict[str,
 
 @router.get("/descriptive/term-length")
 async def get_term_length_analysis(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, float]:
     """Get average length of terms for each language."""
     query = select(
@@ -124,7 +126,7 @@ async def get_term_length_analysis(
 
 @router.get("/descriptive/definition-length")
 async def get_definition_length_analysis(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, float]:
     """Get average length of definitions for each language."""
     query = select(
@@ -140,7 +142,9 @@ async def get_definition_length_analysis(
 
 
 @router.get("/descriptive/unique-terms")
-async def get_unique_terms_count(db: AsyncSession = Depends(get_db)) -> Dict[str, int]:
+async def get_unique_terms_count(
+    db: AsyncSession = Depends(get_read_db),
+) -> Dict[str, int]:
     """Get count of unique terms for each language."""
     query = select(
         Term.language, func.count(distinct(Term.term)).label("unique_count")
@@ -153,7 +157,7 @@ async def get_unique_terms_count(db: AsyncSession = Depends(get_db)) -> Dict[str
 
 @router.get("/descriptive/terms-by-domain-and-language")
 async def get_terms_by_domain_and_language(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, Dict[str, int]]:
     """Get term distribution across domains and languages."""
     query = select(
@@ -174,7 +178,7 @@ async def get_terms_by_domain_and_language(
 
 @router.get("/descriptive/total-statistics")
 async def get_total_statistics(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, Union[int, float, None]]:
     """Get overall statistics about the term database."""
     # Total terms
@@ -217,7 +221,7 @@ async def get_total_statistics(
 
 @router.get("/descriptive/domain-language-matrix")
 async def get_domain_language_matrix(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, Union[List[str], Dict[str, Dict[str, int]]]]:
     """Get a matrix showing term availability across domains and languages."""
     # Get all domains and languages
@@ -253,7 +257,7 @@ async def get_popular_terms(
     limit: Annotated[int, Query(ge=1, le=100)] = 10,
     domain: Annotated[Optional[str], Query()] = None,
     language: Annotated[Optional[str], Query()] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> List[Dict[str, Union[str, int]]]:
     """Get the most common terms (by frequency of appearance across languages)."""
     # Base query to count term frequencies
@@ -275,7 +279,7 @@ async def get_popular_terms(
 
 @router.get("/descriptive/terms-without-translations")
 async def get_terms_without_translations(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, Dict[str, List[str]]]:
     """Get terms that don't have translations in other languages."""
     # This is a complex query - we need to find terms that appear in only one language
@@ -309,7 +313,7 @@ async def get_terms_without_translations(
 
 @router.get("/descriptive/translation-completeness")
 async def get_translation_completeness(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, Union[int, None, Dict[str, Dict[str, Union[int, float]]]]]:
     """Get translation completeness statistics per domain."""
     # Get all unique terms and count how many languages each appears in
@@ -363,7 +367,7 @@ async def get_translation_completeness(
 
 @router.get("/advanced/language-network")
 async def get_language_network_legacy(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     min_connections: Annotated[int, Query(ge=1)] = 5,
 ) -> Dict[str, List[Dict[str, Union[str, int, float]]]]:
     """Legacy endpoint that redirects to the new optimized implementation."""
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, distinct, text
 from mavito_common.models.term import Term
-from mavito_common.db.session import get_db
+from mavito_common.db.replicas import get_read_db
 from app.core.cache import cached
 
 router = APIRouter()
@@ -88,7 +88,7 @@ async def get_language_pairs(
 @router.get("/advanced/language-network")
 @cached(expire=3600)  # Cache for 1 hour
 async def get_language_network(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     min_connections: Annotated[int, Query(ge=1)] = 5,
     limit: Annotated[int, Query(ge=1, le=1000)] = 100,
     offset: Annotated[int, Query(ge=0)] = 0,
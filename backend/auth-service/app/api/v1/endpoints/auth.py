@@ -2,11 +2,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import timedelta, datetime, date
+from datetime import timedelta, datetime, timezone
 import uuid
 from pydantic import BaseModel
-from google.cloud import storage
-from sqlalchemy import select, func
 
 from mavito_common.schemas.user import (
     UserCreate,
@@ -21,53 +19,35 @@ from mavito_common.schemas.user import (
     ResetPasswordResponse,
 )
 
-from google.oauth2 import id_token
-from google.auth.transport import requests
 from mavito_common.schemas.token import Token
+from mavito_common.core.auth import token_claims
 from mavito_common.core.security import create_access_token
 from mavito_common.core.config import settings
+from app.utils.gcs import get_storage_client
 from mavito_common.db.session import get_db
+from mavito_common.jobs.queue import get_job_queue
 from app.api import deps
 from mavito_common.models.user import User as UserModel  # noqa: F401
 from app.crud.crud_user import crud_user
+from app.services.jobs import DAILY_LOGIN_XP, PASSWORD_RESET_EMAIL
 from mavito_common.models.user import UserRole
-from mavito_common.models.user_xp import UserXP, XPSource
 
 
 router = APIRouter()
 
 
 async def award_daily_login_xp(db: AsyncSession, user: UserModel) -> None:
-    """Award daily login XP if user hasn't received it today."""
-    today = date.today()
-
-    stmt = select(UserXP).where(
-        UserXP.user_id == user.id,
-        UserXP.xp_source == XPSource.LOGIN_STREAK,
-        func.date(UserXP.created_at) == today,
+    """
+    Queue the daily login XP award. The caller's commit enqueues it, and the
+    idempotency key keeps it to one job per user per day.
+    """
+    today = datetime.now(timezone.utc).date().isoformat()
+    await get_job_queue().enqueue(
+        db,
+        DAILY_LOGIN_XP,
+        {"user_id": str(user.id), "day": today},
+        idempotency_key=f"{DAILY_LOGIN_XP}:{user.id}:{today}",
     )
-    result = await db.execute(stmt)
-    existing_xp = result.scalars().first()
-
-    if existing_xp:
-        return  # Already awarded LOGIN_STREAK XP today
-
-    try:
-        login_xp = UserXP(
-            user_id=user.id,
-            xp_amount=5,
-            xp_source=XPSource.LOGIN_STREAK,
-            source_reference_id=None,
-            description="Daily login bonus",
-        )
-
-        db.add(login_xp)
-        await db.commit()
-        await db.refresh(login_xp)
-    except Exception as e:
-        await db.rollback()
-        print(f"Error awarding daily login XP: {e}")
-        # Don't fail the login if XP fails
 
 
 # Profile picture upload schemas
@@ -121,7 +101,7 @@ def generate_profile_picture_upload_url(
         )
 
     try:
-        storage_client = storage.Client()
+        storage_client = get_storage_client()
         bucket_name = settings.GCS_BUCKET_NAME
         bucket = storage_client.bucket(bucket_name)
 
@@ -164,7 +144,7 @@ def get_my_profile_picture_view_url(
         )
 
     try:
-        storage_client = storage.Client()
+        storage_client = get_storage_client()
         bucket_name = settings.GCS_BUCKET_NAME
         bucket = storage_client.bucket(bucket_name)
 
@@ -262,17 +242,17 @@ async def login_for_access_token(
             detail="User account is inactive or locked.",
         )
 
+    # Award daily login XP (committed with the last_login update)
+    await award_daily_login_xp(db, user=user)
+
     # Update last_login timestamp
     await crud_user.set_last_login(db, user=user)
 
-    # Award daily login XP
-    await award_daily_login_xp(db, user=user)
-
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={
-            "sub": user.email
-        },  # 'sub' (subject) in JWT is typically user's email or ID
+        # 'sub' is the user's email; the extra claims let other services
+        # authorise this user without loading the row on every request.
+        data=await token_claims(db, user),
         expires_delta=access_token_expires,
     )
     return {"access_token": access_token, "token_type": "bearer"}
@@ -287,6 +267,10 @@ async def google_login(google_token: GoogleToken, db: AsyncSession = Depends(get
     """
     Handle Google Login/Registration via ID token.
     """
+    # Deferred: the google-auth transport pulls in requests at import time.
+    from google.auth.transport import requests
+    from google.oauth2 import id_token
+
     try:
         idinfo = id_token.verify_oauth2_token(
             google_token.id_token, requests.Request(), settings.GOOGLE_CLIENT_ID
@@ -309,10 +293,11 @@ async def google_login(google_token: GoogleToken, db: AsyncSession = Depends(get
 
         # Award daily login XP for Google login
         await award_daily_login_xp(db, user=user)
+        await db.commit()
 
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": user.email}, expires_delta=access_token_expires
+            data=await token_claims(db, user), expires_delta=access_token_expires
         )
 
         return {"access_token": access_token, "token_type": "bearer"}
@@ -353,7 +338,7 @@ async def guest_login(db: AsyncSession = Depends(get_db)):
         # Create access token for guest
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": new_guest_user.email},
+            data=await token_claims(db, new_guest_user),
             expires_delta=access_token_expires,
         )
 
@@ -477,18 +462,17 @@ async def forgot_password(
     This endpoint always returns success to prevent email enumeration attacks.
     """
     from app.utils.password_reset import find_user_by_email, create_password_reset_token
-    from app.services.email_service import email_service
 
     try:
         user = await find_user_by_email(db, forgot_request.email)
 
         if user:
-            reset_token = await create_password_reset_token(db, user)
-
-            user_name = f"{user.first_name} {user.last_name}".strip()
-            await email_service.send_password_reset_email(
-                to_email=user.email, reset_token=reset_token, user_name=user_name
+            # Committed together with the token; the worker reads the token
+            # from the user row when it sends the email.
+            await get_job_queue().enqueue(
+                db, PASSWORD_RESET_EMAIL, {"user_id": str(user.id)}
             )
+            await create_password_reset_token(db, user)
 
     except Exception as e:
 
@@ -2,8 +2,8 @@ import uuid
 from datetime import timedelta, datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
-from google.cloud import storage
 from mavito_common.core.config import settings
+from app.utils.gcs import get_storage_client
 from app.api import deps  # noqa: F401
 from mavito_common.models.user import User as UserModel
 from app.api.deps import get_current_active_user
@@ -33,7 +33,7 @@ async def generate_signed_url(
     current_user: UserModel = Depends(get_current_active_user),
 ):
     try:
-        storage_client = storage.Client()
+        storage_client = get_storage_client()
         bucket = storage_client.bucket(settings.GCS_BUCKET_NAME)
 
         gcs_key = f"uploads/{current_user.id}/{uuid.uuid4()}-{request.filename}"
@@ -11,7 +11,12 @@ from mavito_common.schemas.user import (
     UserCreateGoogle,
     UserCreateGuest,
 )
-from mavito_common.core.security import get_password_hash, verify_password
+from mavito_common.core.auth import REVOKING_FIELDS, revoke_principals
+from mavito_common.core.security import (
+    UNUSABLE_PASSWORD,
+    get_password_hash_async,
+    verify_password_async,
+)
 from mavito_common.core.exceptions import InvalidPasswordError
 
 
@@ -53,9 +58,7 @@ class CRUDUser:
                 "role": obj_in.role,
                 "is_verified": obj_in.is_verified,
                 "is_active": obj_in.is_active,
-                "password_hash": get_password_hash(
-                    str(uuid.uuid4())
-                ),  # Random password
+                "password_hash": UNUSABLE_PASSWORD,  # Guests have no password
             }
         else:
             user_data = obj_in.model_dump(exclude={"password"})
@@ -82,9 +85,11 @@ class CRUDUser:
                         "Password must contain at least one uppercase letter."
                     )
 
-                user_data["password_hash"] = get_password_hash(obj_in.password)
+                user_data["password_hash"] = await get_password_hash_async(
+                    obj_in.password
+                )
             else:  # UserCreateGoogle
-                user_data["password_hash"] = get_password_hash(str(uuid.uuid4()))
+                user_data["password_hash"] = UNUSABLE_PASSWORD
 
         db_obj = UserModel(**user_data)
         db.add(db_obj)
@@ -119,15 +124,20 @@ class CRUDUser:
                     "New password must contain at least one uppercase letter."
                 )
 
-            hashed_password = get_password_hash(password)
+            hashed_password = await get_password_hash_async(password)
             db_obj.password_hash = hashed_password
             del update_data["password"]
 
+        revokes_tokens = False
         for field, value in update_data.items():
             if hasattr(db_obj, field):
+                if field in REVOKING_FIELDS and getattr(db_obj, field) != value:
+                    revokes_tokens = True
                 setattr(db_obj, field, value)
 
         db.add(db_obj)
+        if revokes_tokens:
+            await revoke_principals(db)
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
@@ -138,7 +148,7 @@ class CRUDUser:
         user = await self.get_user_by_email(db, email=email)
         if not user:
             return None
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             return None
         return user
 
@@ -2,6 +2,9 @@ from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
+from mavito_common.http import health
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
 from mavito_common.core.exceptions import InvalidPasswordError
 
 from app.api.v1.endpoints import auth
@@ -9,7 +12,7 @@ from app.api.v1.endpoints import uploads
 from app.api.v1.endpoints import admin
 from app.api.v1.endpoints import user_preferences
 
-app = FastAPI(title="Marito Auth Service")
+app = FastAPI(title="Marito Auth Service", lifespan=service_lifespan)
 
 if settings.BACKEND_CORS_ORIGINS_LIST:
     app.add_middleware(
@@ -37,6 +40,8 @@ app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
 app.include_router(
     user_preferences.router, prefix="/api/v1/settings", tags=["Settings"]
 )
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
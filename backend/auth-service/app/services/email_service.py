@@ -3,6 +3,8 @@ import httpx
 import os
 from dotenv import load_dotenv
 
+from mavito_common.http.client import get_http_client
+
 # Ensure environment variables are loaded
 load_dotenv()
 
@@ -38,17 +40,16 @@ class EmailService:
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/emails",
-                    json=email_data,
-                    headers=headers,
-                    timeout=10.0,
-                )
-                return response.status_code == 200
-            except httpx.RequestError:
-                return False
+        try:
+            response = await get_http_client().post(
+                f"{self.base_url}/emails",
+                json=email_data,
+                headers=headers,
+                timeout=10.0,
+            )
+            return response.status_code == 200
+        except httpx.RequestError:
+            return False
 
     def _generate_password_reset_html(self, user_name: str, reset_url: str) -> str:
         """Generate HTML email content for password reset."""
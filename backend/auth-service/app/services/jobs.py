@@ -0,0 +1,85 @@
+# app/services/jobs.py
+"""
+Deferred auth-service side effects. Run them with:
+
+    python -m mavito_common.jobs.worker app.services.jobs --queue auth
+"""
+
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.jobs.queue import job
+from mavito_common.models.user import User
+from mavito_common.models.user_level import record_xp_level
+from mavito_common.models.user_stats import record_xp_stats
+from mavito_common.models.user_xp import UserXP, XPSource
+
+DAILY_LOGIN_XP = "auth.daily_login_xp"
+PASSWORD_RESET_EMAIL = "auth.password_reset_email"
+
+
+@job(DAILY_LOGIN_XP)
+async def award_daily_login_xp(db: AsyncSession, payload: Dict[str, Any]) -> None:
+    """
+    Award daily login XP if user hasn't received it on ``payload["day"]``
+    (UTC). The award is dated that day even if the job runs, or is retried,
+    after it ended, so it neither counts twice nor moves the login streak.
+    """
+    user_id = uuid.UUID(payload["user_id"])
+    day = date.fromisoformat(payload["day"])
+    day_start = datetime.combine(day, time(), tzinfo=timezone.utc)
+
+    stmt = select(UserXP.id).where(
+        UserXP.user_id == user_id,
+        UserXP.xp_source == XPSource.LOGIN_STREAK,
+        UserXP.created_at >= day_start,
+        UserXP.created_at < day_start + timedelta(days=1),
+    )
+    if (await db.execute(stmt)).first():
+        return  # Already awarded LOGIN_STREAK XP that day
+
+    xp = UserXP(
+        user_id=user_id,
+        xp_amount=5,
+        xp_source=XPSource.LOGIN_STREAK,
+        source_reference_id=None,
+        description="Daily login bonus",
+        created_at=_during(day),
+    )
+    db.add(xp)
+    await db.execute(record_xp_stats(xp))
+    await db.execute(record_xp_level(xp))
+
+
+def _during(day: date) -> datetime:
+    """Now while ``day`` (UTC) lasts; its last moment once it is over."""
+    now = datetime.now(timezone.utc)
+    if now.date() <= day:
+        return now
+    return datetime.combine(day, time.max, tzinfo=timezone.utc)
+
+
+@job(PASSWORD_RESET_EMAIL)
+async def send_password_reset_email(db: AsyncSession, payload: Dict[str, Any]) -> None:
+    """Emails the user's current reset token, unless it was used or expired."""
+    from app.services.email_service import email_service
+
+    user = await db.get(User, uuid.UUID(payload["user_id"]))
+    if (
+        user is None
+        or not user.password_reset_token
+        or user.password_reset_expires is None
+        or user.password_reset_expires <= datetime.now(timezone.utc)
+    ):
+        return
+
+    user_name = f"{user.first_name} {user.last_name}".strip()
+    sent = await email_service.send_password_reset_email(
+        to_email=user.email, reset_token=user.password_reset_token, user_name=user_name
+    )
+    if not sent:
+        raise RuntimeError("Password reset email was not accepted")
@@ -0,0 +1,51 @@
+# auth-service/app/tests/conftest.py
+
+from typing import AsyncGenerator
+
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# Importing the app registers every model with Base.metadata
+from app.main import app  # noqa: F401
+from mavito_common.core.config import settings
+from mavito_common.db.base_class import Base
+
+# Build database URLs
+DEFAULT_DB_URL = str(settings.SQLALCHEMY_DATABASE_URL).replace(
+    str(settings.DB_NAME), "postgres", 1
+)
+TEST_DB_NAME = f"{settings.DB_NAME}_auth_test"
+TEST_DATABASE_URL = str(settings.SQLALCHEMY_DATABASE_URL) + "_auth_test"
+
+
+# Async test DB setup, for tests that need a real database
+@pytest_asyncio.fixture(scope="function")
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    default_engine = create_async_engine(DEFAULT_DB_URL, isolation_level="AUTOCOMMIT")
+    async with default_engine.connect() as conn:
+        await conn.execute(text(f"DROP DATABASE IF EXISTS {TEST_DB_NAME} WITH (FORCE)"))
+        await conn.execute(text(f"CREATE DATABASE {TEST_DB_NAME}"))
+
+    test_engine = create_async_engine(TEST_DATABASE_URL)
+
+    try:
+        async with test_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        TestingSessionLocal = async_sessionmaker(
+            bind=test_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            await db.close()
+    finally:
+        await test_engine.dispose()
+        async with default_engine.connect() as conn:
+            await conn.execute(text(f"DROP DATABASE {TEST_DB_NAME} WITH (FORCE)"))
+        await default_engine.dispose()
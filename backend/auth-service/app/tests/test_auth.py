@@ -139,9 +139,13 @@ class TestLoginForAccessToken:
             "app.api.v1.endpoints.auth.settings"
         ) as mock_settings, patch(
             "app.api.v1.endpoints.auth.award_daily_login_xp"
-        ) as mock_award_xp:
+        ) as mock_award_xp, patch(
+            "app.api.v1.endpoints.auth.token_claims", new_callable=AsyncMock
+        ) as mock_token_claims:
 
             # Setup mocks - make them async
+            claims = {"sub": mock_user_model.email, "uid": "1", "rv": 0}
+            mock_token_claims.return_value = claims
             mock_crud.authenticate = AsyncMock(return_value=mock_user_model)
             mock_crud.is_user_active = AsyncMock(return_value=True)
             mock_crud.set_last_login = AsyncMock(return_value=None)
@@ -164,8 +168,9 @@ class TestLoginForAccessToken:
             mock_crud.set_last_login.assert_called_once_with(
                 mock_db, user=mock_user_model
             )
+            mock_token_claims.assert_awaited_once_with(mock_db, mock_user_model)
             mock_create_token.assert_called_once_with(
-                data={"sub": mock_user_model.email}, expires_delta=timedelta(minutes=30)
+                data=claims, expires_delta=timedelta(minutes=30)
             )
 
     @pytest.mark.asyncio
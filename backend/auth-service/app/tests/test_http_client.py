@@ -0,0 +1,104 @@
+# backend/app/tests/test_http_client.py
+import asyncio
+
+import httpx
+import pytest
+
+from mavito_common.http.client import CircuitOpenError, InternalHTTPClient
+
+
+def make_client(handler, **kwargs):
+    options = {"backoff_seconds": 0, "breaker_failures": 3, "retries": 2}
+    options.update(kwargs)
+    return InternalHTTPClient(transport=httpx.MockTransport(handler), **options)
+
+
+@pytest.mark.asyncio
+async def test_idempotent_requests_retry_transient_failures():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_client(handler)
+    response = await client.get("http://glossary.internal/api")
+
+    assert response.json() == {"ok": True}
+    assert len(calls) == 3
+    assert client.status()["http://glossary.internal"]["state"] == "closed"
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_by_default():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("refused", request=request)
+
+    client = make_client(handler)
+    with pytest.raises(httpx.ConnectError):
+        await client.post("http://email.internal/emails", json={})
+
+    assert len(calls) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_per_target():
+    def handler(request):
+        if request.url.host == "down.internal":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    client = make_client(handler, retries=0)
+    for _ in range(3):
+        with pytest.raises(httpx.ConnectError):
+            await client.get("http://down.internal/")
+
+    with pytest.raises(CircuitOpenError):
+        await client.get("http://down.internal/")
+    # Existing ``except httpx.RequestError`` handlers still catch it.
+    assert issubclass(CircuitOpenError, httpx.RequestError)
+    assert (await client.get("http://up.internal/")).status_code == 200
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_half_open_trial_that_ends_abnormally_frees_the_breaker():
+    outcome = ["refuse"]
+
+    async def handler(request):
+        if outcome[0] == "refuse":
+            raise httpx.ConnectError("refused", request=request)
+        if outcome[0] == "redirect":
+            raise httpx.TooManyRedirects("loop", request=request)
+        if outcome[0] == "hang":
+            await asyncio.sleep(60)
+        return httpx.Response(200)
+
+    client = make_client(handler, retries=0, breaker_reset_seconds=0)
+    url = "http://flaky.internal/"
+    for _ in range(3):
+        with pytest.raises(httpx.ConnectError):
+            await client.get(url)
+
+    outcome[0] = "redirect"
+    with pytest.raises(httpx.TooManyRedirects):
+        await client.get(url)
+
+    outcome[0] = "hang"
+    trial = asyncio.ensure_future(client.get(url))
+    await asyncio.sleep(0.01)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    outcome[0] = "ok"
+    assert (await client.get(url)).status_code == 200
+    assert client.status()["http://flaky.internal"]["state"] == "closed"
+    await client.aclose()
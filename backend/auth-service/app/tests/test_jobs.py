@@ -0,0 +1,93 @@
+# backend/app/tests/test_jobs.py
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.jobs import queue as jobs
+from mavito_common.jobs.queue import InMemoryJobQueue
+from mavito_common.models.user import User as UserModel
+from app.api.v1.endpoints.auth import award_daily_login_xp
+from app.services.email_service import email_service
+from app.services.jobs import DAILY_LOGIN_XP, send_password_reset_email
+
+
+@pytest.fixture
+def memory_queue(monkeypatch):
+    memory = InMemoryJobQueue()
+    monkeypatch.setattr(jobs, "job_queue", memory)
+    return memory
+
+
+@pytest.mark.asyncio
+async def test_login_queues_one_xp_award_per_day(memory_queue):
+    db = AsyncMock(spec=AsyncSession)
+    user = MagicMock(spec=UserModel)
+    user.id = uuid.uuid4()
+
+    await award_daily_login_xp(db, user=user)
+    await award_daily_login_xp(db, user=user)
+
+    [queued] = memory_queue.pending(DAILY_LOGIN_XP)
+    assert queued.payload["user_id"] == str(user.id)
+    db.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_xp_job_skips_users_already_awarded_that_day(memory_queue):
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    db.execute.return_value.first.return_value = ("existing",)
+    await memory_queue.enqueue(
+        db, DAILY_LOGIN_XP, {"user_id": str(uuid.uuid4()), "day": "2025-10-09"}
+    )
+
+    assert await memory_queue.run_pending(db) == 1
+    db.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_xp_job_run_late_credits_the_login_day(memory_queue):
+    db = AsyncMock(spec=AsyncSession)
+    db.add = MagicMock()
+    db.execute.return_value = MagicMock()
+    db.execute.return_value.first.return_value = None
+    await memory_queue.enqueue(
+        db, DAILY_LOGIN_XP, {"user_id": str(uuid.uuid4()), "day": "2025-10-09"}
+    )
+
+    assert await memory_queue.run_pending(db) == 1
+    [xp] = db.add.call_args.args
+    assert xp.created_at.date() == date(2025, 10, 9)
+    stats = db.execute.call_args_list[1].args[0].compile().params
+    assert stats["last_login_date"] == date(2025, 10, 9)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "expires_in, sent", [(timedelta(minutes=30), True), (-timedelta(minutes=1), False)]
+)
+async def test_reset_email_job_sends_only_unexpired_tokens(
+    db_session, expires_in, sent
+):
+    user = UserModel(
+        first_name="Reset",
+        last_name="Me",
+        email="reset@example.com",
+        password_hash="x",
+        password_reset_token="token-123",
+        password_reset_expires=datetime.now(timezone.utc) + expires_in,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    db_session.expunge_all()  # the handler must read the stored value
+
+    send = AsyncMock(return_value=True)
+    with patch.object(email_service, "send_password_reset_email", send):
+        await send_password_reset_email(db_session, {"user_id": str(user.id)})
+
+    assert send.await_count == (1 if sent else 0)
+    if sent:
+        assert send.await_args.kwargs["reset_token"] == "token-123"
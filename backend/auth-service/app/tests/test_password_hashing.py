@@ -0,0 +1,52 @@
+# backend/app/tests/test_password_hashing.py
+import asyncio
+
+import pytest
+
+from mavito_common.core.security import (
+    UNUSABLE_PASSWORD,
+    PasswordHasher,
+    get_password_hash_async,
+    verify_password,
+    verify_password_async,
+)
+
+
+@pytest.mark.asyncio
+async def test_async_hash_round_trip():
+    hashed = await get_password_hash_async("Secret123")
+
+    assert await verify_password_async("Secret123", hashed)
+    assert not await verify_password_async("Wrong123", hashed)
+
+
+@pytest.mark.asyncio
+async def test_unusable_password_never_matches():
+    assert not verify_password("", UNUSABLE_PASSWORD)
+    assert not await verify_password_async(UNUSABLE_PASSWORD, UNUSABLE_PASSWORD)
+
+
+@pytest.mark.asyncio
+async def test_hasher_queues_beyond_its_workers():
+    hasher = PasswordHasher(workers=1)
+    release = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def blocking(value):
+        asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+        return value
+
+    first = asyncio.ensure_future(hasher.run(blocking, 1))
+    second = asyncio.ensure_future(hasher.run(blocking, 2))
+    await asyncio.sleep(0.05)
+
+    snapshot = hasher.snapshot()
+    assert snapshot["in_flight"] == 1
+    assert snapshot["queued"] == 1
+
+    release.set()
+    assert await asyncio.gather(first, second) == [1, 2]
+    snapshot = hasher.snapshot()
+    assert snapshot["completed"] == 2
+    assert snapshot["queued"] == snapshot["in_flight"] == 0
+    assert snapshot["wait_seconds_max"] > 0
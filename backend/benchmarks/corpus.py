@@ -0,0 +1,527 @@
+# benchmarks/corpus.py
+"""
+Generates a synthetic multilingual terminology corpus for load tests and
+bulk-loads it into a scratch Postgres database. Run from backend/ with the
+usual DB_* settings exported:
+
+    python benchmarks/corpus.py --terms 100000 [--users 2000] [--seed 1] [--fresh]
+
+Each concept gets one term in each of the 11 languages, linked to each other
+the way ingest_data.py links the mock dataset, with ``translation_map`` filled
+in. Terms are built from the mock dataset's words, so prefixes and lengths
+look like real data. On top come votes and comments skewed towards a few
+popular terms, threaded replies, comment votes, XP rows with the matching
+user_stats totals, and learning progress. Benchmark users all share the
+password ``benchmark``.
+
+The data goes into ``<DB_NAME>_bench`` unless ``--database`` says otherwise;
+the database and its tables are created when missing. Rows are written with
+COPY in batches of concepts, so memory stays flat up to millions of terms.
+"""
+import argparse
+import asyncio
+import json
+import importlib
+import os
+import pkgutil
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Sequence, Set, Tuple
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../mavito-common-lib"))
+)
+
+import asyncpg  # noqa: E402
+from sqlalchemy.engine import make_url  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+import mavito_common.models  # noqa: E402
+from mavito_common.core.config import settings  # noqa: E402
+from mavito_common.core.security import get_password_hash  # noqa: E402
+from mavito_common.db.base_class import Base  # noqa: E402
+from mavito_common.models.comment import Comment  # noqa: E402
+from mavito_common.models.comment_vote import CommentVote  # noqa: E402
+from mavito_common.models.data_version import (  # noqa: E402
+    TERMS_DATA_VERSION,
+    bump_data_version,
+)
+from mavito_common.models.term import Term, term_translations  # noqa: E402
+from mavito_common.models.term_status import TermStatus  # noqa: E402
+from mavito_common.models.term_vote import TermVote  # noqa: E402
+from mavito_common.models.user import User, UserRole  # noqa: E402
+from mavito_common.models.user_learning_progress import (  # noqa: E402
+    UserLearningProgress,
+)
+from mavito_common.models.user_stats import UserStats  # noqa: E402
+from mavito_common.models.user_xp import UserXP, XPSource  # noqa: E402
+
+DATASET = os.path.join(
+    os.path.dirname(__file__),
+    "../Mock_Data/multilingual_statistical_terminology_clean.json",
+)
+# Same keys and language names as the services' ingest_data.py.
+LANGUAGE_KEYS = {
+    "eng term": "English",
+    "afr term": "Afrikaans",
+    "nde term": "isiNdebele",
+    "xho term": "isiXhosa",
+    "zul term": "isiZulu",
+    "nso term": "Sepedi",
+    "sot term": "Sesotho",
+    "tsn term": "Setswana",
+    "ssw term": "siSwati",
+    "ven term": "Tshivenda",
+    "tso term": "Xitsonga",
+}
+USER_EMAIL = "bench-{seed}-{index}@example.com"
+PASSWORD = "benchmark"
+STATUS_WEIGHTS = {
+    TermStatus.PENDING_VERIFICATION: 2,
+    TermStatus.CROWD_VERIFIED: 2,
+    TermStatus.LINGUIST_VERIFIED: 2,
+    TermStatus.ADMIN_APPROVED: 4,
+}
+ROLE_WEIGHTS = {UserRole.contributor: 90, UserRole.linguist: 9, UserRole.admin: 1}
+XP_AMOUNTS = {
+    XPSource.COMMENT: 10,
+    XPSource.TERM_UPVOTE: 5,
+    XPSource.UPVOTE_RECEIVED: 5,
+    XPSource.LOGIN_STREAK: 5,
+}
+# Enum columns store member names (the models set no values_callable).
+STATUS_NAMES = [status.name for status in STATUS_WEIGHTS]
+ROLE_NAMES = [role.name for role in ROLE_WEIGHTS]
+HISTORY_DAYS = 120
+# CommentCreate.content accepts at most this many characters.
+COMMENT_MAX_LENGTH = 1000
+
+Row = Tuple
+Tables = Dict[str, List[Row]]
+
+COLUMNS = {
+    User.__tablename__: (
+        "id",
+        "first_name",
+        "last_name",
+        "email",
+        "password_hash",
+        "role",
+        "created_at",
+        "is_verified",
+        "account_locked",
+        "is_active",
+        "failed_login_attempts",
+    ),
+    Term.__tablename__: (
+        "id",
+        "term",
+        "definition",
+        "language",
+        "domain",
+        "status",
+        "translation_map",
+        "owner_id",
+        "created_at",
+        "upvotes",
+        "downvotes",
+    ),
+    term_translations.name: ("term_id", "translation_id"),
+    TermVote.__tablename__: ("id", "term_id", "user_id", "vote"),
+    Comment.__tablename__: (
+        "id",
+        "user_id",
+        "term_id",
+        "parent_id",
+        "content",
+        "date_posted",
+        "tombstone",
+        "reply_count",
+        "upvotes",
+        "downvotes",
+    ),
+    CommentVote.__tablename__: ("id", "comment_id", "user_id", "vote"),
+    UserXP.__tablename__: (
+        "id",
+        "user_id",
+        "xp_amount",
+        "xp_source",
+        "source_reference_id",
+        "description",
+        "created_at",
+    ),
+    UserStats.__tablename__: (
+        "user_id",
+        "total_xp",
+        "comments",
+        "term_upvotes_received",
+        "terms_added",
+        "terms_verified",
+        "feedback_submissions",
+        "login_streak",
+        "longest_login_streak",
+        "last_login_date",
+    ),
+    UserLearningProgress.__tablename__: ("user_id", "term_id", "learned_at"),
+}
+
+
+def load_dataset() -> Tuple[Dict[str, List[str]], List[str], List[str]]:
+    """Per-language word lists, definitions and categories from Mock_Data."""
+    with open(DATASET, encoding="utf-8") as f:
+        entries = [
+            {key.strip(): value for key, value in entry.items()}
+            for entry in json.load(f)
+        ]
+    words: Dict[str, List[str]] = {}
+    for key, language in LANGUAGE_KEYS.items():
+        vocabulary = {
+            word.strip("()[],;:.\"'")
+            for entry in entries
+            for word in (entry.get(key) or "").split()
+        }
+        words[language] = sorted(word for word in vocabulary if len(word) > 1)
+    definitions = sorted(
+        {
+            entry["eng definition"].strip()
+            for entry in entries
+            if entry.get("eng definition")
+        }
+    )
+    categories = sorted(
+        {
+            " ".join(entry["category"].replace("/", " and ").split())
+            for entry in entries
+            if entry.get("category")
+        }
+    )
+    return words, definitions, categories
+
+
+class CorpusGenerator:
+    """
+    Builds rows one batch of concepts at a time. All randomness comes from
+    ``seed``, so the same arguments always produce the same corpus.
+    """
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.rng = random.Random(args.seed)
+        self.args = args
+        self.words, self.definitions, base_categories = load_dataset()
+        concepts = max(1, args.terms // len(LANGUAGE_KEYS))
+        # Keep categories about as large as the real ones, whatever the
+        # corpus size, so category listings stay representative.
+        count = max(len(base_categories), args.terms // max(1, args.category_size))
+        self.categories = [
+            base_categories[i % len(base_categories)]
+            + ("" if i < len(base_categories) else f" {i // len(base_categories) + 1}")
+            for i in range(count)
+        ]
+        self.concepts = concepts
+        self.now = datetime.now(timezone.utc)
+        self.user_ids: List[uuid.UUID] = []
+        # Per user: total XP and comment count, and the days with login XP.
+        self.xp_totals: Dict[uuid.UUID, List[int]] = {}
+        self.login_days: Dict[uuid.UUID, Set[date]] = {}
+
+    def new_id(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def moment(self) -> datetime:
+        return self.now - timedelta(seconds=self.rng.uniform(0, HISTORY_DAYS * 86400))
+
+    def popularity(self, cap: int, alpha: float) -> int:
+        """
+        A heavy-tailed count: most get none, a few get very many. Lower
+        ``alpha`` means a longer tail.
+        """
+        return min(cap, int(self.rng.paretovariate(alpha)) - 1)
+
+    def users(self) -> Tables:
+        password_hash = get_password_hash(PASSWORD)
+        rows = []
+        xp = []
+        for index in range(self.args.users):
+            user_id = self.new_id()
+            self.user_ids.append(user_id)
+            role = self.rng.choices(ROLE_NAMES, weights=list(ROLE_WEIGHTS.values()))[0]
+            rows.append(
+                (
+                    user_id,
+                    f"Bench{index}",
+                    "User",
+                    USER_EMAIL.format(seed=self.args.seed, index=index),
+                    password_hash,
+                    role,
+                    self.now - timedelta(days=HISTORY_DAYS),
+                    True,
+                    False,
+                    True,
+                    0,
+                )
+            )
+            for _ in range(self.rng.randint(0, 30)):
+                xp.append(self.xp(user_id, XPSource.LOGIN_STREAK, None, "Daily login"))
+        return {User.__tablename__: rows, UserXP.__tablename__: xp}
+
+    def xp(self, user_id, source: XPSource, reference, description: str) -> Row:
+        created = self.moment()
+        totals = self.xp_totals.setdefault(user_id, [0, 0])
+        totals[0] += XP_AMOUNTS[source]
+        totals[1] += source is XPSource.COMMENT
+        if source is XPSource.LOGIN_STREAK:
+            self.login_days.setdefault(user_id, set()).add(created.date())
+        return (
+            self.new_id(),
+            user_id,
+            XP_AMOUNTS[source],
+            source.name,
+            reference,
+            description,
+            created,
+        )
+
+    def user_stats(self) -> Tables:
+        """UserStats rows for all the XP generated so far; call it last."""
+        rows = []
+        for user_id, (total_xp, comments) in self.xp_totals.items():
+            streak = longest = 0
+            last_day = None
+            for day in sorted(self.login_days.get(user_id, ())):
+                consecutive = last_day == day - timedelta(days=1)
+                streak = streak + 1 if consecutive else 1
+                longest = max(longest, streak)
+                last_day = day
+            rows.append(
+                (user_id, total_xp, comments, 0, 0, 0, 0, streak, longest, last_day)
+            )
+        return {UserStats.__tablename__: rows}
+
+    def term_text(self, language: str) -> str:
+        words = self.rng.choices(self.words[language], k=self.rng.choice((1, 2, 2, 3)))
+        return " ".join(words)[:255].capitalize()
+
+    def batch(self, concepts: int) -> Tables:
+        tables: Tables = {name: [] for name in COLUMNS}
+        for _ in range(concepts):
+            definition = self.rng.choice(self.definitions)
+            domain = self.rng.choice(self.categories)
+            owner = self.rng.choice(self.user_ids)
+            created = self.moment()
+            terms = [
+                (self.new_id(), self.term_text(language), language)
+                for language in LANGUAGE_KEYS.values()
+            ]
+            for term_id, text, language in terms:
+                translations = [other for other in terms if other[0] != term_id]
+                translation_map = {
+                    other_language: {"id": str(other_id), "term": other_text}
+                    for other_id, other_text, other_language in translations
+                }
+                row = (
+                    term_id,
+                    text,
+                    definition,
+                    language,
+                    domain,
+                    self.rng.choices(
+                        STATUS_NAMES, weights=list(STATUS_WEIGHTS.values())
+                    )[0],
+                    json.dumps(translation_map, ensure_ascii=False),
+                    owner,
+                    created,
+                )
+                tables[term_translations.name].extend(
+                    (term_id, other[0]) for other in translations
+                )
+                upvotes, downvotes = self.engagement(tables, term_id)
+                tables[Term.__tablename__].append((*row, upvotes, downvotes))
+        return tables
+
+    def engagement(self, tables: Tables, term_id: uuid.UUID) -> List[int]:
+        """
+        Votes, comments, XP and learning progress for one term; returns the
+        term's up- and downvote totals.
+        """
+        users = self.user_ids
+        totals = [0, 0]
+        for voter in self.rng.sample(users, self.popularity(len(users), 1.3)):
+            vote = "upvote" if self.rng.random() < 0.8 else "downvote"
+            tables[TermVote.__tablename__].append((self.new_id(), term_id, voter, vote))
+            totals[0 if vote == "upvote" else 1] += 1
+            if vote == "upvote":
+                tables[UserXP.__tablename__].append(
+                    self.xp(voter, XPSource.TERM_UPVOTE, term_id, "Upvoted a term")
+                )
+
+        comments: List[list] = []
+        for _ in range(self.popularity(self.args.max_comments, 2.0)):
+            comment_id, author = self.new_id(), self.rng.choice(users)
+            # Roughly a third of comments reply to an earlier one.
+            parent = (
+                self.rng.choice(comments)
+                if comments and self.rng.random() < 0.35
+                else None
+            )
+            posted = (
+                parent[5] + (self.now - parent[5]) * self.rng.random()
+                if parent
+                else self.moment()
+            )
+            tombstone = self.rng.random() < 0.02
+            comments.append(
+                [
+                    comment_id,
+                    author,
+                    term_id,
+                    parent[0] if parent else None,
+                    self.rng.choice(self.definitions)[:COMMENT_MAX_LENGTH],
+                    posted,
+                    tombstone,
+                    0,  # reply_count
+                    0,  # upvotes
+                    0,  # downvotes
+                ]
+            )
+            if parent and not tombstone:
+                parent[7] += 1
+            tables[UserXP.__tablename__].append(
+                self.xp(author, XPSource.COMMENT, comment_id, "Posted a comment")
+            )
+            for voter in self.rng.sample(users, self.popularity(len(users) // 10, 1.5)):
+                vote = "upvote" if self.rng.random() < 0.85 else "downvote"
+                tables[CommentVote.__tablename__].append(
+                    (self.new_id(), comment_id, voter, vote)
+                )
+                comments[-1][8 if vote == "upvote" else 9] += 1
+        tables[Comment.__tablename__].extend(map(tuple, comments))
+
+        if self.rng.random() < self.args.learned_fraction:
+            for learner in self.rng.sample(
+                users, min(len(users), 1 + self.popularity(20, 1.5))
+            ):
+                tables[UserLearningProgress.__tablename__].append(
+                    (learner, term_id, self.moment())
+                )
+        return totals
+
+
+def database_urls(name: str) -> Tuple[str, str]:
+    """asyncpg DSNs for the server's ``postgres`` database and for ``name``."""
+    url = make_url(str(settings.SQLALCHEMY_DATABASE_URL)).set(drivername="postgresql")
+    return (
+        url.set(database="postgres").render_as_string(hide_password=False),
+        url.set(database=name).render_as_string(hide_password=False),
+    )
+
+
+def sqlalchemy_url(dsn: str) -> str:
+    return dsn.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+async def prepare_database(name: str, fresh: bool) -> None:
+    admin_dsn, dsn = database_urls(name)
+    admin = await asyncpg.connect(admin_dsn)
+    try:
+        if fresh:
+            await admin.execute(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)')
+        exists = await admin.fetchval(
+            "SELECT 1 FROM pg_database WHERE datname = $1", name
+        )
+        if not exists:
+            await admin.execute(f'CREATE DATABASE "{name}"')
+    finally:
+        await admin.close()
+
+    # Register every model so create_all builds the whole schema.
+    for module in pkgutil.iter_modules(mavito_common.models.__path__):
+        importlib.import_module(f"mavito_common.models.{module.name}")
+    engine = create_async_engine(sqlalchemy_url(dsn))
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        await engine.dispose()
+
+
+async def copy_tables(conn: asyncpg.Connection, tables: Tables) -> Dict[str, int]:
+    # Parents before children, in COLUMNS order, so foreign keys hold.
+    for name, columns in COLUMNS.items():
+        rows = tables.get(name)
+        if rows:
+            await conn.copy_records_to_table(name, records=rows, columns=columns)
+    return {name: len(rows) for name, rows in tables.items()}
+
+
+async def load(args: argparse.Namespace) -> None:
+    name = args.database or f"{settings.DB_NAME}_bench"
+    await prepare_database(name, args.fresh)
+    generator = CorpusGenerator(args)
+    _admin_dsn, dsn = database_urls(name)
+    conn = await asyncpg.connect(dsn)
+    totals: Dict[str, int] = dict.fromkeys(COLUMNS, 0)
+    start = time.perf_counter()
+    try:
+        async with conn.transaction():
+            totals.update(await copy_tables(conn, generator.users()))
+        done = 0
+        while done < generator.concepts:
+            size = min(args.batch, generator.concepts - done)
+            async with conn.transaction():
+                counts = await copy_tables(conn, generator.batch(size))
+            for table, count in counts.items():
+                totals[table] += count
+            done += size
+            print(
+                f"{done * len(LANGUAGE_KEYS):>10} terms"
+                f"  {time.perf_counter() - start:7.1f} s",
+                flush=True,
+            )
+        async with conn.transaction():
+            totals.update(await copy_tables(conn, generator.user_stats()))
+        await conn.execute("ANALYZE")
+    finally:
+        await conn.close()
+
+    # Glossary ETags derive from this version; cached bodies must go.
+    engine = create_async_engine(sqlalchemy_url(dsn))
+    try:
+        async with engine.begin() as sa_conn:
+            await sa_conn.execute(bump_data_version(TERMS_DATA_VERSION))
+    finally:
+        await engine.dispose()
+    print(f"\nLoaded into {name} in {time.perf_counter() - start:.1f} s:")
+    for table, count in totals.items():
+        print(f"  {table:<26}{count:>12}")
+
+
+def parse_args(argv: Sequence[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--terms", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--database", help="target database (default <DB_NAME>_bench)")
+    parser.add_argument(
+        "--fresh", action="store_true", help="drop and recreate the database first"
+    )
+    parser.add_argument(
+        "--category-size", type=int, default=400, help="terms per category, roughly"
+    )
+    parser.add_argument("--max-comments", type=int, default=200)
+    parser.add_argument(
+        "--learned-fraction",
+        type=float,
+        default=0.05,
+        help="share of terms some users have learned",
+    )
+    parser.add_argument("--batch", type=int, default=2_000, help="concepts per COPY")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(load(parse_args()))
@@ -0,0 +1,469 @@
+# benchmarks/load.py
+"""
+Drives the services' hot endpoints with concurrent requests and reports
+latency percentiles, throughput and SQL statements per request. Load a corpus
+with corpus.py first, then start the services against the same database
+(DB_NAME=<DB_NAME>_bench) and SECRET_KEY, and run from backend/ with the same
+DB_* settings exported:
+
+    python benchmarks/load.py [scenario ...] [--duration 15] [--concurrency 16]
+        [--service search=http://localhost:8002] [--json results.json]
+        [--baseline previous.json --max-regression 0.2]
+
+Scenarios run one after another, so each gets the services to itself.
+Request parameters are sampled from the corpus: popular and random term ids,
+categories, search prefixes and benchmark users, whose access tokens are
+minted locally. Statements per request come from the difference between
+/metrics before and after a scenario; they are left blank for services that
+do not expose it. ``vote_storm`` writes: benchmark users toggle votes on the
+most voted term, and afterwards its stored totals must still match its vote
+rows. With ``--baseline``, the exit status is 1 if any scenario
+got slower, lost throughput or ran more statements per request than allowed.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../mavito-common-lib"))
+)
+
+import httpx  # noqa: E402
+from sqlalchemy import select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from corpus import database_urls, sqlalchemy_url  # noqa: E402
+from mavito_common.core.auth import token_claims  # noqa: E402
+from mavito_common.core.config import settings  # noqa: E402
+from mavito_common.core.security import create_access_token  # noqa: E402
+from mavito_common.models.user import User  # noqa: E402
+
+# Host ports from docker-compose.yml.
+SERVICES = {
+    "search": "http://localhost:8002",
+    "glossary": "http://localhost:8006",
+    "vote": "http://localhost:8005",
+    "comment": "http://localhost:8008",
+    "learning-path": "http://localhost:8012",
+    "gamification": "http://localhost:8013",
+}
+
+
+@dataclass
+class Sample:
+    """Request parameters drawn from the corpus."""
+
+    term_ids: List[str]
+    categories: List[str]
+    prefixes: List[str]
+    # (user id, access token)
+    users: List[Tuple[str, str]]
+    hot_term_id: str
+
+
+@dataclass
+class Scenario:
+    service: str
+    # The route template, as the services label it in /metrics.
+    route: str
+    # Returns the path to request and the token to send, if any.
+    request: Callable[[Sample, random.Random], Tuple[str, Optional[str]]]
+    # JSON body to POST; requests are GETs without one.
+    payload: Optional[Callable[[Sample, random.Random], Dict[str, Any]]] = None
+    # Run against the corpus afterwards; returns a problem, if any.
+    check: Optional[Callable[[str, Sample], Awaitable[Optional[str]]]] = None
+
+
+def _anonymous(path: Callable[[Sample, random.Random], str]) -> Callable:
+    return lambda sample, rng: (path(sample, rng), None)
+
+
+def _as_user(path: Callable[[str], str]) -> Callable:
+    def request(sample: Sample, rng: random.Random) -> Tuple[str, Optional[str]]:
+        user_id, token = rng.choice(sample.users)
+        return path(user_id), token
+
+    return request
+
+
+async def vote_totals_drift(database: str, sample: Sample) -> Optional[str]:
+    """
+    Compares the hot term's stored vote totals with its vote rows, giving a
+    write-behind vote service a few seconds to flush.
+    """
+    _admin_dsn, dsn = database_urls(database)
+    engine = create_async_engine(sqlalchemy_url(dsn))
+    try:
+        for _attempt in range(10):
+            async with engine.connect() as conn:
+                row = (
+                    await conn.execute(
+                        text(
+                            "SELECT t.upvotes, t.downvotes, "
+                            "count(v.id) FILTER (WHERE v.vote = 'upvote'), "
+                            "count(v.id) FILTER (WHERE v.vote = 'downvote') "
+                            "FROM terms t LEFT JOIN termvotes v ON v.term_id = t.id "
+                            "WHERE t.id = :term_id GROUP BY t.id"
+                        ),
+                        {"term_id": sample.hot_term_id},
+                    )
+                ).one()
+            stored, counted = tuple(row[:2]), tuple(row[2:])
+            if stored == counted:
+                return None
+            await asyncio.sleep(0.5)
+    finally:
+        await engine.dispose()
+    return f"stored totals {stored} but {counted} vote rows"
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "search": Scenario(
+        "search",
+        "/api/v1/search",
+        _anonymous(
+            lambda s, rng: f"/api/v1/search?query={quote(rng.choice(s.prefixes))}"
+        ),
+    ),
+    "suggest": Scenario(
+        "search",
+        "/api/v1/suggest",
+        _anonymous(
+            lambda s, rng: f"/api/v1/suggest?query={quote(rng.choice(s.prefixes))}"
+        ),
+    ),
+    "glossary_category": Scenario(
+        "glossary",
+        "/api/v1/glossary/categories/{category_name}/terms",
+        _anonymous(
+            lambda s, rng: "/api/v1/glossary/categories/"
+            f"{quote(rng.choice(s.categories), safe='')}/terms"
+        ),
+    ),
+    "comments_by_term": Scenario(
+        "comment",
+        "/api/v1/comments/by_term/{term_id}",
+        lambda s, rng: (
+            f"/api/v1/comments/by_term/{rng.choice(s.term_ids)}",
+            rng.choice(s.users)[1],
+        ),
+    ),
+    "vote_storm": Scenario(
+        "vote",
+        "/api/v1/votes/terms",
+        lambda s, rng: ("/api/v1/votes/terms", rng.choice(s.users)[1]),
+        payload=lambda s, rng: {
+            "term_id": s.hot_term_id,
+            "vote": "upvote" if rng.random() < 0.8 else "downvote",
+        },
+        check=vote_totals_drift,
+    ),
+    "achievement_progress": Scenario(
+        "gamification",
+        "/api/v1/achievements/user/{user_id}/progress",
+        _as_user(lambda user_id: f"/api/v1/achievements/user/{user_id}/progress"),
+    ),
+    "learning_dashboard": Scenario(
+        "learning-path",
+        "/api/v1/learning/dashboard",
+        _as_user(lambda user_id: "/api/v1/learning/dashboard"),
+    ),
+}
+
+
+@dataclass
+class Result:
+    requests: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    queries_per_request: Optional[float] = None
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rps": self.requests / self.seconds if self.seconds else 0.0,
+            "p50_ms": percentile(self.latencies, 50) * 1000,
+            "p99_ms": percentile(self.latencies, 99) * 1000,
+            "queries_per_request": self.queries_per_request,
+        }
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; 0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+SAMPLE_LINE = re.compile(r"^([a-zA-Z_:][\w:]*)(?:\{(.*)\})? (\S+)$")
+LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+Metrics = Dict[Tuple[str, frozenset], float]
+
+
+def parse_metrics(exposition: str) -> Metrics:
+    """Samples of a Prometheus text exposition, keyed by name and labels."""
+    samples: Metrics = {}
+    for line in exposition.splitlines():
+        match = SAMPLE_LINE.match(line)
+        if match:
+            name, labels, value = match.groups()
+            samples[(name, frozenset(LABEL.findall(labels or "")))] = float(value)
+    return samples
+
+
+def queries_per_request(before: Metrics, after: Metrics, route: str) -> Optional[float]:
+    labels = frozenset({("route", route)})
+    totals = []
+    for suffix in ("_sum", "_count"):
+        key = (f"http_request_db_queries{suffix}", labels)
+        if key not in after:
+            return None
+        totals.append(after[key] - before.get(key, 0.0))
+    queries, requests = totals
+    return queries / requests if requests else None
+
+
+async def scrape(client: httpx.AsyncClient) -> Optional[Metrics]:
+    try:
+        response = await client.get("/metrics")
+    except httpx.HTTPError:
+        return None
+    return parse_metrics(response.text) if response.status_code == 200 else None
+
+
+async def sample_corpus(database: str, users: int, seed: int) -> Sample:
+    _admin_dsn, dsn = database_urls(database)
+    engine = create_async_engine(sqlalchemy_url(dsn))
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            await db.execute(text("SELECT setseed(:seed)"), {"seed": seed / 2**31})
+            # Half the term ids are discussed terms, the rest are random.
+            discussed = (
+                await db.scalars(
+                    text(
+                        "SELECT term_id FROM comments GROUP BY term_id "
+                        "ORDER BY random() LIMIT 500"
+                    )
+                )
+            ).all()
+            rows = await db.execute(
+                text("SELECT id, term FROM terms ORDER BY random() LIMIT 500")
+            )
+            random_terms = rows.all()
+            hot_term_id = await db.scalar(
+                text(
+                    "SELECT term_id FROM termvotes GROUP BY term_id "
+                    "ORDER BY count(*) DESC LIMIT 1"
+                )
+            )
+            categories = (
+                await db.scalars(text("SELECT DISTINCT domain FROM terms"))
+            ).all()
+            bench_users = await db.scalars(
+                select(User)
+                .where(User.email.like("bench-%"))
+                .order_by(User.email)
+                .limit(users)
+            )
+            tokens = [
+                (str(user.id), create_access_token(data=await token_claims(db, user)))
+                for user in bench_users.all()
+            ]
+    finally:
+        await engine.dispose()
+
+    rng = random.Random(seed)
+    prefixes = [term.lower()[: rng.randint(2, 6)] for _id, term in random_terms if term]
+    sample = Sample(
+        term_ids=[str(term_id) for term_id in discussed]
+        + [str(term_id) for term_id, _term in random_terms],
+        categories=list(categories),
+        prefixes=prefixes,
+        users=tokens,
+        hot_term_id=str(hot_term_id),
+    )
+    if not (sample.term_ids and sample.categories and sample.users and hot_term_id):
+        raise SystemExit(f"{database} holds no benchmark corpus; run corpus.py first")
+    return sample
+
+
+async def run_scenario(
+    scenario: Scenario, base_url: str, sample: Sample, args: argparse.Namespace
+) -> Result:
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=args.timeout
+    ) as client:
+
+        async def send(result: Optional[Result]) -> None:
+            path, token = scenario.request(sample, rng)
+            headers = {"Authorization": f"Bearer {token}"} if token else {}
+            start = time.perf_counter()
+            try:
+                if scenario.payload is None:
+                    response = await client.get(path, headers=headers)
+                else:
+                    response = await client.post(
+                        path, headers=headers, json=scenario.payload(sample, rng)
+                    )
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            if result is not None:
+                result.latencies.append(time.perf_counter() - start)
+                result.requests += 1
+                result.errors += failed
+
+        async def worker(deadline: float, result: Optional[Result]) -> None:
+            while time.perf_counter() < deadline:
+                await send(result)
+
+        # Warm pools and caches before anything is measured.
+        warmup = time.perf_counter() + args.warmup
+        await asyncio.gather(*(worker(warmup, None) for _ in range(args.concurrency)))
+
+        before = await scrape(client)
+        result = Result()
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(
+            *(worker(deadline, result) for _ in range(args.concurrency))
+        )
+        result.seconds = time.perf_counter() - start
+        after = await scrape(client)
+        if before is not None and after is not None:
+            result.queries_per_request = queries_per_request(
+                before, after, scenario.route
+            )
+    return result
+
+
+def regressions(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """Human-readable regressions of ``results`` against ``baseline``."""
+    found = []
+    for name, now in results.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        if now["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            found.append(
+                f"{name}: p99 {before['p99_ms']:.1f} -> {now['p99_ms']:.1f} ms"
+            )
+        if now["rps"] < before["rps"] * (1 - tolerance):
+            found.append(f"{name}: {before['rps']:.0f} -> {now['rps']:.0f} req/s")
+        queries, allowed = now["queries_per_request"], before["queries_per_request"]
+        if queries is not None and allowed is not None and queries > allowed + 0.5:
+            found.append(
+                f"{name}: {allowed:.1f} -> {queries:.1f} statements per request"
+            )
+    return found
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)} (default all)"
+    )
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds each")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds each")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--service",
+        action="append",
+        default=[],
+        metavar="NAME=URL",
+        help=f"override a base URL; services: {', '.join(SERVICES)}",
+    )
+    parser.add_argument("--database", help="corpus database (default <DB_NAME>_bench)")
+    parser.add_argument("--users", type=int, default=50, help="users to log in as")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="allowed relative loss in p99 latency and throughput",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace) -> int:
+    services = dict(SERVICES)
+    for override in args.service:
+        name, _, url = override.partition("=")
+        if name not in services or not url:
+            raise SystemExit(
+                f"--service expects NAME=URL, with NAME in {list(services)}"
+            )
+        services[name] = url
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(
+            f"unknown scenarios {sorted(unknown)}; pick from {list(SCENARIOS)}"
+        )
+    database = args.database or f"{settings.DB_NAME}_bench"
+    sample = await sample_corpus(database, args.users, args.seed)
+    print(
+        f"{'scenario':<22}{'requests':>10}{'errors':>8}{'req/s':>9}"
+        f"{'p50 ms':>9}{'p99 ms':>9}{'SQL/req':>9}"
+    )
+    results: Dict[str, Dict[str, Any]] = {}
+    problems: List[str] = []
+    for name in args.scenarios or SCENARIOS:
+        scenario = SCENARIOS[name]
+        summary = (
+            await run_scenario(scenario, services[scenario.service], sample, args)
+        ).summary()
+        results[name] = summary
+        queries = summary["queries_per_request"]
+        print(
+            f"{name:<22}{summary['requests']:>10}{summary['errors']:>8}"
+            f"{summary['rps']:>9.1f}{summary['p50_ms']:>9.1f}{summary['p99_ms']:>9.1f}"
+            f"{'-' if queries is None else f'{queries:.1f}':>9}",
+            flush=True,
+        )
+        if scenario.check is not None:
+            problem = await scenario.check(database, sample)
+            if problem:
+                problems.append(f"{name}: {problem}")
+
+    for line in problems:
+        print(f"CHECK FAILED {line}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(results, json.load(f), args.max_regression)
+        for line in found:
+            print(f"REGRESSION {line}")
+        return 1 if found or problems else 0
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -1,9 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 from typing import List, Optional
 from pydantic import BaseModel
 from mavito_common.db.session import get_db
+from mavito_common.http.pagination import (
+    InvalidCursorError,
+    Position,
+    decode_cursor,
+    encode_cursor,
+)
+from mavito_common.http.responses import EncodedJSONResponse, JSONSerializer
 from mavito_common.models.user import (
     User as UserModel,
 )
@@ -11,10 +18,19 @@ from app.api import deps
 
 
 from app.crud.crud_comment import crud_comment
-from mavito_common.schemas.comment import CommentCreate, CommentResponse, CommentUpdate
+from mavito_common.schemas.comment import (
+    CommentCreate,
+    CommentPage,
+    CommentResponse,
+    CommentUpdate,
+)
 
 router = APIRouter(redirect_slashes=False)
 
+# Comment trees are already validated models; encode them without a second pass.
+comment_list = JSONSerializer(List[CommentResponse])
+comment_page = JSONSerializer(CommentPage)
+
 
 class CommentCreateResponse(BaseModel):
     newComment: CommentResponse
@@ -57,12 +73,14 @@ async def get_comment(
     - Includes vote counts and the current user's vote status.
     - Returns 404 if the comment is not found or is soft-deleted.
     """
-    comment = await crud_comment.get_comment(db, comment_id=comment_id)
-    if not comment or comment.tombstone:
+    comment = await crud_comment.get_comment_thread(
+        db, comment_id=comment_id, current_user_id=current_user.id
+    )
+    if comment is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
         )
-    return await crud_comment._build_comment_response(db, comment, current_user.id)
+    return comment
 
 
 @router.get("/by_term/{term_id}", response_model=List[CommentResponse])
@@ -79,9 +97,83 @@ async def get_comments_by_term(
     """
 
     user_id_for_votes = current_user.id if current_user else None
-    return await crud_comment.get_comments_for_term(
+    comments = await crud_comment.get_comments_for_term(
         db, term_id=term_id, current_user_id=user_id_for_votes
     )
+    return comment_list.response(comments)
+
+
+def _position(cursor: Optional[str]) -> Optional[Position]:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def _page_response(
+    items: List[CommentResponse], after: Optional[Position]
+) -> EncodedJSONResponse:
+    return comment_page.response(
+        CommentPage(items=items, next_cursor=encode_cursor(after) if after else None)
+    )
+
+
+@router.get("/by_term/{term_id}/threads", response_model=CommentPage)
+async def get_comment_threads_by_term(
+    *,
+    db: AsyncSession = Depends(get_db),
+    term_id: uuid.UUID,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the last page"),
+    reply_limit: int = Query(3, ge=0, le=20, description="Replies to include each"),
+    current_user: Optional[UserModel] = Depends(deps.get_current_active_user)
+):
+    """
+    Retrieve one page of a term's top-level comments, most recent first.
+    - Each comment carries its first replies, its reply_count and, when only
+      some replies are included, a replies_cursor for GET /{id}/replies.
+    - Pass next_cursor back as cursor to get the following page.
+    """
+    user_id_for_votes = current_user.id if current_user else None
+    items, after = await crud_comment.get_thread_page(
+        db,
+        term_id=term_id,
+        limit=limit,
+        after=_position(cursor),
+        reply_limit=reply_limit,
+        current_user_id=user_id_for_votes,
+    )
+    return _page_response(items, after)
+
+
+@router.get("/{comment_id}/replies", response_model=CommentPage)
+async def get_comment_replies(
+    *,
+    db: AsyncSession = Depends(get_db),
+    comment_id: uuid.UUID,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="replies_cursor or next_cursor"),
+    reply_limit: int = Query(3, ge=0, le=20, description="Replies to include each"),
+    current_user: Optional[UserModel] = Depends(deps.get_current_active_user)
+):
+    """
+    Retrieve one page of a comment's direct replies, oldest first, shaped
+    like the pages of GET /by_term/{term_id}/threads.
+    """
+    user_id_for_votes = current_user.id if current_user else None
+    items, after = await crud_comment.get_reply_page(
+        db,
+        comment_id=comment_id,
+        limit=limit,
+        after=_position(cursor),
+        reply_limit=reply_limit,
+        current_user_id=user_id_for_votes,
+    )
+    return _page_response(items, after)
 
 
 @router.put("/{comment_id}", response_model=CommentResponse)
@@ -107,11 +199,9 @@ async def update_comment(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this comment",
         )
-    updated_comment = await crud_comment.update_comment(
-        db, db_obj=comment, obj_in=comment_in
-    )
-    return await crud_comment._build_comment_response(
-        db, updated_comment, current_user.id
+    await crud_comment.update_comment(db, db_obj=comment, obj_in=comment_in)
+    return await crud_comment.get_comment_thread(
+        db, comment_id=comment_id, current_user_id=current_user.id
     )
 
 
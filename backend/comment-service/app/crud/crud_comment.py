@@ -1,10 +1,25 @@
 import uuid
-from typing import List, Optional, Dict, Any  # noqa: F401
+from typing import List, Optional, Dict, Any, Tuple  # noqa: F401
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, or_  # noqa: F401
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (  # noqa: F401
+    Select,
+    and_,
+    case,
+    desc,
+    func,
+    null,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import aliased, raiseload, selectinload
 
+from mavito_common.core.config import settings
+from mavito_common.http.pagination import Position, encode_cursor
+from mavito_common.http.term_stream import publish_term_event
+from mavito_common.jobs.queue import get_job_queue
 from mavito_common.models.comment import Comment
 from mavito_common.models.comment_vote import CommentVote, VoteType  # noqa: F401
 from mavito_common.models.user import User as UserModel  # noqa: F401
@@ -15,25 +30,54 @@ from mavito_common.schemas.comment import (
     CommentResponse,
     UserBase,
 )
-from profanity_check import predict
+
+from app.services.jobs import MODERATE_COMMENT
+from app.services.moderation import profanity_screen
+
+
+def moderation_deferred() -> bool:
+    return settings.COMMENT_MODERATION_MODE == "deferred"
+
+
+async def queue_moderation(db: AsyncSession, comment_id: uuid.UUID) -> None:
+    """Screen the comment after the caller's commit publishes it."""
+    await get_job_queue().enqueue(db, MODERATE_COMMENT, {"comment_id": str(comment_id)})
+
+
+async def announce(db: AsyncSession, comment: Comment, action: str) -> None:
+    """Tell the term's live streams about the change once it commits."""
+    await publish_term_event(
+        db,
+        comment.term_id,
+        "comment",
+        comment_id=comment.id,
+        parent_id=comment.parent_id,
+        action=action,
+    )
 
 
 class CRUDComment:
     async def create_comment(
         self, db: AsyncSession, *, obj_in: CommentCreate, user_id: uuid.UUID
     ) -> Comment:
-        if predict([obj_in.content])[0]:
-            obj_in.content = "[CONTENT REMOVED DUE TO PROFANITY]"
+        if not moderation_deferred():
+            obj_in.content = await profanity_screen.screen(obj_in.content)
 
         db_obj = Comment(
+            id=uuid.uuid4(),
             term_id=obj_in.term_id,
             user_id=user_id,
             content=obj_in.content,
             parent_id=obj_in.parent_id,
         )
         db.add(db_obj)
+        if obj_in.parent_id is not None:
+            await db.execute(self._count_reply(obj_in.parent_id, 1))
+        if moderation_deferred():
+            await queue_moderation(db, db_obj.id)
+        await announce(db, db_obj, "created")
         await db.commit()
-        await db.refresh(db_obj, attribute_names=["user", "votes"])
+        await db.refresh(db_obj, attribute_names=["user"])
 
         fully_loaded_comment = await self.get_comment(db, comment_id=db_obj.id)
         if fully_loaded_comment:
@@ -44,102 +88,265 @@ class CRUDComment:
     async def get_comment(
         self, db: AsyncSession, *, comment_id: uuid.UUID
     ) -> Optional[Comment]:
+        """
+        The comment with its author. Replies are loaded one level deep only;
+        use get_comment_thread to render a discussion.
+        """
         stmt = (
             select(Comment)
             .where(Comment.id == comment_id, Comment.tombstone.is_(False))
-            .options(
-                selectinload(Comment.user),
-                selectinload(Comment.votes),
-                selectinload(Comment.replies).selectinload(Comment.user),
-                selectinload(Comment.replies).selectinload(Comment.votes),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.user),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.votes),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.user),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.votes),
-            )
+            .options(selectinload(Comment.user), selectinload(Comment.replies))
         )
         result = await db.execute(stmt)
         return result.scalars().first()
 
+    def _detailed(self, ids: Select, current_user_id: Optional[uuid.UUID]) -> Select:
+        """
+        Selects the comments whose ids ``ids`` yields, each with its author's
+        fields and the caller's own vote. Vote totals are columns of the
+        comment, so the cost does not grow with the votes cast.
+        """
+        if current_user_id is not None:
+            user_vote = (
+                select(CommentVote.vote)
+                .where(
+                    CommentVote.comment_id == Comment.id,
+                    CommentVote.user_id == current_user_id,
+                )
+                .limit(1)
+                .scalar_subquery()
+            )
+        else:
+            user_vote = null()
+
+        return (
+            select(
+                Comment,
+                UserModel.email,
+                UserModel.first_name,
+                UserModel.last_name,
+                UserModel.role,
+                UserModel.profile_pic_url,
+                user_vote.label("user_vote"),
+            )
+            .join(UserModel, UserModel.id == Comment.user_id)
+            .where(Comment.id.in_(ids))
+            .options(raiseload("*"))
+        )
+
+    async def _responses(
+        self, db: AsyncSession, stmt: Select
+    ) -> Dict[uuid.UUID, CommentResponse]:
+        """Runs a ``_detailed`` query; responses keep the query's order."""
+        result = await db.execute(stmt)
+        authors: Dict[uuid.UUID, UserBase] = {}
+        responses: Dict[uuid.UUID, CommentResponse] = {}
+        for comment, *author, user_vote in result.all():
+            if comment.user_id not in authors:
+                email, first_name, last_name, role, profile_pic_url = author
+                authors[comment.user_id] = UserBase(
+                    email=email,
+                    first_name=first_name,
+                    last_name=last_name,
+                    role=role,
+                    profile_pic_url=profile_pic_url,
+                )
+            responses[comment.id] = CommentResponse(
+                id=comment.id,
+                term_id=comment.term_id,
+                user_id=comment.user_id,
+                content=comment.content,
+                created_at=comment.date_posted,
+                updated_at=comment.date_posted,
+                parent_id=comment.parent_id,
+                is_deleted=comment.tombstone,
+                user=authors[comment.user_id],
+                upvotes=comment.upvotes,
+                downvotes=comment.downvotes,
+                user_vote=user_vote.value if user_vote else None,
+                replies=[],
+                reply_count=comment.reply_count,
+            )
+        return responses
+
+    async def _load_threads(
+        self,
+        db: AsyncSession,
+        roots: Select,
+        current_user_id: Optional[uuid.UUID],
+    ) -> List[CommentResponse]:
+        """
+        Loads every live comment under ``roots`` (a SELECT of comment ids),
+        however deep, in one query and assembles the trees in a single pass.
+        Replies under a deleted comment are left out along with it. Returns
+        the root comments, oldest first, with replies nested oldest first at
+        every level.
+        """
+        thread = select(Comment.id).where(
+            Comment.id.in_(roots), Comment.tombstone.is_(False)
+        )
+        thread = thread.cte("comment_thread", recursive=True)
+        reply = aliased(Comment)
+        thread = thread.union_all(
+            select(reply.id).where(
+                reply.parent_id == thread.c.id, reply.tombstone.is_(False)
+            )
+        )
+        responses = await self._responses(
+            db,
+            self._detailed(select(thread.c.id), current_user_id).order_by(
+                Comment.date_posted, Comment.id
+            ),
+        )
+
+        threads: List[CommentResponse] = []
+        for response in responses.values():
+            parent = responses.get(response.parent_id) if response.parent_id else None
+            if parent is not None:
+                parent.replies.append(response)
+            else:
+                threads.append(response)
+        return threads
+
     async def get_comments_for_term(
         self,
         db: AsyncSession,
         *,
         term_id: uuid.UUID,
-        current_user_id: Optional[uuid.UUID] = None
+        current_user_id: Optional[uuid.UUID] = None,
     ) -> List[CommentResponse]:
-        stmt = (
-            select(Comment)
-            .where(
-                Comment.term_id == term_id,
-                Comment.parent_id.is_(None),
-                Comment.tombstone.is_(False),
-            )
-            .options(
-                selectinload(Comment.user),
-                selectinload(Comment.votes),
-                selectinload(Comment.replies).selectinload(Comment.user),
-                selectinload(Comment.replies).selectinload(Comment.votes),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.user),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.votes),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.user),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.votes),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.user),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.votes),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.user),
-                selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.replies)
-                .selectinload(Comment.votes),
+        """Every thread on a term, newest first, in a single query."""
+        roots = select(Comment.id).where(
+            Comment.term_id == term_id, Comment.parent_id.is_(None)
+        )
+        threads = await self._load_threads(db, roots, current_user_id)
+        threads.reverse()
+        return threads
+
+    async def get_comment_thread(
+        self,
+        db: AsyncSession,
+        *,
+        comment_id: uuid.UUID,
+        current_user_id: Optional[uuid.UUID] = None,
+    ) -> Optional[CommentResponse]:
+        """A live comment with all of its replies, or None."""
+        roots = select(Comment.id).where(Comment.id == comment_id)
+        threads = await self._load_threads(db, roots, current_user_id)
+        return threads[0] if threads else None
+
+    async def _page(
+        self,
+        db: AsyncSession,
+        *,
+        where: Any,
+        newest_first: bool,
+        limit: int,
+        after: Optional[Position],
+        reply_limit: int,
+        current_user_id: Optional[uuid.UUID],
+    ) -> Tuple[List[CommentResponse], Optional[Position]]:
+        """
+        One keyset page of live comments matching ``where``, each with its
+        first ``reply_limit`` replies, in two queries. Returns the page and
+        the position to continue after, if there is more.
+        """
+        key = tuple_(Comment.date_posted, Comment.id)
+        order = (
+            (desc(Comment.date_posted), desc(Comment.id))
+            if newest_first
+            else (Comment.date_posted, Comment.id)
+        )
+        ids = select(Comment.id).where(where, Comment.tombstone.is_(False))
+        if after is not None:
+            ids = ids.where(
+                key < tuple_(*after) if newest_first else key > tuple_(*after)
             )
-            .order_by(desc(Comment.date_posted))
+        ids = ids.order_by(*order).limit(limit + 1)
+        page = list(
+            (
+                await self._responses(
+                    db, self._detailed(ids, current_user_id).order_by(*order)
+                )
+            ).values()
         )
-        result = await db.execute(stmt)
-        top_level_comments = result.scalars().unique().all()
+        more = len(page) > limit
+        page = page[:limit]
 
-        comment_responses: List[CommentResponse] = []
-        for comment in top_level_comments:
-            comment_data = await self._build_comment_response(
-                db, comment, current_user_id
+        parents = [comment.id for comment in page if comment.reply_count]
+        if reply_limit > 0 and parents:
+            ranked = (
+                select(
+                    Comment.id,
+                    func.row_number()
+                    .over(
+                        partition_by=Comment.parent_id,
+                        order_by=(Comment.date_posted, Comment.id),
+                    )
+                    .label("position"),
+                )
+                .where(Comment.parent_id.in_(parents), Comment.tombstone.is_(False))
+                .subquery()
             )
-            comment_responses.append(comment_data)
+            previews = await self._responses(
+                db,
+                self._detailed(
+                    select(ranked.c.id).where(ranked.c.position <= reply_limit),
+                    current_user_id,
+                ).order_by(Comment.date_posted, Comment.id),
+            )
+            by_id = {comment.id: comment for comment in page}
+            for reply in previews.values():
+                by_id[reply.parent_id].replies.append(reply)
+            for comment in page:
+                if comment.replies and comment.reply_count > len(comment.replies):
+                    last = comment.replies[-1]
+                    comment.replies_cursor = encode_cursor((last.created_at, last.id))
 
-        return comment_responses
+        last = page[-1] if more else None
+        return page, (last.created_at, last.id) if last else None
+
+    async def get_thread_page(
+        self,
+        db: AsyncSession,
+        *,
+        term_id: uuid.UUID,
+        limit: int,
+        after: Optional[Position] = None,
+        reply_limit: int = 3,
+        current_user_id: Optional[uuid.UUID] = None,
+    ) -> Tuple[List[CommentResponse], Optional[Position]]:
+        """A page of a term's top-level comments, newest first."""
+        return await self._page(
+            db,
+            where=and_(Comment.term_id == term_id, Comment.parent_id.is_(None)),
+            newest_first=True,
+            limit=limit,
+            after=after,
+            reply_limit=reply_limit,
+            current_user_id=current_user_id,
+        )
+
+    async def get_reply_page(
+        self,
+        db: AsyncSession,
+        *,
+        comment_id: uuid.UUID,
+        limit: int,
+        after: Optional[Position] = None,
+        reply_limit: int = 3,
+        current_user_id: Optional[uuid.UUID] = None,
+    ) -> Tuple[List[CommentResponse], Optional[Position]]:
+        """A page of a comment's direct replies, oldest first."""
+        return await self._page(
+            db,
+            where=Comment.parent_id == comment_id,
+            newest_first=False,
+            limit=limit,
+            after=after,
+            reply_limit=reply_limit,
+            current_user_id=current_user_id,
+        )
 
     async def _build_comment_response(
         self, db: AsyncSession, comment: Comment, current_user_id: Optional[uuid.UUID]
@@ -155,15 +362,17 @@ class CRUDComment:
         else:
             user_data = UserBase.model_validate(comment.user)
 
-        upvotes = sum(1 for vote in comment.votes if vote.vote == VoteType.upvote)
-        downvotes = sum(1 for vote in comment.votes if vote.vote == VoteType.downvote)
-
         user_vote_status: Optional[str] = None
         if current_user_id:
-            for vote in comment.votes:
-                if vote.user_id == current_user_id:
-                    user_vote_status = vote.vote.value
-                    break
+            user_vote = await db.scalar(
+                select(CommentVote.vote)
+                .where(
+                    CommentVote.comment_id == comment.id,
+                    CommentVote.user_id == current_user_id,
+                )
+                .limit(1)
+            )
+            user_vote_status = user_vote.value if user_vote else None
 
         replies_responses: List[CommentResponse] = []
 
@@ -185,10 +394,11 @@ class CRUDComment:
             parent_id=comment.parent_id,
             is_deleted=comment.tombstone,
             user=user_data,
-            upvotes=upvotes,
-            downvotes=downvotes,
+            upvotes=comment.upvotes,
+            downvotes=comment.downvotes,
             user_vote=user_vote_status,
             replies=replies_responses,
+            reply_count=comment.reply_count,
         )
 
     async def update_comment(
@@ -199,20 +409,37 @@ class CRUDComment:
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
 
-        if "content" in update_data and predict([update_data["content"]])[0]:
-            update_data["content"] = "[CONTENT REMOVED DUE TO PROFANITY]"
+        content_changed = "content" in update_data
+        if content_changed and not moderation_deferred():
+            update_data["content"] = await profanity_screen.screen(
+                update_data["content"]
+            )
 
         for field, value in update_data.items():
             if hasattr(db_obj, field):
                 setattr(db_obj, field, value)
 
         db.add(db_obj)
+        if content_changed and moderation_deferred():
+            await queue_moderation(db, db_obj.id)
+        await announce(db, db_obj, "updated")
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
 
+    def _count_reply(self, parent_id: uuid.UUID, delta: int) -> Any:
+        # Relative, so concurrent replies to one comment do not lose counts.
+        return (
+            update(Comment)
+            .where(Comment.id == parent_id)
+            .values(reply_count=Comment.reply_count + delta)
+        )
+
     async def delete_comment(self, db: AsyncSession, *, comment: Comment) -> Comment:
+        if not comment.tombstone and comment.parent_id is not None:
+            await db.execute(self._count_reply(comment.parent_id, -1))
         comment.tombstone = True
+        await announce(db, comment, "deleted")
         await db.commit()
         await db.refresh(comment)
         return comment
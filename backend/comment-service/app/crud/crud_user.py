@@ -6,7 +6,10 @@ from uuid import UUID
 
 from mavito_common.models.user import User as UserModel
 from mavito_common.schemas.user import UserCreate, UserUpdate
-from mavito_common.core.security import get_password_hash, verify_password
+from mavito_common.core.security import (
+    get_password_hash_async,
+    verify_password_async,
+)
 
 
 class CRUDUser:
@@ -44,7 +47,7 @@ class CRUDUser:
         - Hashes the plain password before storing.
         - Uses fields from UserCreate schema and matches UserModel.
         """
-        hashed_password = get_password_hash(obj_in.password)
+        hashed_password = await get_password_hash_async(obj_in.password)
 
         # Create a dictionary of the data for the UserModel
         # Exclude the plain password from the input schema
@@ -84,7 +87,7 @@ class CRUDUser:
         if (
             "password" in update_data and update_data["password"]
         ):  # If password is being updated
-            hashed_password = get_password_hash(update_data["password"])
+            hashed_password = await get_password_hash_async(update_data["password"])
             db_obj.password_hash = hashed_password  # Update the password_hash field
             del update_data[
                 "password"
@@ -110,7 +113,7 @@ class CRUDUser:
         user = await self.get_user_by_email(db, email=email)
         if not user:
             return None  # User not found
-        if not verify_password(
+        if not await verify_password_async(
             password, user.password_hash
         ):  # Compare with password_hash
             return None  # Incorrect password
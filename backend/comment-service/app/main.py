@@ -2,9 +2,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
+from mavito_common.http import health
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
 from app.api.v1.endpoints import comments
 
-app = FastAPI(title="Marito Comments Service", redirect_slashes=False)
+app = FastAPI(
+    title="Marito Comments Service", redirect_slashes=False, lifespan=service_lifespan
+)
 
 if settings.BACKEND_CORS_ORIGINS_LIST:
     app.add_middleware(
@@ -17,6 +22,8 @@ if settings.BACKEND_CORS_ORIGINS_LIST:
 
 
 app.include_router(comments.router, prefix="/api/v1/comments", tags=["Comments"])
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
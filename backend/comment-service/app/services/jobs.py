@@ -0,0 +1,58 @@
+# comment-service/app/services/jobs.py
+"""
+Deferred comment work. Run it with:
+
+    python -m mavito_common.jobs.worker app.services.jobs --queue comments
+"""
+
+import logging
+import uuid
+from typing import Any, Dict
+
+from sqlalchemy import literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.http.term_stream import term_event
+from mavito_common.jobs.queue import job
+from mavito_common.models.comment import Comment
+
+from app.services.moderation import REMOVED_CONTENT, profanity_screen
+
+logger = logging.getLogger(__name__)
+
+MODERATE_COMMENT = "comments.moderate"
+
+
+@job(MODERATE_COMMENT)
+async def moderate_comment(db: AsyncSession, payload: Dict[str, Any]) -> None:
+    """Screens a published comment and removes its text if it is profane."""
+    comment_id = uuid.UUID(payload["comment_id"])
+    content = await db.scalar(
+        select(Comment.content).where(
+            Comment.id == comment_id, Comment.tombstone.is_(False)
+        )
+    )
+    if content is None or content == REMOVED_CONTENT:
+        return
+    if not await profanity_screen.is_profane(content):
+        return
+
+    # Only replace the text that was screened; an edit since then queues its
+    # own job.
+    result = await db.execute(
+        update(Comment)
+        .where(Comment.id == comment_id, Comment.content == content)
+        .values(content=REMOVED_CONTENT)
+        .returning(
+            term_event(
+                Comment.term_id,
+                "comment",
+                comment_id=Comment.id,
+                parent_id=Comment.parent_id,
+                action=literal("updated"),
+            )
+        )
+    )
+    if result.first() is None:
+        return
+    logger.info("Removed profane comment %s", comment_id)
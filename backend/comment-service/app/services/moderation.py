@@ -0,0 +1,135 @@
+# comment-service/app/services/moderation.py
+"""
+Profanity screening for comment text. The model runs on a worker thread so
+a prediction never blocks the event loop, concurrent submissions share one
+``predict`` call, and verdicts are remembered by content hash so reposted
+text is not screened twice.
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from mavito_common.core.config import settings
+from mavito_common.observability.metrics import register_cache
+
+REMOVED_CONTENT = "[CONTENT REMOVED DUE TO PROFANITY]"
+
+Predictor = Callable[[Sequence[str]], Sequence[bool]]
+
+
+def _predict(texts: Sequence[str]) -> List[bool]:
+    # profanity_check unpickles a scikit-learn model when imported, so load it
+    # on the first comment rather than on every cold start.
+    from profanity_check import predict
+
+    return [bool(verdict) for verdict in predict(list(texts))]
+
+
+class ProfanityScreen:
+    """
+    Micro-batches screening requests. The first request opens a batch that
+    is flushed after ``max_delay`` seconds, or as soon as it holds
+    ``max_batch`` distinct texts; requests arriving while the model is busy
+    join the next batch. A single worker thread runs the batches in order.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 32,
+        max_delay: float = 0.005,
+        cache_size: int = 4096,
+        predict: Predictor = _predict,
+    ) -> None:
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.cache_size = cache_size
+        self._predict = predict
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._verdicts: "OrderedDict[bytes, bool]" = OrderedDict()
+        self._pending: Dict[bytes, Tuple[str, "asyncio.Future[bool]"]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set["asyncio.Task[None]"] = set()
+        self.hits = 0
+        self.misses = 0
+        self.batches = 0
+        self.screened = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="moderation"
+            )
+        return self._executor
+
+    async def is_profane(self, text: str) -> bool:
+        key = hashlib.sha256(text.encode("utf-8")).digest()
+        verdict = self._verdicts.get(key)
+        if verdict is not None:
+            self._verdicts.move_to_end(key)
+            self.hits += 1
+            return verdict
+        self.misses += 1
+
+        pending = self._pending.get(key)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = (text, loop.create_future())
+            self._pending[key] = pending
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.max_delay, self._flush)
+        # Shielded so one caller giving up does not fail the others waiting
+        # on the same text.
+        return await asyncio.shield(pending[1])
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._screen(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _screen(
+        self, batch: Dict[bytes, Tuple[str, "asyncio.Future[bool]"]]
+    ) -> None:
+        texts = [text for text, _ in batch.values()]
+        loop = asyncio.get_running_loop()
+        try:
+            verdicts = await loop.run_in_executor(self.executor, self._predict, texts)
+        except Exception as e:
+            for _, future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.batches += 1
+        self.screened += len(texts)
+        for (key, (_, future)), verdict in zip(batch.items(), verdicts):
+            self._remember(key, bool(verdict))
+            if not future.done():
+                future.set_result(bool(verdict))
+
+    def _remember(self, key: bytes, verdict: bool) -> None:
+        self._verdicts[key] = verdict
+        self._verdicts.move_to_end(key)
+        while len(self._verdicts) > self.cache_size:
+            self._verdicts.popitem(last=False)
+
+    async def screen(self, text: str) -> str:
+        """Returns ``text``, or the removal notice if it is profane."""
+        return REMOVED_CONTENT if await self.is_profane(text) else text
+
+
+profanity_screen = ProfanityScreen(
+    max_batch=settings.COMMENT_MODERATION_BATCH_SIZE,
+    max_delay=settings.COMMENT_MODERATION_BATCH_DELAY_SECONDS,
+    cache_size=settings.COMMENT_MODERATION_CACHE_SIZE,
+)
+register_cache("profanity_verdicts", profanity_screen)
@@ -0,0 +1,102 @@
+# comment-service/app/tests/conftest.py
+
+from typing import AsyncGenerator
+from uuid import uuid4
+
+import httpx
+import pytest_asyncio
+from httpx import ASGITransport
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from mavito_common.core.config import settings
+from mavito_common.db.base_class import Base
+from mavito_common.db.session import get_db
+from mavito_common.models.term import Term
+from mavito_common.models.user import User, UserRole
+
+from app.main import app
+
+# Build database URLs
+DEFAULT_DB_URL = str(settings.SQLALCHEMY_DATABASE_URL).replace(
+    str(settings.DB_NAME), "postgres", 1
+)
+TEST_DB_NAME = f"{settings.DB_NAME}_comment_test"
+TEST_DATABASE_URL = str(settings.SQLALCHEMY_DATABASE_URL) + "_comment_test"
+
+
+# Async test DB setup
+@pytest_asyncio.fixture(scope="function")
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    default_engine = create_async_engine(DEFAULT_DB_URL, isolation_level="AUTOCOMMIT")
+    async with default_engine.connect() as conn:
+        await conn.execute(text(f"DROP DATABASE IF EXISTS {TEST_DB_NAME} WITH (FORCE)"))
+        await conn.execute(text(f"CREATE DATABASE {TEST_DB_NAME}"))
+
+    test_engine = create_async_engine(TEST_DATABASE_URL)
+
+    try:
+        async with test_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        TestingSessionLocal = async_sessionmaker(
+            bind=test_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            await db.close()
+    finally:
+        await test_engine.dispose()
+        async with default_engine.connect() as conn:
+            await conn.execute(text(f"DROP DATABASE {TEST_DB_NAME} WITH (FORCE)"))
+        await default_engine.dispose()
+
+
+# Async test client with overridden DB dependency
+@pytest_asyncio.fixture(scope="function")
+async def client(db_session: AsyncSession) -> AsyncGenerator[httpx.AsyncClient, None]:
+    def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    async with httpx.AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+    del app.dependency_overrides[get_db]
+
+
+@pytest_asyncio.fixture
+async def user(db_session: AsyncSession) -> User:
+    user = User(
+        id=uuid4(),
+        email=f"test_{uuid4()}@example.com",
+        first_name="Test",
+        last_name="User",
+        password_hash="somehashedpassword",
+        role=UserRole.contributor,
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest_asyncio.fixture
+async def term(db_session: AsyncSession, user: User) -> Term:
+    term = Term(
+        id=uuid4(),
+        term=f"Test Term {uuid4()}",
+        definition="A term for testing.",
+        language="English",
+        domain="Testing",
+        owner_id=user.id,
+    )
+    db_session.add(term)
+    await db_session.commit()
+    return term
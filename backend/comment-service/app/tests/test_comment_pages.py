@@ -0,0 +1,209 @@
+"""
+Tests for comment threads, keyset pages and reply counts against a real
+database.
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from mavito_common.http.pagination import decode_cursor
+from mavito_common.models.comment import Comment
+from mavito_common.schemas.comment import CommentCreate
+
+from app.api import deps
+from app.crud.crud_comment import crud_comment
+from app.main import app
+from app.services.moderation import profanity_screen
+
+pytestmark = pytest.mark.asyncio
+
+POSTED_AT = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+async def _comments(db, user, term, count, parent=None, posted_at=POSTED_AT):
+    """Inserts ``count`` comments that all share one ``date_posted``."""
+    comments = [
+        Comment(
+            id=uuid4(),
+            term_id=term.id,
+            user_id=user.id,
+            content=f"comment {i}",
+            parent_id=parent.id if parent else None,
+            date_posted=posted_at,
+        )
+        for i in range(count)
+    ]
+    db.add_all(comments)
+    if parent is not None:
+        parent.reply_count += count
+    await db.commit()
+    return comments
+
+
+async def _pages(fetch, limit):
+    """Follows next_cursor to the end; returns the ids in the order served."""
+    ids, after = [], None
+    while True:
+        page, after = await fetch(limit=limit, after=after)
+        ids += [comment.id for comment in page]
+        if after is None:
+            return ids
+
+
+@pytest.fixture
+def unscreened(monkeypatch):
+    async def screen(text):
+        return text
+
+    monkeypatch.setattr(profanity_screen, "screen", screen)
+
+
+async def test_thread_deeper_than_five_levels_is_complete(db_session, user, term):
+    (parent,) = await _comments(db_session, user, term, 1)
+    chain = [parent]
+    for _ in range(8):
+        (parent,) = await _comments(db_session, user, term, 1, parent=parent)
+        chain.append(parent)
+
+    thread = await crud_comment.get_comment_thread(db_session, comment_id=chain[0].id)
+    (listed,) = await crud_comment.get_comments_for_term(db_session, term_id=term.id)
+
+    for root in (thread, listed):
+        served = [root.id]
+        while root.replies:
+            (root,) = root.replies
+            served.append(root.id)
+        assert served == [comment.id for comment in chain]
+
+
+async def test_deleted_comment_hides_its_replies_in_threads(
+    db_session, user, term, unscreened
+):
+    (root,) = await _comments(db_session, user, term, 1)
+    (reply,) = await _comments(db_session, user, term, 1, parent=root)
+    await _comments(db_session, user, term, 2, parent=reply)
+
+    await crud_comment.delete_comment(db_session, comment=reply)
+
+    thread = await crud_comment.get_comment_thread(db_session, comment_id=root.id)
+    assert thread.replies == []
+
+
+async def test_thread_pages_with_equal_timestamps_skip_and_repeat_nothing(
+    db_session, user, term
+):
+    roots = await _comments(db_session, user, term, 7)
+
+    async def fetch(limit, after):
+        return await crud_comment.get_thread_page(
+            db_session, term_id=term.id, limit=limit, after=after
+        )
+
+    served = await _pages(fetch, limit=3)
+
+    # Equal timestamps fall back to the id, newest (largest) first.
+    assert served == sorted((root.id for root in roots), reverse=True)
+
+
+async def test_reply_pages_with_equal_timestamps_skip_and_repeat_nothing(
+    db_session, user, term
+):
+    (root,) = await _comments(db_session, user, term, 1)
+    replies = await _comments(db_session, user, term, 5, parent=root)
+
+    async def fetch(limit, after):
+        return await crud_comment.get_reply_page(
+            db_session, comment_id=root.id, limit=limit, after=after
+        )
+
+    served = await _pages(fetch, limit=2)
+
+    assert served == sorted(reply.id for reply in replies)
+
+
+async def test_replies_cursor_continues_after_the_preview(db_session, user, term):
+    (root,) = await _comments(db_session, user, term, 1)
+    replies = await _comments(db_session, user, term, 5, parent=root)
+    in_order = sorted(reply.id for reply in replies)
+
+    (thread,), _ = await crud_comment.get_thread_page(
+        db_session, term_id=term.id, limit=10, reply_limit=2
+    )
+    preview = [reply.id for reply in thread.replies]
+    rest, after = await crud_comment.get_reply_page(
+        db_session,
+        comment_id=root.id,
+        limit=10,
+        after=decode_cursor(thread.replies_cursor),
+    )
+
+    assert thread.reply_count == 5
+    assert preview == in_order[:2]
+    assert [reply.id for reply in rest] == in_order[2:]
+    assert after is None
+
+
+async def test_replies_cursor_is_absent_when_the_preview_is_complete(
+    db_session, user, term
+):
+    (root,) = await _comments(db_session, user, term, 1)
+    await _comments(db_session, user, term, 2, parent=root)
+
+    (thread,), _ = await crud_comment.get_thread_page(
+        db_session, term_id=term.id, limit=10, reply_limit=2
+    )
+
+    assert len(thread.replies) == 2
+    assert thread.replies_cursor is None
+
+
+async def test_reply_count_follows_created_and_deleted_replies(
+    db_session, user, term, unscreened
+):
+    root = await crud_comment.create_comment(
+        db_session,
+        obj_in=CommentCreate(term_id=term.id, content="root"),
+        user_id=user.id,
+    )
+    first, second = [
+        await crud_comment.create_comment(
+            db_session,
+            obj_in=CommentCreate(term_id=term.id, content=text, parent_id=root.id),
+            user_id=user.id,
+        )
+        for text in ("first", "second")
+    ]
+    await db_session.refresh(root)
+    assert root.reply_count == 2
+
+    await crud_comment.delete_comment(db_session, comment=first)
+    # Deleting an already deleted reply must not count it twice.
+    await crud_comment.delete_comment(db_session, comment=first)
+    await db_session.refresh(root)
+    assert root.reply_count == 1
+
+    (thread,), _ = await crud_comment.get_thread_page(
+        db_session, term_id=term.id, limit=10
+    )
+    assert thread.reply_count == 1
+    assert [reply.id for reply in thread.replies] == [second.id]
+
+
+async def test_malformed_cursor_is_rejected(client, user, term):
+    app.dependency_overrides[deps.get_current_active_user] = lambda: user
+    try:
+        threads = await client.get(
+            f"/api/v1/comments/by_term/{term.id}/threads",
+            params={"cursor": "not-a-cursor"},
+        )
+        replies = await client.get(
+            f"/api/v1/comments/{uuid4()}/replies", params={"cursor": "%%%"}
+        )
+    finally:
+        del app.dependency_overrides[deps.get_current_active_user]
+
+    assert threads.status_code == 400
+    assert threads.json()["detail"] == "Invalid cursor"
+    assert replies.status_code == 400
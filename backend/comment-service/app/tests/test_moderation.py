@@ -0,0 +1,147 @@
+"""
+Tests for batched profanity screening and the deferred moderation job.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from mavito_common.models.comment import Comment
+
+from app.services.jobs import moderate_comment
+from app.services.moderation import REMOVED_CONTENT, ProfanityScreen, profanity_screen
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakePredictor:
+    """Flags texts containing "darn"; records each batch it is given."""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        if self.error is not None:
+            raise self.error
+        return ["darn" in text for text in texts]
+
+
+async def test_concurrent_requests_share_one_predict_call():
+    predict = FakePredictor()
+    screen = ProfanityScreen(max_batch=32, max_delay=0.01, predict=predict)
+
+    verdicts = await asyncio.gather(
+        screen.is_profane("hello"),
+        screen.is_profane("darn it"),
+        screen.is_profane("hello"),
+        screen.is_profane("fine"),
+    )
+
+    assert verdicts == [False, True, False, False]
+    assert predict.calls == [["hello", "darn it", "fine"]]
+
+
+async def test_full_batch_is_flushed_without_waiting_for_the_timer():
+    predict = FakePredictor()
+    screen = ProfanityScreen(max_batch=2, max_delay=60, predict=predict)
+
+    verdicts = await asyncio.wait_for(
+        asyncio.gather(screen.is_profane("one"), screen.is_profane("darn two")), 1
+    )
+
+    assert verdicts == [False, True]
+    assert predict.calls == [["one", "darn two"]]
+
+
+async def test_model_error_reaches_every_waiter():
+    error = RuntimeError("model failed")
+    screen = ProfanityScreen(max_delay=0.001, predict=FakePredictor(error))
+
+    results = await asyncio.gather(
+        screen.is_profane("a"), screen.is_profane("b"), return_exceptions=True
+    )
+
+    assert results == [error, error]
+    assert screen.batches == 0
+
+
+async def test_cached_verdicts_skip_the_model():
+    predict = FakePredictor()
+    screen = ProfanityScreen(max_delay=0.001, cache_size=1, predict=predict)
+
+    assert await screen.is_profane("darn") is True
+    assert await screen.is_profane("darn") is True
+    assert (screen.hits, len(predict.calls)) == (1, 1)
+
+    # The cache holds one verdict, so a new text evicts the old one.
+    await screen.is_profane("other")
+    await screen.is_profane("darn")
+    assert len(predict.calls) == 3
+
+
+async def test_cancelled_waiter_does_not_fail_others():
+    screen = ProfanityScreen(max_delay=0.01, predict=FakePredictor())
+    first = asyncio.ensure_future(screen.is_profane("darn"))
+    second = asyncio.ensure_future(screen.is_profane("darn"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second is True
+
+
+async def _comment(db, user, term, content):
+    comment = Comment(id=uuid4(), term_id=term.id, user_id=user.id, content=content)
+    db.add(comment)
+    await db.commit()
+    return comment
+
+
+async def _content(db, comment):
+    return await db.scalar(
+        select(Comment.content)
+        .where(Comment.id == comment.id)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def test_moderation_job_removes_profane_text(db_session, user, term, monkeypatch):
+    async def is_profane(text):
+        return "darn" in text
+
+    monkeypatch.setattr(profanity_screen, "is_profane", is_profane)
+    comment = await _comment(db_session, user, term, "darn this term")
+
+    await moderate_comment(db_session, {"comment_id": str(comment.id)})
+    await db_session.commit()
+
+    assert await _content(db_session, comment) == REMOVED_CONTENT
+
+
+async def test_moderation_job_keeps_text_edited_during_screening(
+    db_session, user, term, monkeypatch
+):
+    comment = await _comment(db_session, user, term, "darn this term")
+    sessions = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+
+    async def edited_while_screening(text):
+        # The author edits the comment while the screened text is judged.
+        async with sessions() as other:
+            await other.execute(
+                update(Comment)
+                .where(Comment.id == comment.id)
+                .values(content="a polite rewrite")
+            )
+            await other.commit()
+        return True
+
+    monkeypatch.setattr(profanity_screen, "is_profane", edited_while_screening)
+
+    await moderate_comment(db_session, {"comment_id": str(comment.id)})
+    await db_session.commit()
+
+    assert await _content(db_session, comment) == "a polite rewrite"
@@ -2,6 +2,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from mavito_common.core.config import settings
+from mavito_common.http import health
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
 from app.api.v1.api import api_router
 
 app = FastAPI(
@@ -9,6 +12,7 @@ app = FastAPI(
     description="Feedback and complaint management service for Mavito",
     version="1.0.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=service_lifespan,
 )
 
 # Set up CORS
@@ -21,6 +25,8 @@ app.add_middleware(
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/")
@@ -54,7 +54,10 @@ async def recalculate_user_level(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid user ID format"
         )
 
-    level_data = await crud_user_level.get_user_level_with_progress(
+    user_level = await crud_user_level.calculate_and_update_user_level(
         db=db, user_id=user_uuid
     )
+    level_data = crud_user_level.level_progress(
+        user_id=user_uuid, level_id=user_level.id, total_xp=user_level.total_xp
+    )
     return UserLevelResponse.model_validate(level_data)
@@ -6,6 +6,7 @@ from pydantic import BaseModel
 from datetime import date
 
 from mavito_common.db.session import get_db
+from mavito_common.jobs.queue import get_job_queue
 from mavito_common.models.user_xp import UserXP
 from mavito_common.schemas.user import User as UserSchema
 from mavito_common.schemas.user_xp import (
@@ -15,6 +16,8 @@ from mavito_common.schemas.user_xp import (
 )
 from app.api.deps import get_current_active_user
 from app.crud.crud_user_xp import crud_user_xp
+from app.services.jobs import CHECK_WEEKLY_GOALS
+from app.services.weekly_goal_generator import get_current_week_id
 
 
 class LoginStreakResponse(BaseModel):
@@ -34,7 +37,7 @@ async def add_xp_to_user(
     current_user: UserSchema = Depends(get_current_active_user),
 ) -> UserXPResponse:
     """
-    Add XP to a user and automatically check for weekly goal completions.
+    Add XP to a user and queue a check for weekly goal completions.
     """
     if xp_request.source_reference_id:
         from datetime import datetime, timedelta, timezone
@@ -72,36 +75,15 @@ async def add_xp_to_user(
         description=xp_request.description,
     )
 
+    # Weekly goal completion is checked by the job worker; the job commits
+    # together with the XP record.
+    await get_job_queue().enqueue(
+        db,
+        CHECK_WEEKLY_GOALS,
+        {"user_id": str(xp_request.user_id), "week_id": get_current_week_id()},
+    )
     xp_record = await crud_user_xp.create_xp_record(db=db, obj_in=xp_create)
 
-    # Automatically check and complete weekly goals after awarding XP
-    try:
-        from app.services.weekly_goal_generator import ensure_weekly_goals_exist
-        from app.crud.crud_achievement import crud_achievement
-
-        await ensure_weekly_goals_exist(db)
-
-        newly_earned = await crud_achievement.check_and_grant_weekly_achievements(
-            db=db, user_id=xp_request.user_id
-        )
-
-        if newly_earned:
-            import logging
-
-            logger = logging.getLogger(__name__)
-            goal_names = [ua.achievement.name for ua in newly_earned if ua.achievement]
-            logger.info(
-                f"User {xp_request.user_id} completed weekly goals: {goal_names}"
-            )
-
-    except Exception as e:
-        import logging
-
-        logger = logging.getLogger(__name__)
-        logger.warning(
-            f"Failed to check weekly achievements for user {xp_request.user_id}: {e}"
-        )
-
     return UserXPResponse.model_validate(xp_record)
 
 
@@ -1,17 +1,26 @@
 import uuid
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, join
+from sqlalchemy import Date, cast, select, func
 from sqlalchemy.orm import selectinload
 
 from mavito_common.models.achievement import Achievement, AchievementType
 from mavito_common.models.user_achievement import UserAchievement
+from mavito_common.models.user_stats import (
+    TERM_ADDED_DESCRIPTION,
+    TERM_UPVOTE_DESCRIPTION,
+    UserStats,
+)
 from mavito_common.models.user_xp import UserXP, XPSource
-from mavito_common.models.term import Term
-from mavito_common.models.term_application import TermApplication
 from mavito_common.schemas.achievement import AchievementCreate
 from mavito_common.schemas.user_achievement import UserAchievementCreate
 from app.crud.crud_user_xp import crud_user_xp
+from app.services.achievement_catalog import (
+    DEFAULT_WEEKLY_XP_REWARD,
+    CatalogEntry,
+    achievement_catalog,
+)
 
 
 class CRUDAchievement:
@@ -43,9 +52,12 @@ class CRUDAchievement:
             achievement_type=obj_in.achievement_type,
             target_value=obj_in.target_value,
             is_active=obj_in.is_active,
+            week_id=obj_in.week_id,
+            xp_reward=obj_in.xp_reward,
         )
         db.add(db_obj)
         await db.commit()
+        achievement_catalog.invalidate()
         await db.refresh(db_obj)
         return db_obj
 
@@ -98,23 +110,17 @@ class CRUDAchievement:
         self, db: AsyncSession, *, user_id: uuid.UUID, achievement: Achievement
     ) -> None:
         """Award XP for completing a weekly goal."""
-        xp_bonus = self._extract_xp_reward(achievement)
+        xp_bonus = self._xp_reward(achievement)
 
         from mavito_common.schemas.user_xp import UserXPCreate
         from mavito_common.models.user_xp import XPSource
 
-        clean_name = (
-            achievement.name.split(" W")[0]
-            if " W" in achievement.name
-            else achievement.name
-        )
-
         xp_create = UserXPCreate(
             user_id=user_id,
             xp_amount=xp_bonus,
             xp_source=XPSource.ACHIEVEMENT_BONUS,
             source_reference_id=achievement.id,
-            description=f"Weekly goal completed: {clean_name}",
+            description=f"Weekly goal completed: {achievement.name}",
         )
 
         await crud_user_xp.create_xp_record(db=db, obj_in=xp_create)
@@ -122,7 +128,9 @@ class CRUDAchievement:
         import logging
 
         logger = logging.getLogger(__name__)
-        logger.info(f"Awarded {xp_bonus} XP for completing weekly goal: {clean_name}")
+        logger.info(
+            f"Awarded {xp_bonus} XP for completing weekly goal: {achievement.name}"
+        )
 
     async def check_and_grant_achievements(
         self, db: AsyncSession, *, user_id: uuid.UUID
@@ -130,17 +138,17 @@ class CRUDAchievement:
         """Check user progress and grant any newly earned achievements."""
         newly_earned = []
 
-        achievements = await self.get_achievements(db=db)
+        achievements = await achievement_catalog.regular(db)
 
         user_achievements = await self.get_user_achievements(db=db, user_id=user_id)
         earned_achievement_ids = {ua.achievement_id for ua in user_achievements}
+        stats = await crud_user_xp.get_user_stats(db=db, user_id=user_id)
 
         for achievement in achievements:
             if achievement.id in earned_achievement_ids:
                 continue
-            if await self._check_achievement_criteria(
-                db=db, user_id=user_id, achievement=achievement
-            ):
+            progress = self._get_achievement_progress(achievement, stats)
+            if progress >= achievement.target_value:
                 try:
                     new_achievement = await self.grant_achievement(
                         db=db, user_id=user_id, achievement_id=achievement.id
@@ -155,11 +163,10 @@ class CRUDAchievement:
         self, db: AsyncSession, *, user_id: uuid.UUID
     ) -> List[dict]:
         """Get progress for regular achievements for a user."""
-        achievements = await self.get_achievements(db=db)
-        # Filter out weekly goals - only return regular achievements
-        regular_achievements = [a for a in achievements if not self._is_weekly_goal(a)]
+        regular_achievements = await achievement_catalog.regular(db)
         user_achievements = await self.get_user_achievements(db=db, user_id=user_id)
         earned_achievement_ids = {ua.achievement_id for ua in user_achievements}
+        stats = await crud_user_xp.get_user_stats(db=db, user_id=user_id)
 
         progress_list = []
 
@@ -168,14 +175,9 @@ class CRUDAchievement:
             current_progress = 0
 
             if not is_earned:
-                current_progress = await self._get_achievement_progress(
-                    db=db, user_id=user_id, achievement=achievement
-                )
-
-                if (
-                    not self._is_weekly_goal(achievement)
-                    and current_progress >= achievement.target_value
-                ):
+                current_progress = self._get_achievement_progress(achievement, stats)
+
+                if current_progress >= achievement.target_value:
                     try:
                         await self.grant_achievement(
                             db=db, user_id=user_id, achievement_id=achievement.id
@@ -213,262 +215,83 @@ class CRUDAchievement:
 
         return progress_list
 
-    async def _get_achievement_progress(
-        self, db: AsyncSession, *, user_id: uuid.UUID, achievement: Achievement
+    def _get_achievement_progress(
+        self, achievement: CatalogEntry, stats: UserStats
     ) -> int:
         """Get current progress value for a specific achievement."""
         if achievement.achievement_type == AchievementType.XP_MILESTONE:
-            stmt = select(func.sum(UserXP.xp_amount)).where(UserXP.user_id == user_id)
-            result = await db.execute(stmt)
-            return result.scalar() or 0
-
+            return stats.total_xp
         elif achievement.achievement_type == AchievementType.COMMENT_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id, UserXP.xp_source == XPSource.COMMENT
-            )
-            result = await db.execute(stmt)
-            return result.scalar() or 0
-
+            return stats.comments
         elif achievement.achievement_type == AchievementType.UPVOTE_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id,
-                UserXP.xp_source == XPSource.UPVOTE_RECEIVED,
-                UserXP.description == "Received an upvote on published term",
-            )
-            result = await db.execute(stmt)
-            return result.scalar() or 0
-
+            return stats.term_upvotes_received
         elif achievement.achievement_type == AchievementType.TERM_COUNT:
             if achievement.name == "Multilingual Master":
-                stmt = (
-                    select(func.count(func.distinct(Term.language)))
-                    .select_from(
-                        join(
-                            UserXP,
-                            TermApplication,
-                            UserXP.source_reference_id == TermApplication.id,
-                        ).join(Term, TermApplication.term_id == Term.id)
-                    )
-                    .where(
-                        UserXP.user_id == user_id,
-                        UserXP.xp_source == XPSource.TERM_ADDITION,
-                        UserXP.source_reference_id.is_not(None),
-                    )
-                )
-                result = await db.execute(stmt)
-                return result.scalar() or 0
-
+                return len(stats.languages)
             elif achievement.name == "Language Guardian":
-                stmt = select(func.count(UserXP.id)).where(
-                    UserXP.user_id == user_id,
-                    UserXP.xp_source == XPSource.TERM_ADDITION,
-                    UserXP.description == "Term application verified by linguist",
-                )
-                result = await db.execute(stmt)
-                return result.scalar() or 0
-
-            else:
-                stmt = select(func.count(UserXP.id)).where(
-                    UserXP.user_id == user_id,
-                    UserXP.xp_source == XPSource.TERM_ADDITION,
-                    UserXP.description == "Added a new term",
-                )
-                result = await db.execute(stmt)
-                return result.scalar() or 0
-
+                return stats.terms_verified
+            return stats.terms_added
         elif achievement.achievement_type == AchievementType.FEEDBACK_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id,
-                UserXP.xp_source == XPSource.FEEDBACK_SUBMISSION,
-            )
-            result = await db.execute(stmt)
-            return result.scalar() or 0
-
+            return stats.feedback_submissions
         elif achievement.achievement_type == AchievementType.LOGIN_STREAK:
-            streak_data = await crud_user_xp.get_user_login_streak(
-                db=db, user_id=user_id
-            )
-            return streak_data["current_streak"]
-
+            return stats.current_login_streak(date.today())
         return 0
 
-    async def _check_achievement_criteria(
-        self, db: AsyncSession, *, user_id: uuid.UUID, achievement: Achievement
-    ) -> bool:
-        """Check if user meets criteria for a specific achievement."""
-        if achievement.achievement_type == AchievementType.XP_MILESTONE:
-            stmt = select(func.sum(UserXP.xp_amount)).where(UserXP.user_id == user_id)
-            result = await db.execute(stmt)
-            total_xp = result.scalar() or 0
-            return total_xp >= achievement.target_value
-
-        elif achievement.achievement_type == AchievementType.COMMENT_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id, UserXP.xp_source == XPSource.COMMENT
-            )
-            result = await db.execute(stmt)
-            comment_count = result.scalar() or 0
-            return comment_count >= achievement.target_value
-
-        elif achievement.achievement_type == AchievementType.UPVOTE_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id,
-                UserXP.xp_source == XPSource.UPVOTE_RECEIVED,
-                UserXP.description == "Received an upvote on published term",
-            )
-            result = await db.execute(stmt)
-            upvote_count = result.scalar() or 0
-            return upvote_count >= achievement.target_value
-
-        elif achievement.achievement_type == AchievementType.TERM_COUNT:
-            if achievement.name == "Multilingual Master":
-                stmt = (
-                    select(func.count(func.distinct(Term.language)))
-                    .select_from(
-                        join(
-                            UserXP,
-                            TermApplication,
-                            UserXP.source_reference_id == TermApplication.id,
-                        ).join(Term, TermApplication.term_id == Term.id)
-                    )
-                    .where(
-                        UserXP.user_id == user_id,
-                        UserXP.xp_source == XPSource.TERM_ADDITION,
-                        UserXP.source_reference_id.is_not(None),
-                    )
-                )
-                result = await db.execute(stmt)
-                language_count = result.scalar() or 0
-                return language_count >= achievement.target_value
-
-            elif achievement.name == "Language Guardian":
-                stmt = select(func.count(UserXP.id)).where(
-                    UserXP.user_id == user_id,
-                    UserXP.xp_source == XPSource.TERM_ADDITION,
-                    UserXP.description == "Term application verified by linguist",
-                )
-                result = await db.execute(stmt)
-                validated_count = result.scalar() or 0
-                return validated_count >= achievement.target_value
-
-            else:
-                stmt = select(func.count(UserXP.id)).where(
-                    UserXP.user_id == user_id,
-                    UserXP.xp_source == XPSource.TERM_ADDITION,
-                    UserXP.description == "Added a new term",
-                )
-                result = await db.execute(stmt)
-                term_count = result.scalar() or 0
-                return term_count >= achievement.target_value
-
-        elif achievement.achievement_type == AchievementType.FEEDBACK_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id,
-                UserXP.xp_source == XPSource.FEEDBACK_SUBMISSION,
-            )
-            result = await db.execute(stmt)
-            feedback_count = result.scalar() or 0
-            return feedback_count >= achievement.target_value
-
-        elif achievement.achievement_type == AchievementType.LOGIN_STREAK:
-            streak_data = await crud_user_xp.get_user_login_streak(
-                db=db, user_id=user_id
-            )
-            current_streak = streak_data["current_streak"]
-            return current_streak >= achievement.target_value
-
-        return False
-
-    def _is_weekly_goal(self, achievement: Achievement) -> bool:
-        """Check if an achievement is a weekly goal based on naming convention."""
-        import re
-
-        return bool(re.search(r"\d{4}W\d{2}", achievement.name))
-
-    def _extract_week_info(self, achievement: Achievement) -> tuple:
-        """Extract week year and number from achievement name."""
-        import re
-
-        week_match = re.search(r"(\d{4})W(\d{2})", achievement.name)
-        if week_match:
-            week_year = int(week_match.group(1))
-            week_number = int(week_match.group(2))
-            return week_year, week_number
-        return None, None
-
-    def _extract_xp_reward(self, achievement: Achievement) -> int:
-        """Extract XP reward from achievement description."""
-        import re
-
-        xp_match = re.search(r"\[XP: (\d+)\]", achievement.description)
-        return int(xp_match.group(1)) if xp_match else 50
-
-    def _clean_description(self, description: str) -> str:
-        """Remove XP notation from achievement description."""
-        import re
-
-        return re.sub(r"\s*\[XP: \d+\]", "", description)
-
-    async def _get_weekly_achievement_progress(
-        self, db: AsyncSession, *, user_id: uuid.UUID, achievement: Achievement
-    ) -> int:
-        """Get progress for weekly goals by filtering XP records by week."""
-        week_year, week_number = self._extract_week_info(achievement)
-        if not week_year or not week_number:
-            return 0
-
-        from datetime import date, timedelta
-
+    def _is_weekly_goal(self, achievement: Union[Achievement, CatalogEntry]) -> bool:
+        return achievement.week_id is not None
+
+    def _xp_reward(self, achievement: Union[Achievement, CatalogEntry]) -> int:
+        if achievement.xp_reward is None:
+            return DEFAULT_WEEKLY_XP_REWARD
+        return achievement.xp_reward
+
+    async def _get_weekly_progress(
+        self, db: AsyncSession, *, user_id: uuid.UUID, week_id: str
+    ) -> Dict[AchievementType, int]:
+        """
+        Progress towards every kind of weekly goal in ISO week ``week_id``,
+        in one query over the user's XP records of that week. Each kind is a
+        filtered count; the ``created_at`` range (rather than comparing its
+        date) lets the (user_id, created_at) index find the week's records.
+        """
         try:
-            week_start = date.fromisocalendar(week_year, week_number, 1)
-            week_end = week_start + timedelta(days=6)
+            week_start = date.fromisocalendar(int(week_id[:4]), int(week_id[5:]), 1)
         except ValueError:
-            return 0
-
-        if achievement.achievement_type == AchievementType.COMMENT_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id,
-                UserXP.xp_source == XPSource.COMMENT,
-                func.date(UserXP.created_at) >= week_start,
-                func.date(UserXP.created_at) <= week_end,
-            )
-        elif achievement.achievement_type == AchievementType.TERM_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id,
-                UserXP.xp_source == XPSource.TERM_ADDITION,
-                UserXP.description == "Added a new term",
-                func.date(UserXP.created_at) >= week_start,
-                func.date(UserXP.created_at) <= week_end,
-            )
-        elif achievement.achievement_type == AchievementType.UPVOTE_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id,
-                UserXP.xp_source == XPSource.UPVOTE_RECEIVED,
-                UserXP.description == "Received an upvote on published term",
-                func.date(UserXP.created_at) >= week_start,
-                func.date(UserXP.created_at) <= week_end,
-            )
-        elif achievement.achievement_type == AchievementType.FEEDBACK_COUNT:
-            stmt = select(func.count(UserXP.id)).where(
-                UserXP.user_id == user_id,
-                UserXP.xp_source == XPSource.FEEDBACK_SUBMISSION,
-                func.date(UserXP.created_at) >= week_start,
-                func.date(UserXP.created_at) <= week_end,
-            )
-        elif achievement.achievement_type == AchievementType.LOGIN_STREAK:
-            stmt = select(
-                func.count(func.distinct(func.date(UserXP.created_at)))
-            ).where(
-                UserXP.user_id == user_id,
-                UserXP.xp_source == XPSource.LOGIN_STREAK,
-                func.date(UserXP.created_at) >= week_start,
-                func.date(UserXP.created_at) <= week_end,
+            return {}
+        week_end = week_start + timedelta(days=7)
+
+        def count(source: XPSource, description: Optional[str] = None) -> Any:
+            condition = UserXP.xp_source == source
+            if description is not None:
+                condition &= UserXP.description == description
+            return func.count().filter(condition)
+
+        stmt = select(
+            count(XPSource.COMMENT),
+            count(XPSource.TERM_ADDITION, TERM_ADDED_DESCRIPTION),
+            count(XPSource.UPVOTE_RECEIVED, TERM_UPVOTE_DESCRIPTION),
+            count(XPSource.FEEDBACK_SUBMISSION),
+            func.count(func.distinct(func.date(UserXP.created_at))).filter(
+                UserXP.xp_source == XPSource.LOGIN_STREAK
+            ),
+        ).where(
+            UserXP.user_id == user_id,
+            UserXP.created_at >= cast(week_start, Date),
+            UserXP.created_at < cast(week_end, Date),
+        )
+        row = (await db.execute(stmt)).one()
+        return dict(
+            zip(
+                (
+                    AchievementType.COMMENT_COUNT,
+                    AchievementType.TERM_COUNT,
+                    AchievementType.UPVOTE_COUNT,
+                    AchievementType.FEEDBACK_COUNT,
+                    AchievementType.LOGIN_STREAK,
+                ),
+                row,
             )
-        else:
-            return 0
-
-        result = await db.execute(stmt)
-        return result.scalar() or 0
+        )
 
     async def get_user_weekly_goals(
         self, db: AsyncSession, *, user_id: uuid.UUID, week_id: Optional[str] = None
@@ -481,11 +304,15 @@ class CRUDAchievement:
             week_year, week_number, _ = today.isocalendar()
             week_id = f"{week_year}W{week_number:02d}"
 
-        all_achievements = await self.get_achievements(db=db)
-        weekly_achievements = [a for a in all_achievements if week_id in a.name]
+        weekly_achievements = await achievement_catalog.weekly(db, week_id)
 
         user_achievements = await self.get_user_achievements(db=db, user_id=user_id)
         earned_achievement_ids = {ua.achievement_id for ua in user_achievements}
+        weekly_progress: Dict[AchievementType, int] = {}
+        if any(a.id not in earned_achievement_ids for a in weekly_achievements):
+            weekly_progress = await self._get_weekly_progress(
+                db=db, user_id=user_id, week_id=week_id
+            )
 
         weekly_goals = []
         for achievement in weekly_achievements:
@@ -493,23 +320,13 @@ class CRUDAchievement:
             current_progress = 0
 
             if not is_completed:
-                if self._is_weekly_goal(achievement):
-                    current_progress = await self._get_weekly_achievement_progress(
-                        db=db, user_id=user_id, achievement=achievement
-                    )
-                else:
-                    current_progress = await self._get_achievement_progress(
-                        db=db, user_id=user_id, achievement=achievement
-                    )
-
-            xp_reward = self._extract_xp_reward(achievement)
-            clean_description = self._clean_description(achievement.description)
+                current_progress = weekly_progress.get(achievement.achievement_type, 0)
 
             weekly_goals.append(
                 {
                     "id": str(achievement.id),
-                    "name": achievement.name.replace(f" {week_id}", ""),
-                    "description": clean_description,
+                    "name": achievement.name,
+                    "description": achievement.description,
                     "target_value": achievement.target_value,
                     "current_progress": (
                         current_progress
@@ -524,7 +341,7 @@ class CRUDAchievement:
                             100.0, (current_progress / achievement.target_value) * 100.0
                         )
                     ),
-                    "xp_reward": xp_reward,
+                    "xp_reward": self._xp_reward(achievement),
                 }
             )
 
@@ -541,11 +358,15 @@ class CRUDAchievement:
             week_year, week_number, _ = today.isocalendar()
             week_id = f"{week_year}W{week_number:02d}"
 
-        all_achievements = await self.get_achievements(db=db)
-        weekly_achievements = [a for a in all_achievements if week_id in a.name]
+        weekly_achievements = await achievement_catalog.weekly(db, week_id)
 
         user_achievements = await self.get_user_achievements(db=db, user_id=user_id)
         earned_achievement_ids = {ua.achievement_id for ua in user_achievements}
+        weekly_progress: Dict[AchievementType, int] = {}
+        if any(a.id not in earned_achievement_ids for a in weekly_achievements):
+            weekly_progress = await self._get_weekly_progress(
+                db=db, user_id=user_id, week_id=week_id
+            )
 
         newly_earned = []
 
@@ -553,17 +374,8 @@ class CRUDAchievement:
             if achievement.id in earned_achievement_ids:
                 continue
 
-            if self._is_weekly_goal(achievement):
-                current_progress = await self._get_weekly_achievement_progress(
-                    db=db, user_id=user_id, achievement=achievement
-                )
-                criteria_met = current_progress >= achievement.target_value
-            else:
-                criteria_met = await self._check_achievement_criteria(
-                    db=db, user_id=user_id, achievement=achievement
-                )
-
-            if criteria_met:
+            current_progress = weekly_progress.get(achievement.achievement_type, 0)
+            if current_progress >= achievement.target_value:
                 try:
                     new_achievement = await self.grant_achievement(
                         db=db, user_id=user_id, achievement_id=achievement.id
@@ -75,18 +75,30 @@ class CRUDUserLevel:
     async def get_user_level_with_progress(
         self, db: AsyncSession, *, user_id: uuid.UUID
     ) -> dict:
-        """Get user level with progress information."""
-        user_level = await self.calculate_and_update_user_level(db=db, user_id=user_id)
+        """
+        Get user level with progress information. Reads the level row kept
+        up to date as XP is recorded; users without XP are level 1.
+        """
+        user_level = await self.get_user_level(db=db, user_id=user_id)
+        if user_level is None:
+            return self.level_progress(user_id=user_id, level_id=None, total_xp=0)
+        return self.level_progress(
+            user_id=user_id, level_id=user_level.id, total_xp=user_level.total_xp
+        )
 
-        current_level_xp_requirement = calculate_xp_for_level(user_level.current_level)
-        xp_for_next_level = calculate_xp_for_next_level(user_level.current_level)
-        xp_progress_in_level = user_level.total_xp - current_level_xp_requirement
+    def level_progress(
+        self, *, user_id: uuid.UUID, level_id: Optional[uuid.UUID], total_xp: int
+    ) -> dict:
+        current_level = calculate_level_from_xp(total_xp)
+        current_level_xp_requirement = calculate_xp_for_level(current_level)
+        xp_for_next_level = calculate_xp_for_next_level(current_level)
+        xp_progress_in_level = total_xp - current_level_xp_requirement
 
         return {
-            "id": user_level.id,
-            "user_id": user_level.user_id,
-            "current_level": user_level.current_level,
-            "total_xp": user_level.total_xp,
+            "id": level_id,
+            "user_id": user_id,
+            "current_level": current_level,
+            "total_xp": total_xp,
             "xp_for_next_level": xp_for_next_level,
             "xp_progress_in_level": xp_progress_in_level,
         }
@@ -4,6 +4,8 @@ from datetime import date, timedelta, datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func
 
+from mavito_common.models.user_level import record_xp_level
+from mavito_common.models.user_stats import UserStats, record_xp_stats
 from mavito_common.models.user_xp import UserXP, XPSource
 from mavito_common.schemas.user_xp import UserXPCreate
 
@@ -12,7 +14,7 @@ class CRUDUserXP:
     async def create_xp_record(
         self, db: AsyncSession, *, obj_in: UserXPCreate
     ) -> UserXP:
-        """Create a new XP record for a user."""
+        """Create a new XP record for a user and add it to their stats and level."""
         db_obj = UserXP(
             user_id=obj_in.user_id,
             xp_amount=obj_in.xp_amount,
@@ -21,10 +23,19 @@ class CRUDUserXP:
             description=obj_in.description,
         )
         db.add(db_obj)
+        await db.execute(record_xp_stats(db_obj))
+        await db.execute(record_xp_level(db_obj))
         await db.commit()
         await db.refresh(db_obj)
         return db_obj
 
+    async def get_user_stats(
+        self, db: AsyncSession, *, user_id: uuid.UUID
+    ) -> UserStats:
+        """Get the user's running XP totals; all zero if they have no XP yet."""
+        stats = await db.get(UserStats, user_id)
+        return stats if stats is not None else UserStats.empty(user_id)
+
     async def get_user_xp_records(
         self, db: AsyncSession, *, user_id: uuid.UUID
     ) -> List[UserXP]:
@@ -2,10 +2,18 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
+from mavito_common.http import health
+from mavito_common.http.lifespan import make_lifespan
+from mavito_common.observability.middleware import install_observability
 from app.api.v1.api import api_router
 from app.services.default_achievements import ensure_default_achievements
 
-app = FastAPI(title="Mavito Gamification Service", redirect_slashes=False)
+# Seed the default achievements once the database engine is up.
+app = FastAPI(
+    title="Mavito Gamification Service",
+    redirect_slashes=False,
+    lifespan=make_lifespan(ensure_default_achievements),
+)
 
 if settings.BACKEND_CORS_ORIGINS_LIST:
     app.add_middleware(
@@ -17,12 +25,8 @@ if settings.BACKEND_CORS_ORIGINS_LIST:
     )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize default achievements on service startup."""
-    await ensure_default_achievements()
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
@@ -0,0 +1,110 @@
+# gamification-service/app/services/achievement_catalog.py
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.core.config import settings
+from mavito_common.models.achievement import Achievement, AchievementType
+from mavito_common.observability.metrics import register_cache
+
+# Paid for a weekly goal created without an explicit reward.
+DEFAULT_WEEKLY_XP_REWARD = 50
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """An active achievement, detached from any session."""
+
+    id: uuid.UUID
+    name: str
+    description: str
+    achievement_type: AchievementType
+    target_value: int
+    week_id: Optional[str]
+    xp_reward: Optional[int]
+
+    @property
+    def is_weekly(self) -> bool:
+        return self.week_id is not None
+
+
+_COLUMNS = (
+    Achievement.id,
+    Achievement.name,
+    Achievement.description,
+    Achievement.achievement_type,
+    Achievement.target_value,
+    Achievement.week_id,
+    Achievement.xp_reward,
+)
+
+
+class AchievementCatalog:
+    """
+    The active achievements, read once and indexed into regular achievements
+    and weekly goals by week. Reloaded every ``ttl_seconds``, and at once
+    after ``invalidate``, which creating an achievement calls. A week with
+    no goals in memory is looked up in the database, because another
+    process may have just generated them.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._regular: List[CatalogEntry] = []
+        self._weekly: Dict[str, List[CatalogEntry]] = {}
+        self._expires = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    async def regular(self, db: AsyncSession) -> List[CatalogEntry]:
+        await self._ensure_loaded(db)
+        return self._regular
+
+    async def weekly(self, db: AsyncSession, week_id: str) -> List[CatalogEntry]:
+        await self._ensure_loaded(db)
+        goals = self._weekly.get(week_id)
+        if goals is None:
+            goals = await self._select(
+                db, Achievement.is_active, Achievement.week_id == week_id
+            )
+            if goals:
+                self.invalidate()
+        return goals or []
+
+    def invalidate(self) -> None:
+        self._expires = 0.0
+
+    async def _ensure_loaded(self, db: AsyncSession) -> None:
+        if self._clock() < self._expires:
+            self.hits += 1
+            return
+        self.misses += 1
+        entries = await self._select(db, Achievement.is_active)
+        regular: List[CatalogEntry] = []
+        weekly: Dict[str, List[CatalogEntry]] = {}
+        for entry in entries:
+            if entry.week_id is None:
+                regular.append(entry)
+            else:
+                weekly.setdefault(entry.week_id, []).append(entry)
+        self._regular, self._weekly = regular, weekly
+        self._expires = self._clock() + self.ttl_seconds
+
+    async def _select(self, db: AsyncSession, *criteria) -> List[CatalogEntry]:
+        stmt = select(*_COLUMNS).where(*criteria).order_by(Achievement.created_at)
+        return [CatalogEntry(*row) for row in await db.execute(stmt)]
+
+
+achievement_catalog = AchievementCatalog(
+    ttl_seconds=settings.ACHIEVEMENT_CATALOG_TTL_SECONDS
+)
+register_cache("achievement_catalog", achievement_catalog)
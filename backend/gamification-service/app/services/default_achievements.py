@@ -4,7 +4,7 @@ from sqlalchemy import select, func
 
 from mavito_common.models.achievement import Achievement, AchievementType
 from mavito_common.schemas.achievement import AchievementCreate
-from mavito_common.db.session import AsyncSessionLocal
+from mavito_common.db.session import get_sessionmaker
 from app.crud.crud_achievement import crud_achievement
 
 # Default achievements to create on startup
@@ -56,7 +56,7 @@ DEFAULT_ACHIEVEMENTS = [
 
 async def achievements_table_is_empty() -> bool:
     """Check if the achievements table is empty."""
-    async with AsyncSessionLocal() as db:
+    async with get_sessionmaker()() as db:
         stmt = select(func.count(Achievement.id))
         result = await db.execute(stmt)
         count = result.scalar() or 0
@@ -67,7 +67,7 @@ async def create_default_achievements() -> List[Achievement]:
     """Create default achievements in the database."""
     created_achievements = []
 
-    async with AsyncSessionLocal() as db:
+    async with get_sessionmaker()() as db:
         for achievement_data in DEFAULT_ACHIEVEMENTS:
             try:
                 achievement_create = AchievementCreate(**achievement_data)
@@ -0,0 +1,36 @@
+# gamification-service/app/services/jobs.py
+"""
+Deferred gamification work. Run it with:
+
+    python -m mavito_common.jobs.worker app.services.jobs --queue gamification
+"""
+
+import logging
+import uuid
+from typing import Any, Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.jobs.queue import job
+
+logger = logging.getLogger(__name__)
+
+CHECK_WEEKLY_GOALS = "gamification.check_weekly_goals"
+
+
+@job(CHECK_WEEKLY_GOALS)
+async def check_weekly_goals(db: AsyncSession, payload: Dict[str, Any]) -> None:
+    """Completes any weekly goals the user's XP for ``week_id`` now satisfies."""
+    from app.services.weekly_goal_generator import ensure_weekly_goals_exist
+    from app.crud.crud_achievement import crud_achievement
+
+    user_id = uuid.UUID(payload["user_id"])
+    week_id = payload["week_id"]
+
+    await ensure_weekly_goals_exist(db, week_id)
+    newly_earned = await crud_achievement.check_and_grant_weekly_achievements(
+        db=db, user_id=user_id, week_id=week_id
+    )
+    if newly_earned:
+        goal_names = [ua.achievement.name for ua in newly_earned if ua.achievement]
+        logger.info(f"User {user_id} completed weekly goals: {goal_names}")
@@ -6,6 +6,7 @@ from typing import List, Dict, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.crud_achievement import crud_achievement
+from app.services.achievement_catalog import achievement_catalog
 from mavito_common.schemas.achievement import AchievementCreate
 from mavito_common.models.achievement import AchievementType
 
@@ -100,8 +101,7 @@ async def check_weekly_goals_exist(
     if not week_id:
         week_id = get_current_week_id()
 
-    existing_goals = await crud_achievement.get_achievements(db=db)
-    return any(week_id in goal.name for goal in existing_goals)
+    return bool(await achievement_catalog.weekly(db, week_id))
 
 
 async def generate_random_weekly_goals(
@@ -129,11 +129,13 @@ async def generate_random_weekly_goals(
         xp_reward = random.choice(xp_options)
 
         goal_data = {
-            "name": f"{template.name} {week_id}",
-            "description": f"{template.description.format(target=target_value)} [XP: {xp_reward}]",
+            "name": template.name,
+            "description": template.description.format(target=target_value),
             "achievement_type": template.achievement_type,
             "target_value": target_value,
             "is_active": True,
+            "week_id": week_id,
+            "xp_reward": xp_reward,
         }
 
         try:
@@ -182,8 +184,7 @@ async def ensure_weekly_goals_exist(
         _generation_locks[week_id] = asyncio.Lock()
 
     async with _generation_locks[week_id]:
-        existing_goals = await crud_achievement.get_achievements(db=db)
-        current_week_goals = [goal for goal in existing_goals if week_id in goal.name]
+        current_week_goals = await achievement_catalog.weekly(db, week_id)
 
         if current_week_goals:
             logger.debug(f"Weekly goals already exist for {week_id}")
@@ -219,5 +220,4 @@ async def get_weekly_goals_for_week(
     if not week_id:
         week_id = get_current_week_id()
 
-    existing_goals = await crud_achievement.get_achievements(db=db)
-    return [goal for goal in existing_goals if week_id in goal.name]
+    return await achievement_catalog.weekly(db, week_id)
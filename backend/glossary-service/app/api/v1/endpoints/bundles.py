@@ -0,0 +1,101 @@
+import asyncio
+import gzip
+import hashlib
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import RedirectResponse
+
+from mavito_common.bundles.builder import BUNDLE_PATH_PATTERN, MANIFEST_PATH
+from mavito_common.bundles.store import (
+    IMMUTABLE_CACHE_CONTROL,
+    MANIFEST_CACHE_CONTROL,
+    BundleStore,
+    get_bundle_store,
+)
+from mavito_common.core.config import settings
+from mavito_common.http.compression import accepts_encoding
+from mavito_common.http.conditional import etag_matches
+
+router = APIRouter()
+
+
+@lru_cache(maxsize=1)
+def bundle_store() -> Optional[BundleStore]:
+    return get_bundle_store()
+
+
+def _require_store() -> BundleStore:
+    store = bundle_store()
+    if store is None:
+        raise HTTPException(
+            status_code=404, detail="Static glossary bundles are not enabled."
+        )
+    return store
+
+
+def _redirect(path: str, cache_control: str) -> Optional[Response]:
+    base_url = settings.GLOSSARY_BUNDLE_BASE_URL
+    if not base_url:
+        return None
+    return RedirectResponse(
+        f"{base_url.rstrip('/')}/{path}",
+        status_code=307,
+        headers={"Cache-Control": cache_control},
+    )
+
+
+@router.get("/manifest.json")
+async def get_bundle_manifest(request: Request) -> Response:
+    """
+    Index of the prebuilt (domain, language) bundles. Always revalidated, so
+    clients pick up new bundle paths as soon as a term is approved.
+    """
+    store = _require_store()
+    redirect = _redirect(MANIFEST_PATH, MANIFEST_CACHE_CONTROL)
+    if redirect:
+        return redirect
+
+    data = await asyncio.to_thread(store.read, MANIFEST_PATH)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Bundle manifest not built yet.")
+
+    etag = f'"{hashlib.sha1(data).hexdigest()[:16]}"'
+    headers = {"ETag": etag, "Cache-Control": MANIFEST_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(data, media_type="application/json", headers=headers)
+
+
+@router.get("/{bundle_path:path}")
+async def get_bundle(bundle_path: str, request: Request) -> Response:
+    """
+    Serves a content-hashed bundle as an immutable asset. Bundles are stored
+    gzipped and only decompressed for clients that do not accept gzip.
+    """
+    store = _require_store()
+    if not BUNDLE_PATH_PATTERN.match(bundle_path):
+        raise HTTPException(status_code=404, detail="Bundle not found.")
+    redirect = _redirect(bundle_path, IMMUTABLE_CACHE_CONTROL)
+    if redirect:
+        return redirect
+
+    data = await asyncio.to_thread(store.read, bundle_path)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Bundle not found.")
+
+    # The file name carries the content digest, which makes a natural validator.
+    etag = f'"{bundle_path.rsplit(".", 3)[1]}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if accepts_encoding(request.headers.get("accept-encoding", ""), "gzip"):
+        headers["Content-Encoding"] = "gzip"
+    else:
+        data = gzip.decompress(data)
+    return Response(data, media_type="application/json", headers=headers)
@@ -1,15 +1,42 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
 from typing import List, Dict, Optional
+from typing_extensions import TypedDict
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_, and_, distinct, text
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload
 from typing import Any
 
 from mavito_common.models.term import Term
-from mavito_common.db.session import get_db
+from mavito_common.models.data_version import TERMS_DATA_VERSION
+from mavito_common.db.replicas import get_read_db
+from mavito_common.http.conditional import DataVersionCache, conditional_get
+from mavito_common.http.responses import (
+    EncodedJSONResponse,
+    EncodedResponseCache,
+    JSONSerializer,
+)
 
 router = APIRouter()
 
+# Glossary reads are validated against the terms data version, which
+# term-addition-service bumps on every term or translation write.
+catalog_version = DataVersionCache(TERMS_DATA_VERSION)
+catalog_etag = Depends(conditional_get(catalog_version, db_dependency=get_read_db))
+
+
+class CategoryTerm(TypedDict):
+    id: str
+    term: str
+    definition: str
+    category: str
+    language: str
+    translations: Dict[str, str]
+
+
+category_terms = JSONSerializer(List[CategoryTerm])
+# Encoded category listings keyed by their ETag, which changes with the data.
+category_bodies = EncodedResponseCache("glossary_category_terms")
+
 # Language mappings
 LANGUAGE_MAP = {
     "English": "English",
@@ -61,9 +88,21 @@ async def get_all_categories(db: AsyncSession) -> List[str]:
     return [transform_category_name(domain) for domain, in result.all()]
 
 
-async def get_terms_by_category(
-    db: AsyncSession, category: str
-) -> List[Dict[str, Any]]:
+def pivot_translations(
+    term: Term, target_languages: Optional[List[str]] = None
+) -> Dict[str, str]:
+    """
+    Reads a term's denormalized translation_map as {language: term}, optionally
+    restricted to the given target languages.
+    """
+    return {
+        language: entry["term"]
+        for language, entry in (term.translation_map or {}).items()
+        if not target_languages or language in target_languages
+    }
+
+
+async def get_terms_by_category(db: AsyncSession, category: str) -> List[CategoryTerm]:
     """Get all terms for a specific category/domain."""
     # URL-decode the category name to handle special characters like forward slashes
     from urllib.parse import unquote_plus
@@ -74,12 +113,11 @@ async def get_terms_by_category(
     # Transform from display format ("or") back to storage format ("/")
     storage_category = transform_category_name(decoded_category, for_display=False)
 
-    # Use ORM with selectinload to fetch translations for each term
-    from sqlalchemy.orm import selectinload
-
+    # Translations come from the translation_map pivot, so no relationship
+    # loads are needed: one row per term, one round trip.
     orm_query = (
         select(Term)
-        .options(selectinload(Term.translations))
+        .options(raiseload("*"))
         .where(func.lower(Term.domain) == storage_category.lower())
         .order_by(Term.term)
     )
@@ -100,12 +138,10 @@ async def get_terms_by_category(
             result = await db.execute(sql_query, {"category": storage_category})
             rows = result.fetchall()
             if rows:
-                # For fallback, fetch translations for each term by ORM
+                # For fallback, fetch the matched terms by ORM
                 ids = [row[0] for row in rows]
                 fallback_query = (
-                    select(Term)
-                    .options(selectinload(Term.translations))
-                    .where(Term.id.in_(ids))
+                    select(Term).options(raiseload("*")).where(Term.id.in_(ids))
                 )
                 fallback_result = await db.execute(fallback_query)
                 fallback_terms = fallback_result.scalars().all()
@@ -114,12 +150,9 @@ async def get_terms_by_category(
             pass
 
     # Format and return the results with translations
-    results = []
+    results: List[CategoryTerm] = []
     for term in orm_terms:
-        translations = {}
-        if hasattr(term, "translations") and term.translations:
-            for translation in term.translations:
-                translations[translation.language] = translation.term
+        translations = pivot_translations(term)
         results.append(
             {
                 "id": str(term.id),
@@ -142,17 +175,13 @@ async def get_term_translations(
         from uuid import UUID
 
         uuid_obj = UUID(term_id)
-        query = (
-            select(Term)
-            .where(Term.id == uuid_obj)
-            .options(selectinload(Term.translations))
-        )
+        query = select(Term).where(Term.id == uuid_obj).options(raiseload("*"))
     except ValueError:
         # If not a UUID, try to find by term name
         query = (
             select(Term)
             .where(func.lower(Term.term) == term_id.lower())
-            .options(selectinload(Term.translations))
+            .options(raiseload("*"))
         )
 
     result = await db.execute(query)
@@ -161,16 +190,10 @@ async def get_term_translations(
     if not term:
         return None
 
-    # Get all translations
-    translations = {}
-    if term.translations:
-        for translation in term.translations:
-            translations[translation.language] = translation.term
-
     return {
         "term": term.term,
         "definition": term.definition,
-        "translations": translations,
+        "translations": pivot_translations(term),
     }
 
 
@@ -201,16 +224,18 @@ async def search_terms(db: AsyncSession, query: str) -> List[Dict[str, Any]]:
 # ========== Glossary API Endpoints ==========
 
 
-@router.get("/categories", response_model=List[str])
-async def get_categories(db: AsyncSession = Depends(get_db)) -> List[str]:
+@router.get("/categories", response_model=List[str], dependencies=[catalog_etag])
+async def get_categories(db: AsyncSession = Depends(get_read_db)) -> List[str]:
     """Get all available categories."""
     categories = await get_all_categories(db)
     return categories
 
 
-@router.get("/categories/stats", response_model=Dict[str, int])
+@router.get(
+    "/categories/stats", response_model=Dict[str, int], dependencies=[catalog_etag]
+)
 async def get_categories_with_counts(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, int]:
     """Get all categories with their term counts."""
     # Query to get domain and count of terms for each domain
@@ -232,22 +257,32 @@ async def get_categories_with_counts(
     return category_counts
 
 
-@router.get("/categories/{category_name}/terms")
+@router.get("/categories/{category_name}/terms", response_model=List[CategoryTerm])
 async def get_terms_by_category_api(
-    category_name: str, db: AsyncSession = Depends(get_db)
-) -> List[Dict[str, Any]]:
+    category_name: str,
+    db: AsyncSession = Depends(get_read_db),
+    *,
+    response: Response,
+    etag: Optional[str] = catalog_etag,
+) -> Response:
     """Get all terms for a specific category."""
-    terms = await get_terms_by_category(db, category_name)
-    if not terms:
-        raise HTTPException(
-            status_code=404, detail=f"No terms found for category: {category_name}"
-        )
-    return terms
+    body = category_bodies.get(etag) if etag else None
+    if body is None:
+        terms = await get_terms_by_category(db, category_name)
+        if not terms:
+            raise HTTPException(
+                status_code=404, detail=f"No terms found for category: {category_name}"
+            )
+        body = category_terms.encode(terms)
+        if etag:
+            category_bodies.set(etag, body)
+    # Carry over the ETag and Cache-Control set by catalog_etag.
+    return EncodedJSONResponse(body, headers=response.headers)
 
 
-@router.get("/terms/{term_id}/translations")
+@router.get("/terms/{term_id}/translations", dependencies=[catalog_etag])
 async def get_term_translations_api(
-    term_id: str, db: AsyncSession = Depends(get_db)
+    term_id: str, db: AsyncSession = Depends(get_read_db)
 ) -> Dict[str, Any]:
     """Get all available translations for a specific term."""
     translations = await get_term_translations(db, term_id)
@@ -256,24 +291,26 @@ async def get_term_translations_api(
     return translations
 
 
-@router.get("/search")
+@router.get("/search", dependencies=[catalog_etag])
 async def search_terms_api(
     query: str = Query(..., description="Search query for terms or definitions"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> List[Dict[str, Any]]:
     """Search for terms across all categories."""
     results = await search_terms(db, query)
     return results
 
 
-@router.get("/domains", response_model=List[str])
-async def get_domains(db: AsyncSession = Depends(get_db)) -> List[str]:
+@router.get("/domains", response_model=List[str], dependencies=[catalog_etag])
+async def get_domains(db: AsyncSession = Depends(get_read_db)) -> List[str]:
     """Get all available domains (same as categories)."""
     return await get_all_categories(db)
 
 
-@router.get("/languages", response_model=Dict[str, str])
-async def get_available_languages(db: AsyncSession = Depends(get_db)) -> Dict[str, str]:
+@router.get("/languages", response_model=Dict[str, str], dependencies=[catalog_etag])
+async def get_available_languages(
+    db: AsyncSession = Depends(get_read_db),
+) -> Dict[str, str]:
     """Get all available languages in the glossary."""
     # Query distinct languages from the database
     query: Any = select(distinct(Term.language))
@@ -291,7 +328,7 @@ async def advanced_search(
     language: Optional[str] = None,
     page: int = 1,
     limit: int = 10,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, Any]:
     """
     Advanced search endpoint with filtering by domain and language, and pagination.
@@ -489,7 +526,7 @@ async def translate_terms(
     source_language: str = "English",
     target_languages: Optional[List[str]] = None,
     domain: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Translate a list of terms from source language to specified target languages.
@@ -517,8 +554,8 @@ async def translate_terms(
     if term_filters:
         base_query = base_query.where(or_(*term_filters))
 
-    # Include translations
-    base_query = base_query.options(selectinload(Term.translations))
+    # Translations are read from the pivot column
+    base_query = base_query.options(raiseload("*"))
 
     # Execute query
     result = await db.execute(base_query)
@@ -527,12 +564,8 @@ async def translate_terms(
     # Prepare results
     result_data = []
     for term in source_terms:
-        translations = {}
-
         # Filter translations by target languages if specified
-        for translation in term.translations:
-            if not target_languages or translation.language in target_languages:
-                translations[translation.language] = translation.term
+        translations = pivot_translations(term, target_languages)
 
         result_data.append(
             {
@@ -548,8 +581,8 @@ async def translate_terms(
 
 
 # Additional glossary functionality
-@router.get("/stats")
-async def get_glossary_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+@router.get("/stats", dependencies=[catalog_etag])
+async def get_glossary_stats(db: AsyncSession = Depends(get_read_db)) -> Dict[str, Any]:
     """Get basic statistics about the glossary."""
     # Count total terms
     total_sql = select(func.count()).select_from(Term)
@@ -578,7 +611,7 @@ async def get_glossary_stats(db: AsyncSession = Depends(get_db)) -> Dict[str, An
 
 @router.get("/random")
 async def get_random_term(
-    count: int = 1, db: AsyncSession = Depends(get_db)
+    count: int = 1, db: AsyncSession = Depends(get_read_db)
 ) -> List[Dict[str, Any]]:
     """Get a random term or set of terms."""
     # Count total terms
@@ -1,9 +1,25 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
-from app.api.v1.endpoints import glossary
+from mavito_common.http import health
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
+from mavito_common.http.read_your_writes import install_read_your_writes
+from mavito_common.http.pipeline import install_http_pipeline
+from mavito_common.http.responses import ORJSONResponse
+from app.api.v1.endpoints import bundles, glossary
 
-app = FastAPI(title="Marito Search Service")
+app = FastAPI(
+    title="Marito Search Service",
+    default_response_class=ORJSONResponse,
+    lifespan=service_lifespan,
+)
+
+# Compress large glossary payloads and answer If-None-Match with 304
+install_http_pipeline(app)
+
+# Pin a client's reads to the primary briefly after it writes
+install_read_your_writes(app)
 
 if settings.BACKEND_CORS_ORIGINS_LIST:
     app.add_middleware(
@@ -15,6 +31,11 @@ if settings.BACKEND_CORS_ORIGINS_LIST:
     )
 
 app.include_router(glossary.router, prefix="/api/v1/glossary", tags=["Glossary"])
+app.include_router(
+    bundles.router, prefix="/api/v1/glossary/bundles", tags=["Glossary Bundles"]
+)
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
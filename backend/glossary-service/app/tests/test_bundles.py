@@ -0,0 +1,223 @@
+"""
+Tests for prebuilt static glossary bundles: building, manifest updates and serving.
+"""
+
+import gzip
+import json
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+
+from app.api.v1.endpoints import bundles
+from mavito_common.bundles.builder import (
+    BUNDLE_PATH_PATTERN,
+    MANIFEST_PATH,
+    affected_bundle_keys,
+    rebuild_all_bundles,
+    rebuild_bundles,
+)
+from mavito_common.bundles.store import (
+    IMMUTABLE_CACHE_CONTROL,
+    BundleConflict,
+    LocalBundleStore,
+)
+from mavito_common.core.config import settings
+from mavito_common.models.term import Term, refresh_translation_maps, term_translations
+from mavito_common.models.user import User
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "GLOSSARY_BUNDLE_STORE", "local")
+    monkeypatch.setattr(settings, "GLOSSARY_BUNDLE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "GLOSSARY_BUNDLE_BASE_URL", None)
+    bundles.bundle_store.cache_clear()
+    yield LocalBundleStore(str(tmp_path))
+    bundles.bundle_store.cache_clear()
+
+
+@pytest_asyncio.fixture
+async def terms(db_session):
+    owner = User(
+        first_name="Bundle",
+        last_name="Owner",
+        email="bundle-owner@example.com",
+        password_hash="x",
+    )
+    db_session.add(owner)
+    await db_session.flush()
+    english = Term(
+        term="mean",
+        definition="The average value.",
+        language="English",
+        domain="Statistics",
+        owner_id=owner.id,
+    )
+    afrikaans = Term(
+        term="gemiddelde",
+        definition="Die gemiddelde waarde.",
+        language="Afrikaans",
+        domain="Statistics",
+        owner_id=owner.id,
+    )
+    other = Term(
+        term="bias",
+        definition="Systematic error.",
+        language="English",
+        domain="Statistics/Probability",
+        owner_id=owner.id,
+    )
+    db_session.add_all([english, afrikaans, other])
+    await db_session.flush()
+    await db_session.execute(
+        insert(term_translations).values(
+            term_id=english.id, translation_id=afrikaans.id
+        )
+    )
+    await db_session.execute(refresh_translation_maps([english.id]))
+    await db_session.commit()
+    return {"english": english, "afrikaans": afrikaans, "other": other}
+
+
+@pytest.mark.asyncio
+async def test_rebuild_all_writes_bundles_and_manifest(db_session, terms, store):
+    manifest = await rebuild_all_bundles(db_session, store)
+
+    assert set(manifest["bundles"]) == {"Statistics", "Statistics/Probability"}
+    entry = manifest["bundles"]["Statistics"]["English"]
+    assert BUNDLE_PATH_PATTERN.match(entry["path"])
+    assert entry["path"].startswith("statistics/english.")
+    assert entry["terms"] == 1
+
+    payload = json.loads(gzip.decompress(store.read(entry["path"])))
+    assert payload["terms"][0]["term"] == "mean"
+    assert payload["terms"][0]["translations"] == {"Afrikaans": "gemiddelde"}
+    assert json.loads(store.read("manifest.json")) == manifest
+
+
+@pytest.mark.asyncio
+async def test_affected_keys_include_referrers(db_session, terms):
+    keys = await affected_bundle_keys(db_session, [terms["afrikaans"].id])
+    assert keys == {("Statistics", "Afrikaans"), ("Statistics", "English")}
+
+
+@pytest.mark.asyncio
+async def test_partial_rebuild_keeps_old_bundle_files(db_session, terms, store):
+    first = await rebuild_all_bundles(db_session, store)
+    old_path = first["bundles"]["Statistics"]["English"]["path"]
+    untouched = first["bundles"]["Statistics/Probability"]["English"]
+
+    terms["english"].definition = "The arithmetic average."
+    await db_session.commit()
+    second = await rebuild_bundles(db_session, store, [("Statistics", "English")])
+
+    new_path = second["bundles"]["Statistics"]["English"]["path"]
+    assert new_path != old_path
+    assert store.read(old_path) is not None
+    assert second["bundles"]["Statistics/Probability"]["English"] == untouched
+
+
+def test_conditional_write_detects_a_concurrent_writer(store):
+    options = dict(
+        content_type="application/json", content_encoding=None, cache_control=""
+    )
+    _, generation = store.read_with_generation(MANIFEST_PATH)
+    store.write(MANIFEST_PATH, b"{}", if_generation=generation, **options)
+
+    with pytest.raises(BundleConflict):
+        store.write(MANIFEST_PATH, b"[]", if_generation=generation, **options)
+    assert store.read(MANIFEST_PATH) == b"{}"
+
+
+@pytest.mark.asyncio
+async def test_rebuild_merges_a_manifest_written_by_another_instance(
+    db_session, terms, store
+):
+    await rebuild_all_bundles(db_session, store)
+    other = json.loads(store.read(MANIFEST_PATH))
+    other["bundles"]["Physics"] = {"English": {"path": "physics/english.x"}}
+    raced = []
+
+    class RacingStore(LocalBundleStore):
+        def write(self, path, data, **options):
+            # Another instance publishes its manifest between our read and write.
+            if path == MANIFEST_PATH and not raced:
+                raced.append(path)
+                super().write(
+                    path,
+                    json.dumps(other).encode(),
+                    content_type="application/json",
+                    content_encoding=None,
+                    cache_control="",
+                )
+            super().write(path, data, **options)
+
+    terms["english"].definition = "The arithmetic average."
+    await db_session.commit()
+    manifest = await rebuild_bundles(
+        db_session, RacingStore(str(store.root)), [("Statistics", "English")]
+    )
+
+    assert raced
+    assert manifest["bundles"]["Physics"] == other["bundles"]["Physics"]
+    assert json.loads(store.read(MANIFEST_PATH)) == manifest
+
+
+@pytest.mark.asyncio
+async def test_serves_manifest_and_immutable_bundle(client, db_session, terms, store):
+    await rebuild_all_bundles(db_session, store)
+
+    response = await client.get("/api/v1/glossary/bundles/manifest.json")
+    assert response.status_code == 200
+    assert "must-revalidate" in response.headers["cache-control"]
+    path = response.json()["bundles"]["Statistics"]["English"]["path"]
+
+    bundle = await client.get(
+        f"/api/v1/glossary/bundles/{path}", headers={"Accept-Encoding": "gzip"}
+    )
+    assert bundle.status_code == 200
+    assert bundle.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert bundle.headers["content-encoding"] == "gzip"
+    assert bundle.json()["terms"][0]["term"] == "mean"
+
+    cached = await client.get(
+        f"/api/v1/glossary/bundles/{path}",
+        headers={"If-None-Match": bundle.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+    plain = await client.get(
+        f"/api/v1/glossary/bundles/{path}", headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == bundle.json()
+
+
+@pytest.mark.asyncio
+async def test_bundle_redirects_to_public_store(client, store, monkeypatch):
+    monkeypatch.setattr(
+        settings, "GLOSSARY_BUNDLE_BASE_URL", "https://cdn.example.com/bundles/"
+    )
+    path = "statistics/english.0123456789abcdef.json.gz"
+
+    response = await client.get(f"/api/v1/glossary/bundles/{path}")
+    assert response.status_code == 307
+    assert response.headers["location"] == f"https://cdn.example.com/bundles/{path}"
+
+
+@pytest.mark.asyncio
+async def test_rejects_unknown_bundle_paths(client, store):
+    for path in ("../secret.json.gz", "statistics/english.json", "missing"):
+        response = await client.get(f"/api/v1/glossary/bundles/{path}")
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bundles_disabled_by_default(client, monkeypatch):
+    monkeypatch.setattr(settings, "GLOSSARY_BUNDLE_STORE", "")
+    bundles.bundle_store.cache_clear()
+
+    response = await client.get("/api/v1/glossary/bundles/manifest.json")
+    assert response.status_code == 404
+    bundles.bundle_store.cache_clear()
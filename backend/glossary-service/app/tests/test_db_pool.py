@@ -0,0 +1,58 @@
+"""
+Tests for the shared engine's pool configuration and metrics.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from mavito_common.core.config import settings
+from mavito_common.db import session
+from mavito_common.db.session import InstrumentedQueuePool, engine_options
+
+
+def test_engine_options_follow_settings():
+    config = settings.model_copy(
+        update={
+            "DB_POOL_SIZE": 7,
+            "DB_MAX_OVERFLOW": 3,
+            "DB_STATEMENT_CACHE_SIZE": 250,
+            "DB_STATEMENT_TIMEOUT_MS": 5000,
+            "DB_PGBOUNCER_MODE": False,
+        }
+    )
+    options = engine_options(config)
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == 3
+    assert options["connect_args"]["statement_cache_size"] == 250
+    assert options["connect_args"]["server_settings"] == {"statement_timeout": "5000"}
+
+
+def test_pgbouncer_mode_disables_prepared_statement_caches():
+    config = settings.model_copy(
+        update={"DB_PGBOUNCER_MODE": True, "DB_STATEMENT_TIMEOUT_MS": 5000}
+    )
+    connect_args = engine_options(config)["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert "server_settings" not in connect_args
+    first = connect_args["prepared_statement_name_func"]()
+    assert first != connect_args["prepared_statement_name_func"]()
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_record_checkouts(client):
+    session.pool_stats.reset()
+    async with session.engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert session.pool_metrics()["checked_out"] == 1
+
+    response = await client.get("/health/db")
+    pool = response.json()["pool"]
+    assert pool["checked_out"] == 0
+    assert pool["checkouts"] >= 1
+    assert pool["wait_seconds_max"] >= 0
+    assert pool["overflow"] == 0
+    await session.engine.dispose()
@@ -66,7 +66,7 @@ class TestGlossaryIntegration:
         mock_term.definition = "The process of analyzing data"
         mock_term.domain = "Statistics/Probability"  # Storage format with slash
         mock_term.language = "English"
-        mock_term.translations = []
+        mock_term.translation_map = {}
 
         # Mock the ORM query result
         mock_scalars = MagicMock()
@@ -102,16 +102,11 @@ class TestGlossaryIntegration:
         mock_term.term = "Hello"
         mock_term.definition = "A greeting"
 
-        # Mock translations
-        mock_translation_es = MagicMock()
-        mock_translation_es.language = "Spanish"
-        mock_translation_es.term = "Hola"
-
-        mock_translation_fr = MagicMock()
-        mock_translation_fr.language = "French"
-        mock_translation_fr.term = "Bonjour"
-
-        mock_term.translations = [mock_translation_es, mock_translation_fr]
+        # Mock translation pivot
+        mock_term.translation_map = {
+            "Spanish": {"id": str(uuid.uuid4()), "term": "Hola"},
+            "French": {"id": str(uuid.uuid4()), "term": "Bonjour"},
+        }
 
         # Mock the database query result
         mock_scalars = MagicMock()
@@ -145,7 +140,7 @@ class TestGlossaryIntegration:
         mock_term = MagicMock()
         mock_term.term = "Hello"
         mock_term.definition = "A greeting"
-        mock_term.translations = []  # No translations
+        mock_term.translation_map = {}  # No translations
 
         # Mock the database query result
         mock_scalars = MagicMock()
@@ -206,16 +201,11 @@ class TestGlossaryIntegration:
         mock_term.domain = "Statistics"
         mock_term.language = "English"
 
-        # Mock translations
-        mock_translation_es = MagicMock()
-        mock_translation_es.language = "Spanish"
-        mock_translation_es.term = "Análisis Estadístico"
-
-        mock_translation_fr = MagicMock()
-        mock_translation_fr.language = "French"
-        mock_translation_fr.term = "Analyse Statistique"
-
-        mock_term.translations = [mock_translation_es, mock_translation_fr]
+        # Mock translation pivot
+        mock_term.translation_map = {
+            "Spanish": {"id": str(uuid.uuid4()), "term": "Análisis Estadístico"},
+            "French": {"id": str(uuid.uuid4()), "term": "Analyse Statistique"},
+        }
 
         # Mock the ORM query result
         mock_scalars = MagicMock()
@@ -275,7 +265,7 @@ class TestGlossaryIntegration:
         mock_term.definition = "The process of analyzing data"
         mock_term.domain = "Statistics"
         mock_term.language = "English"
-        mock_term.translations = []
+        mock_term.translation_map = {}
 
         mock_fallback_scalars = MagicMock()
         mock_fallback_scalars.all.return_value = [mock_term]
@@ -315,7 +305,7 @@ class TestGlossaryIntegration:
         mock_term.definition = "The process of analyzing data"
         mock_term.domain = "Statistics"
         mock_term.language = "English"
-        mock_term.translations = []  # Mock empty translations list
+        mock_term.translation_map = {}  # Mock empty translations list
 
         # Set up mock for the ORM query (first call) - returns empty results
         mock_orm_scalars = MagicMock()
@@ -561,3 +551,64 @@ class TestGlossaryIntegration:
 
         # Check that db.execute was called the expected number of times
         assert mock_db.execute.call_count >= 4
+
+
+@pytest.mark.asyncio
+async def test_translation_map_pivot_read_by_category(db_session):
+    """The category view reads translations from the maintained pivot column."""
+    from app.api.v1.endpoints.glossary import get_terms_by_category
+    from mavito_common.models.term import (
+        Term,
+        refresh_translation_maps,
+        term_translations,
+    )
+    from mavito_common.models.user import User
+
+    owner = User(
+        first_name="Pivot",
+        last_name="Owner",
+        email="pivot@example.com",
+        password_hash="x",
+    )
+    db_session.add(owner)
+    await db_session.flush()
+
+    mean = Term(
+        term="mean",
+        definition="Average",
+        language="English",
+        domain="Statistics",
+        owner_id=owner.id,
+    )
+    gemiddeld = Term(
+        term="gemiddeld",
+        definition="Average",
+        language="Afrikaans",
+        domain="Statistics",
+        owner_id=owner.id,
+    )
+    db_session.add_all([mean, gemiddeld])
+    await db_session.flush()
+    await db_session.execute(
+        term_translations.insert().values(term_id=mean.id, translation_id=gemiddeld.id)
+    )
+    await db_session.execute(refresh_translation_maps([mean.id]))
+    await db_session.commit()
+    db_session.expire_all()
+
+    result = await get_terms_by_category(db_session, "Statistics")
+
+    by_term = {row["term"]: row for row in result}
+    assert by_term["mean"]["translations"] == {"Afrikaans": "gemiddeld"}
+    assert by_term["gemiddeld"]["translations"] == {}
+
+    # Renaming the translation refreshes every pivot that embeds it.
+    gemiddeld.term = "gemiddelde"
+    await db_session.flush()
+    await db_session.execute(refresh_translation_maps([gemiddeld.id]))
+    await db_session.commit()
+    db_session.expire_all()
+
+    result = await get_terms_by_category(db_session, "Statistics")
+    by_term = {row["term"]: row for row in result}
+    assert by_term["mean"]["translations"] == {"Afrikaans": "gemiddelde"}
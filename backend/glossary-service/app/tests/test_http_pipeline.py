@@ -0,0 +1,194 @@
+"""
+Tests for the glossary response pipeline: compression, ETags, 304 handling
+and pre-encoded response bodies.
+"""
+
+from typing import Dict, List
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints.glossary import category_bodies, catalog_version
+from mavito_common.http import compression
+from mavito_common.http.compression import CompressionMiddleware, choose_encoding
+from mavito_common.http.conditional import etag_matches, make_etag, matching_etag
+from mavito_common.http.responses import EncodedResponseCache, JSONSerializer
+from mavito_common.models.data_version import TERMS_DATA_VERSION, bump_data_version
+from mavito_common.models.term import Term
+from mavito_common.models.user import User
+
+
+@pytest_asyncio.fixture
+async def seeded_db(db_session):
+    """A test database with one category large enough to be compressed."""
+    catalog_version.invalidate()
+    category_bodies.clear()
+    owner = User(
+        first_name="Glossary",
+        last_name="Owner",
+        email="glossary-owner@example.com",
+        password_hash="x",
+    )
+    db_session.add(owner)
+    await db_session.flush()
+    db_session.add_all(
+        Term(
+            term=f"term {i}",
+            definition="A repetitive statistical definition " * 4,
+            language="English",
+            domain="Statistics",
+            owner_id=owner.id,
+        )
+        for i in range(40)
+    )
+    await db_session.execute(bump_data_version(TERMS_DATA_VERSION))
+    await db_session.commit()
+    yield db_session
+    catalog_version.invalidate()
+    category_bodies.clear()
+
+
+@pytest.mark.asyncio
+async def test_etag_and_not_modified(client, seeded_db):
+    response = await client.get("/api/v1/glossary/categories")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('"v1-')
+    assert "must-revalidate" in response.headers["cache-control"]
+
+    cached = await client.get(
+        "/api/v1/glossary/categories", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_with_data_version(client, seeded_db):
+    first = await client.get("/api/v1/glossary/categories")
+
+    await seeded_db.execute(bump_data_version(TERMS_DATA_VERSION))
+    await seeded_db.commit()
+    catalog_version.invalidate()
+
+    second = await client.get(
+        "/api/v1/glossary/categories",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_large_category_is_gzipped(client, seeded_db):
+    response = await client.get(
+        "/api/v1/glossary/categories/Statistics/terms",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()) == 40
+
+    # The encoded ETag still validates the cached copy.
+    cached = await client.get(
+        "/api/v1/glossary/categories/Statistics/terms",
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": response.headers["etag"],
+        },
+    )
+    assert cached.status_code == 304
+    # The 304 confirms the gzip representation, so it carries that ETag.
+    assert cached.headers["etag"] == response.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_category_listing_is_served_from_encoded_cache(client, seeded_db):
+    path = "/api/v1/glossary/categories/Statistics/terms"
+    first = await client.get(path)
+    hits = category_bodies.hits
+
+    second = await client.get(path)
+    assert category_bodies.hits == hits + 1
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["content-type"] == "application/json"
+
+    # A new data version means a new ETag, so the old body is not reused.
+    await seeded_db.execute(bump_data_version(TERMS_DATA_VERSION))
+    await seeded_db.commit()
+    catalog_version.invalidate()
+    third = await client.get(path)
+    assert category_bodies.hits == hits + 1
+    assert third.headers["etag"] != first.headers["etag"]
+
+
+def test_encoded_response_cache_evicts_least_recently_used():
+    cache = EncodedResponseCache("test", max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    assert cache.get("a") == b"1"
+    cache.set("c", b"3")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+
+
+def test_json_serializer_encodes_without_validation():
+    serializer = JSONSerializer(Dict[str, List[int]])
+    assert serializer.encode({"a": [1, 2]}) == b'{"a":[1,2]}'
+    response = serializer.response({"a": []}, headers={"ETag": '"v1"'})
+    assert response.body == b'{"a":[]}'
+    assert response.headers["etag"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_random_terms_are_not_tagged(client, seeded_db):
+    response = await client.get("/api/v1/glossary/random")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_small_responses_are_not_compressed():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    response = TestClient(app).get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"ok": True}
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("gzip", "gzip"),
+        ("gzip;q=0", None),
+        ("identity", None),
+        ("deflate, gzip;q=0.5", "gzip"),
+        ("*", "gzip" if compression.brotli is None else "br"),
+    ],
+)
+def test_choose_encoding(header, expected):
+    assert choose_encoding(header) == expected
+
+
+def test_etag_matching():
+    etag = make_etag(3, "/api/v1/glossary/categories", "")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'W/{etag}, "other"', etag)
+    assert etag_matches(etag[:-1] + '-br"', etag)
+    assert matching_etag(f'"other", W/{etag[:-1]}-br"', etag) == etag[:-1] + '-br"'
+    assert matching_etag("*", etag) == etag
+    assert matching_etag('"other"', etag) is None
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
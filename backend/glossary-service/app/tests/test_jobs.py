@@ -0,0 +1,184 @@
+"""
+Tests for the shared Postgres job queue and its in-memory counterpart.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from mavito_common.jobs import queue as jobs
+from mavito_common.jobs.queue import InMemoryJobQueue, PostgresJobQueue, job
+from mavito_common.jobs.worker import run_worker
+from mavito_common.models.job import Job, JobStatus
+
+calls = []
+
+
+@job("test.record")
+async def record(db, payload):
+    calls.append(payload)
+    await db.execute(text("INSERT INTO job_effects VALUES (:n)"), {"n": payload["n"]})
+    if payload.get("fail"):
+        raise RuntimeError("boom")
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def effects_table(db_session):
+    calls.clear()
+    await db_session.execute(text("CREATE TABLE job_effects (n int)"))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_idempotent_and_claims_skip_locked_rows(db_session):
+    queue = PostgresJobQueue()
+    for n in range(3):
+        await queue.enqueue(db_session, "test.record", {"n": n})
+    await queue.enqueue(db_session, "test.record", {"n": 9}, idempotency_key="k")
+    await queue.enqueue(db_session, "test.record", {"n": 9}, idempotency_key="k")
+    await db_session.commit()
+
+    sessions = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+    async with sessions() as first, sessions() as second:
+        # The first transaction still holds its row locks while the second claims.
+        locked = await first.execute(
+            select(Job.id).order_by(Job.id).limit(2).with_for_update()
+        )
+        locked_ids = set(locked.scalars())
+        claimed = await queue.claim(second, "test", limit=10)
+        await first.rollback()
+
+    assert {j.id for j in claimed}.isdisjoint(locked_ids)
+    assert len(claimed) == 2
+    assert all(j.status == "running" and j.attempts == 1 for j in claimed)
+
+
+@pytest.mark.asyncio
+async def test_run_commits_handler_work_with_completion(db_session):
+    queue = PostgresJobQueue()
+    await queue.enqueue(db_session, "test.record", {"n": 1})
+    await db_session.commit()
+    sessions = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+
+    async with sessions() as db:
+        [claimed] = await queue.claim(db, "test", limit=10)
+    assert await queue.run(claimed, sessions)
+
+    async with sessions() as db:
+        assert (await db.get(Job, claimed.id)).status == JobStatus.DONE.value
+        assert (await db.execute(text("SELECT n FROM job_effects"))).scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_later_then_given_up(db_session):
+    queue = PostgresJobQueue()
+    await queue.enqueue(
+        db_session, "test.record", {"n": 1, "fail": True}, max_attempts=2
+    )
+    await db_session.commit()
+    sessions = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+
+    async with sessions() as db:
+        [claimed] = await queue.claim(db, "test", limit=10)
+    assert not await queue.run(claimed, sessions)
+
+    async with sessions() as db:
+        retried = await db.get(Job, claimed.id)
+        assert retried.status == JobStatus.QUEUED.value
+        assert "boom" in retried.last_error
+        assert (await db.execute(select(Job.run_at > func.now()))).scalar()
+        # Not due yet, so nothing to claim.
+        assert await queue.claim(db, "test", limit=10) == []
+        # The handler's partial work was rolled back.
+        count = await db.execute(text("SELECT count(*) FROM job_effects"))
+        assert count.scalar() == 0
+        await db.execute(text("UPDATE jobs SET run_at = now()"))
+        await db.commit()
+        [claimed] = await queue.claim(db, "test", limit=10)
+
+    assert not await queue.run(claimed, sessions)
+    async with sessions() as db:
+        assert (await db.get(Job, claimed.id)).status == JobStatus.FAILED.value
+
+
+@pytest.mark.asyncio
+async def test_in_memory_queue_runs_pending_jobs(db_session, monkeypatch):
+    memory = InMemoryJobQueue()
+    monkeypatch.setattr(jobs, "job_queue", memory)
+
+    await jobs.get_job_queue().enqueue(db_session, "test.record", {"n": 1})
+    await jobs.get_job_queue().enqueue(
+        db_session, "test.record", {"n": 2}, idempotency_key="once"
+    )
+    await jobs.get_job_queue().enqueue(
+        db_session, "test.record", {"n": 2}, idempotency_key="once"
+    )
+    assert len(memory.pending("test.record")) == 2
+
+    assert await memory.run_pending(db_session) == 2
+    assert calls == [{"n": 1}, {"n": 2}]
+    assert memory.pending() == []
+
+
+@pytest.mark.asyncio
+async def test_worker_drains_a_queue(db_session):
+    queue = PostgresJobQueue()
+    for n in range(3):
+        await queue.enqueue(db_session, "test.record", {"n": n})
+    await queue.enqueue(db_session, "other.record", {"n": 9})
+    await db_session.commit()
+    sessions = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+
+    assert await run_worker(["test"], session_factory=sessions, once=True) == 3
+    assert sorted(call["n"] for call in calls) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_orphaned_job_on_its_last_attempt_is_failed_not_reclaimed(db_session):
+    queue = PostgresJobQueue()
+    await queue.enqueue(db_session, "test.record", {"n": 1}, max_attempts=2)
+    await queue.enqueue(db_session, "test.record", {"n": 2}, max_attempts=2)
+    await db_session.commit()
+    # Both workers died mid-run long ago; one job still has an attempt left.
+    await db_session.execute(
+        text(
+            "UPDATE jobs SET status = 'running', locked_at = now() - interval '1 day',"
+            " attempts = CASE WHEN payload->>'n' = '1' THEN 1 ELSE 2 END"
+        )
+    )
+    await db_session.commit()
+
+    [reclaimed] = await queue.claim(db_session, "test", limit=10)
+    assert reclaimed.payload == {"n": 1} and reclaimed.attempts == 2
+
+    rows = await db_session.execute(
+        select(Job.payload["n"].as_integer(), Job.status, Job.finished_at.is_not(None))
+        .order_by(Job.id)
+        .execution_options(populate_existing=True)
+    )
+    assert rows.all() == [(1, "running", False), (2, "failed", True)]
+
+
+@pytest.mark.asyncio
+async def test_worker_purges_finished_jobs_past_retention(db_session):
+    queue = PostgresJobQueue()
+    for n in range(3):
+        await queue.enqueue(db_session, "test.record", {"n": n})
+    await db_session.commit()
+    await db_session.execute(
+        text(
+            "UPDATE jobs SET status = CASE n WHEN 0 THEN 'done' WHEN 1 THEN 'failed'"
+            " ELSE 'queued' END, finished_at = now() - interval '8 days'"
+            " FROM (SELECT id, (payload->>'n')::int AS n FROM jobs) AS p"
+            " WHERE jobs.id = p.id"
+        )
+    )
+    await db_session.commit()
+    sessions = async_sessionmaker(bind=db_session.bind, expire_on_commit=False)
+
+    await run_worker(["other"], session_factory=sessions, retention_days=7, once=True)
+
+    async with sessions() as db:
+        left = await db.execute(select(Job.status))
+        assert left.scalars().all() == ["queued"]
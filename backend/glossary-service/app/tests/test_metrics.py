@@ -0,0 +1,80 @@
+"""
+Tests for the shared observability middleware and /metrics endpoint.
+"""
+
+import logging
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport
+from sqlalchemy import text
+
+from mavito_common.db.session import get_db
+from mavito_common.observability.metrics import Registry
+from mavito_common.observability.middleware import (
+    LATENCY,
+    REQUEST_QUERIES,
+    install_observability,
+)
+
+
+def test_registry_renders_prometheus_text():
+    registry = Registry()
+    requests = registry.counter("requests_total", "Requests.", ("route",))
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    requests.inc(route='/a"b')
+    latency.observe(0.05)
+    latency.observe(2.0)
+
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{route="/a\\"b"} 1',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 1',
+        'latency_seconds_bucket{le="+Inf"} 2',
+        "latency_seconds_sum 2.05",
+        "latency_seconds_count 2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_route_templates_and_queries(client):
+    response = await client.get("/api/v1/glossary/categories")
+    assert response.status_code == 200
+
+    metrics = await client.get("/metrics")
+    assert metrics.headers["content-type"].startswith("text/plain")
+    body = metrics.text
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/glossary/categories",'
+        'status="200"}' in body
+    )
+    assert "db_pool_checked_out" in body
+    assert 'cache_hit_ratio{cache="data_version:' in body
+    assert REQUEST_QUERIES.count(route="/api/v1/glossary/categories") >= 1
+
+
+@pytest.mark.asyncio
+async def test_query_budget_logs_n_plus_one_routes(db_session, caplog):
+    app = FastAPI()
+    install_observability(app, query_budget=2)
+
+    @app.get("/items/{item_id}")
+    async def items(item_id: int, db=Depends(get_db)):
+        for _ in range(3):
+            await db.execute(text("SELECT 1"))
+        return {}
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    async with httpx.AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        with caplog.at_level(logging.WARNING):
+            await client.get("/items/1")
+
+    assert "GET /items/{item_id} ran 3 SQL statements (budget 2" in caplog.text
+    assert LATENCY.count(method="GET", route="/items/{item_id}") == 1
@@ -0,0 +1,101 @@
+"""
+Tests for read-replica routing and read-your-writes stickiness.
+"""
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from mavito_common.db import replicas as replica_module
+from mavito_common.db import session
+from mavito_common.core.config import settings
+from mavito_common.db.replicas import (
+    ReplicaSet,
+    get_read_db,
+    get_replicas,
+    request_routing,
+)
+from mavito_common.http.read_your_writes import COOKIE_NAME, ReadYourWritesMiddleware
+
+DEAD_REPLICA_URL = "postgresql+asyncpg://nobody:x@127.0.0.1:1/nowhere"
+
+
+@pytest_asyncio.fixture
+async def primary_engine():
+    """The shared engine, disposed afterwards so no connection outlives the loop."""
+    yield session.engine
+    await session.engine.dispose()
+
+
+def test_round_robin_skips_replicas_marked_down():
+    now = [0.0]
+    engines = [create_async_engine(DEAD_REPLICA_URL) for _ in range(3)]
+    replica_set = ReplicaSet(engines, retry_seconds=30, clock=lambda: now[0])
+    first, second, third = replica_set.replicas
+
+    assert replica_set.candidates() == [first, second, third]
+    assert replica_set.candidates() == [second, third, first]
+
+    replica_set.mark_down(third)
+    assert replica_set.candidates() == [first, second]
+    now[0] = 30.0
+    assert third in replica_set.candidates()
+
+
+def test_replica_engines_are_created_on_first_use(monkeypatch):
+    monkeypatch.setattr(settings, "DB_READ_REPLICA_URLS_LIST", [DEAD_REPLICA_URL])
+    monkeypatch.setattr(replica_module, "_replicas", None)
+
+    replica_set = get_replicas()
+    assert [r.engine.url.port for r in replica_set.replicas] == [1]
+    assert get_replicas() is replica_set
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_falls_back_to_primary(client, monkeypatch):
+    replica_set = ReplicaSet([create_async_engine(DEAD_REPLICA_URL)])
+    monkeypatch.setattr(replica_module, "_replicas", replica_set)
+
+    response = await client.get("/api/v1/glossary/categories")
+    assert response.status_code == 200
+
+    health = await client.get("/health/db")
+    assert health.json()["replicas"][0]["healthy"] is False
+
+
+@pytest.mark.asyncio
+async def test_write_pins_following_reads_to_primary(primary_engine, monkeypatch):
+    replica_set = ReplicaSet([create_async_engine(DEAD_REPLICA_URL)])
+    monkeypatch.setattr(replica_module, "_replicas", replica_set)
+
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=5)
+
+    @app.post("/write")
+    async def write():
+        async with primary_engine.begin() as conn:
+            await conn.execute(text("SELECT 1"))
+        return {"prefer_primary": request_routing.get().prefer_primary}
+
+    @app.get("/read")
+    async def read(db=Depends(get_read_db)):
+        return {"primary": db.bind is primary_engine}
+
+    async with httpx.AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post("/write")
+        assert response.json() == {"prefer_primary": False}
+        assert COOKIE_NAME in response.cookies
+
+        # The replica is never tried while the client is pinned.
+        assert (await client.get("/read")).json() == {"primary": True}
+        assert replica_set.replicas[0].down_until == 0.0
+
+        client.cookies.clear()
+        assert (await client.get("/read")).json() == {"primary": True}
+        assert replica_set.replicas[0].down_until > 0.0
@@ -0,0 +1,105 @@
+# glossary-service/scripts/bench_json.py
+"""
+Micro-benchmark of the ways a category listing can be turned into a response
+body, over the mock terminology dataset. It needs the service's DB settings
+to import but never connects:
+
+    python scripts/bench_json.py [--repeat 50]
+
+Rows are shaped like get_terms_by_category's output, with translations for
+every language in the dataset.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+import uuid
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../mavito-common-lib"))
+)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from app.api.v1.endpoints.glossary import CategoryTerm, category_terms  # noqa: E402
+from mavito_common.http.responses import (  # noqa: E402
+    EncodedResponseCache,
+    ORJSONResponse,
+)
+
+DATASET = os.path.join(
+    os.path.dirname(__file__),
+    "../../Mock_Data/multilingual_statistical_terminology_clean.json",
+)
+LANGUAGES = {
+    "afr": "Afrikaans",
+    "nde": "Ndebele",
+    "xho": "Xhosa",
+    "zul": "Zulu",
+    "nso": "Northern Sotho",
+    "sot": "Sotho",
+    "tsn": "Tswana",
+    "ssw": "Swazi",
+    "ven": "Venda",
+    "tso": "Tsonga",
+}
+
+
+def load_rows():
+    with open(DATASET, encoding="utf-8") as f:
+        entries = json.load(f)
+    rows = []
+    for entry in entries:
+        entry = {key.strip(): value for key, value in entry.items()}
+        rows.append(
+            {
+                "id": str(uuid.uuid4()),
+                "term": entry["eng term"],
+                "definition": entry["eng definition"],
+                "category": entry["category"],
+                "language": "English",
+                "translations": {
+                    language: entry[f"{code} term"]
+                    for code, language in LANGUAGES.items()
+                    if entry.get(f"{code} term")
+                },
+            }
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = load_rows()
+    typed = TypeAdapter(list[CategoryTerm])
+    cache = EncodedResponseCache("bench")
+    cache.set("etag", category_terms.encode(rows))
+
+    cases = {
+        # What FastAPI does for a route returning untyped dicts.
+        "jsonable_encoder + json": lambda: JSONResponse(jsonable_encoder(rows)),
+        "jsonable_encoder + orjson": lambda: ORJSONResponse(jsonable_encoder(rows)),
+        # What FastAPI does for a route with a response model.
+        "validate + dump_json": lambda: typed.dump_json(typed.validate_python(rows)),
+        "JSONSerializer.encode": lambda: category_terms.encode(rows),
+        "EncodedResponseCache hit": lambda: cache.get("etag"),
+    }
+
+    size = len(category_terms.encode(rows))
+    print(f"{len(rows)} terms, {size / 1024:.0f} KiB encoded, {args.repeat} runs")
+    baseline = None
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print(f"{name:<28} {seconds * 1000:9.3f} ms  {baseline / seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
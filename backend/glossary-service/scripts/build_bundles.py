@@ -0,0 +1,34 @@
+# glossary-service/scripts/build_bundles.py
+"""
+Builds every static glossary bundle and a fresh manifest into the store
+selected by GLOSSARY_BUNDLE_STORE. Run once after ingesting data; afterwards
+term-addition-service keeps the bundles current on each admin approval.
+"""
+import asyncio
+import os
+import sys
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../mavito-common-lib"))
+)
+
+from mavito_common.bundles.builder import rebuild_all_bundles  # noqa: E402
+from mavito_common.bundles.store import get_bundle_store  # noqa: E402
+from mavito_common.db.session import get_sessionmaker  # noqa: E402
+
+
+async def main():
+    store = get_bundle_store()
+    if store is None:
+        print("GLOSSARY_BUNDLE_STORE is not set; nothing to build.")
+        return
+
+    async with get_sessionmaker()() as db:
+        manifest = await rebuild_all_bundles(db, store)
+
+    count = sum(len(languages) for languages in manifest["bundles"].values())
+    print(f"Built {count} bundles at data version {manifest['data_version']}.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -11,7 +11,8 @@ sys.path.append(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "../../mavito-common-lib"))
 )
 
-from mavito_common.models.term import Term
+from mavito_common.models.term import Term, build_translation_map
+from mavito_common.models.data_version import TERMS_DATA_VERSION, bump_data_version
 from mavito_common.db.base_class import Base
 
 # --- CONFIGURATION ---
@@ -100,10 +101,14 @@ def main():
                 term_obj.translations = [
                     t for t in created_terms if t.id != term_obj.id
                 ]
+                term_obj.translation_map = build_translation_map(term_obj.translations)
 
         # Add to the session
         db.add_all(created_terms)
 
+    # Invalidate cached glossary responses (ETags derive from this version)
+    db.execute(bump_data_version(TERMS_DATA_VERSION))
+
     print("Committing all new terms to the database...")
     db.commit()
     db.close()
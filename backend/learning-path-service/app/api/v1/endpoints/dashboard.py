@@ -18,7 +18,7 @@ class LanguageProgress(BaseModel):
 
 @router.get("/dashboard", response_model=List[LanguageProgress])
 async def get_learning_dashboard(
-    db: deps.AsyncSession = Depends(deps.get_db),
+    db: deps.AsyncSession = Depends(deps.get_read_db),
     current_user: UserSchema = Depends(deps.get_current_active_user),
 ):
     """
@@ -23,7 +23,7 @@ class GlossaryProgress(BaseModel):
 )
 async def get_glossary_progress_for_language(
     language_name: str,
-    db: deps.AsyncSession = Depends(deps.get_db),
+    db: deps.AsyncSession = Depends(deps.get_read_db),
     current_user: UserSchema = Depends(deps.get_current_active_user),
 ):
     """
@@ -17,7 +17,7 @@ router = APIRouter()
     summary="Get all learning paths for the current user",
 )
 async def get_user_learning_paths(
-    db: deps.AsyncSession = Depends(deps.get_db),
+    db: deps.AsyncSession = Depends(deps.get_read_db),
     current_user: UserSchema = Depends(deps.get_current_active_user),
 ):
     """
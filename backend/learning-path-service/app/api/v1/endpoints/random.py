@@ -16,7 +16,7 @@ router = APIRouter()
 )
 async def get_random_terms(
     language_name: str,
-    db: deps.AsyncSession = Depends(deps.get_db),
+    db: deps.AsyncSession = Depends(deps.get_read_db),
 ):
     """
     Retrieves a list of random terms for a given language.
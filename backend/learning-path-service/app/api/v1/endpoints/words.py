@@ -18,7 +18,7 @@ router = APIRouter()
 async def get_words_for_study_session(
     language_name: str,
     glossary_name: str,
-    db: deps.AsyncSession = Depends(deps.get_db),
+    db: deps.AsyncSession = Depends(deps.get_read_db),
     current_user: UserSchema = Depends(deps.get_current_active_user),
 ):
     """
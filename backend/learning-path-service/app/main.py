@@ -1,6 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
+from mavito_common.http import health
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
+from mavito_common.http.read_your_writes import install_read_your_writes
 
 # 1. Import ALL endpoint routers for the service
 from app.api.v1.endpoints import (
@@ -15,7 +19,10 @@ from app.api.v1.endpoints import (
 )
 
 # Initialize the FastAPI app
-app = FastAPI(title="Mavito Learning Service")
+app = FastAPI(title="Mavito Learning Service", lifespan=service_lifespan)
+
+# Pin a client's reads to the primary briefly after it writes
+install_read_your_writes(app)
 
 # Apply CORS middleware
 if settings.BACKEND_CORS_ORIGINS_LIST:
@@ -46,6 +53,8 @@ app.include_router(word_counts.router, prefix="/api/v1/learning", tags=["Word Co
 app.include_router(
     session_progress.router, prefix="/api/v1/learning", tags=["Session Progress"]
 )
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
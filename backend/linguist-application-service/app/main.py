@@ -1,9 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
+from mavito_common.http import health
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
 from app.api.v1.endpoints import applications
 
-app = FastAPI(title="Marito Linguist Application Service", redirect_slashes=False)
+app = FastAPI(
+    title="Marito Linguist Application Service",
+    redirect_slashes=False,
+    lifespan=service_lifespan,
+)
 
 
 if settings.BACKEND_CORS_ORIGINS_LIST:
@@ -20,6 +27,8 @@ app.include_router(
     prefix="/api/v1/linguist-applications",
     tags=["Linguist Applications"],
 )
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
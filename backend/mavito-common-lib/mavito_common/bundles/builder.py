@@ -0,0 +1,225 @@
+# mavito-common-lib/mavito_common/bundles/builder.py
+import asyncio
+import gzip
+import hashlib
+import json
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.bundles.store import (
+    IMMUTABLE_CACHE_CONTROL,
+    MANIFEST_CACHE_CONTROL,
+    BundleConflict,
+    BundleStore,
+)
+from mavito_common.models.data_version import TERMS_DATA_VERSION, select_data_version
+from mavito_common.models.term import Term, term_translations
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+MANIFEST_PATH = "manifest.json"
+# Bundle files are named <domain-slug>/<language-slug>.<sha256[:16]>.json.gz
+BUNDLE_PATH_PATTERN = re.compile(r"^[a-z0-9-]+/[a-z0-9-]+\.[0-9a-f]{16}\.json\.gz$")
+
+BundleKey = Tuple[str, str]  # (domain, language)
+
+# Manifest writes are compare-and-swap against the generation that was read;
+# a writer that loses re-reads the manifest and merges its changes again.
+MANIFEST_WRITE_ATTEMPTS = 5
+
+# Serialises rebuilds within a process so they do not conflict with each other.
+_manifest_lock = asyncio.Lock()
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-") or "none"
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def bundle_path(domain: str, language: str, digest: str) -> str:
+    return f"{_slug(domain)}/{_slug(language)}.{digest}.json.gz"
+
+
+def encode_bundle(domain: str, language: str, rows: Iterable[Any]) -> Tuple[bytes, str]:
+    """
+    Serialises one (domain, language) bundle in the shape of the glossary
+    category endpoint. Returns the gzipped bytes and the content digest of the
+    uncompressed JSON, so identical content always maps to the same file.
+    """
+    payload = {
+        "domain": domain,
+        "language": language,
+        "terms": [
+            {
+                "id": str(row.id),
+                "term": row.term,
+                "definition": row.definition,
+                "category": row.domain,
+                "language": row.language,
+                "translations": {
+                    lang: entry["term"]
+                    for lang, entry in (row.translation_map or {}).items()
+                },
+            }
+            for row in rows
+        ],
+    }
+    raw = _dumps(payload)
+    digest = hashlib.sha256(raw).hexdigest()[:16]
+    # mtime=0 keeps the compressed bytes reproducible for the same content.
+    return gzip.compress(raw, compresslevel=9, mtime=0), digest
+
+
+def _empty_manifest() -> Dict[str, Any]:
+    return {"data_version": 0, "generated_at": None, "bundles": {}}
+
+
+def read_manifest(store: BundleStore) -> Dict[str, Any]:
+    return _read_manifest(store)[0]
+
+
+def _read_manifest(store: BundleStore) -> Tuple[Dict[str, Any], str]:
+    data, generation = store.read_with_generation(MANIFEST_PATH)
+    return (json.loads(data) if data else _empty_manifest()), generation
+
+
+def _merge_manifest(
+    manifest: Dict[str, Any],
+    changes: Dict[BundleKey, Optional[Dict[str, Any]]],
+    data_version: int,
+) -> Dict[str, Any]:
+    """Applies rebuilt entries (None for a bundle with no terms left)."""
+    bundles: Dict[str, Dict[str, Any]] = manifest["bundles"]
+    for (domain, language), entry in changes.items():
+        entries = bundles.setdefault(domain, {})
+        if entry is None:
+            entries.pop(language, None)
+        else:
+            entries[language] = entry
+        if not entries:
+            del bundles[domain]
+    # Another writer may have published a newer version in the meantime.
+    manifest["data_version"] = max(manifest["data_version"], data_version)
+    manifest["generated_at"] = datetime.now(timezone.utc).isoformat()
+    return manifest
+
+
+async def affected_bundle_keys(
+    db: AsyncSession, term_ids: Iterable[Any]
+) -> Set[BundleKey]:
+    """
+    Returns the bundles that embed any of ``term_ids``: the terms' own
+    (domain, language) and those of every term listing them as a translation.
+    """
+    ids = list(term_ids)
+    if not ids:
+        return set()
+    referrers = select(term_translations.c.term_id).where(
+        term_translations.c.translation_id.in_(ids)
+    )
+    result = await db.execute(
+        select(Term.domain, Term.language)
+        .where(or_(Term.id.in_(ids), Term.id.in_(referrers)))
+        .distinct()
+    )
+    return {(domain, language) for domain, language in result.all()}
+
+
+async def rebuild_bundles(
+    db: AsyncSession,
+    store: BundleStore,
+    keys: Iterable[BundleKey],
+    *,
+    full: bool = False,
+) -> Dict[str, Any]:
+    """
+    Regenerates the given bundles and publishes a new manifest. Bundles are
+    written before the manifest that points at them, and superseded files are
+    left in place so clients holding an older manifest keep working. With
+    ``full`` the manifest is rebuilt from scratch rather than updated. The
+    manifest is replaced only if nobody else wrote it since it was read, so
+    concurrent rebuilds in other processes never drop each other's entries.
+    """
+    async with _manifest_lock:
+        manifest, generation = await asyncio.to_thread(_read_manifest, store)
+        changes: Dict[BundleKey, Optional[Dict[str, Any]]] = {}
+
+        for domain, language in sorted(set(keys)):
+            result = await db.execute(
+                select(
+                    Term.id,
+                    Term.term,
+                    Term.definition,
+                    Term.domain,
+                    Term.language,
+                    Term.translation_map,
+                )
+                .where(Term.domain == domain, Term.language == language)
+                .order_by(Term.term)
+            )
+            rows = result.all()
+            if not rows:
+                changes[(domain, language)] = None
+                continue
+
+            data, digest = encode_bundle(domain, language, rows)
+            path = bundle_path(domain, language, digest)
+            current = manifest["bundles"].get(domain, {}).get(language)
+            if current is None or current["path"] != path:
+                await asyncio.to_thread(
+                    store.write,
+                    path,
+                    data,
+                    content_type="application/json",
+                    content_encoding="gzip",
+                    cache_control=IMMUTABLE_CACHE_CONTROL,
+                )
+            changes[(domain, language)] = {
+                "path": path,
+                "sha256": digest,
+                "terms": len(rows),
+                "bytes": len(data),
+            }
+
+        version = await db.execute(select_data_version(TERMS_DATA_VERSION))
+        data_version = version.scalar_one_or_none() or 0
+        for attempt in range(MANIFEST_WRITE_ATTEMPTS):
+            if attempt:
+                manifest, generation = await asyncio.to_thread(_read_manifest, store)
+            base = _empty_manifest() if full else manifest
+            updated = _merge_manifest(base, changes, data_version)
+            try:
+                await asyncio.to_thread(
+                    store.write,
+                    MANIFEST_PATH,
+                    _dumps(updated),
+                    content_type="application/json",
+                    content_encoding=None,
+                    cache_control=MANIFEST_CACHE_CONTROL,
+                    if_generation=generation,
+                )
+            except BundleConflict:
+                continue
+            return updated
+        raise BundleConflict(
+            f"{MANIFEST_PATH} changed on each of {MANIFEST_WRITE_ATTEMPTS} attempts"
+        )
+
+
+async def rebuild_all_bundles(db: AsyncSession, store: BundleStore) -> Dict[str, Any]:
+    """Regenerates every (domain, language) bundle and a fresh manifest."""
+    result = await db.execute(select(Term.domain, Term.language).distinct())
+    keys: List[BundleKey] = [(domain, language) for domain, language in result.all()]
+    return await rebuild_bundles(db, store, keys, full=True)
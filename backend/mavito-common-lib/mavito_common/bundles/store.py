@@ -0,0 +1,176 @@
+# mavito-common-lib/mavito_common/bundles/store.py
+import fcntl
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Protocol, Tuple
+
+from mavito_common.core.config import settings
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MANIFEST_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+# The generation of a path that does not exist.
+MISSING_GENERATION = "0"
+
+
+class BundleConflict(Exception):
+    """A conditional write found the file changed since it was read."""
+
+
+class BundleStore(Protocol):
+    """
+    Blocking key/value storage for bundle files; call it off the event loop.
+    ``read_with_generation`` returns an opaque generation that changes with
+    every write; passing it back as ``if_generation`` makes the write a
+    compare-and-swap that raises BundleConflict if another writer got there
+    first.
+    """
+
+    def read(self, path: str) -> Optional[bytes]: ...
+
+    def read_with_generation(self, path: str) -> Tuple[Optional[bytes], str]: ...
+
+    def write(
+        self,
+        path: str,
+        data: bytes,
+        *,
+        content_type: str,
+        content_encoding: Optional[str],
+        cache_control: str,
+        if_generation: Optional[str] = None,
+    ) -> None: ...
+
+
+class LocalBundleStore:
+    """
+    Stores bundles in a directory; each write is an atomic rename. A file's
+    generation is the digest of its content, and conditional writes hold an
+    exclusive lock on a sibling lock file while they compare and rename.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.root = Path(directory).resolve()
+
+    def _resolve(self, path: str) -> Path:
+        target = (self.root / path).resolve()
+        if self.root not in target.parents:
+            raise ValueError(f"Bundle path escapes the store: {path}")
+        return target
+
+    def read(self, path: str) -> Optional[bytes]:
+        try:
+            return self._resolve(path).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def read_with_generation(self, path: str) -> Tuple[Optional[bytes], str]:
+        data = self.read(path)
+        return data, _generation(data)
+
+    def write(
+        self,
+        path: str,
+        data: bytes,
+        *,
+        content_type: str,
+        content_encoding: Optional[str],
+        cache_control: str,
+        if_generation: Optional[str] = None,
+    ) -> None:
+        target = self._resolve(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if if_generation is None:
+            self._replace(target, data)
+            return
+        lock_path = target.with_name(f".lock-{target.name}")
+        with open(lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if _generation(self.read(path)) != if_generation:
+                raise BundleConflict(path)
+            self._replace(target, data)
+
+    def _replace(self, target: Path, data: bytes) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_name, target)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+
+def _generation(data: Optional[bytes]) -> str:
+    if data is None:
+        return MISSING_GENERATION
+    return hashlib.sha256(data).hexdigest()
+
+
+class GCSBundleStore:
+    """Stores bundles as objects under ``prefix`` in a Cloud Storage bucket."""
+
+    def __init__(self, bucket_name: str, prefix: str) -> None:
+        from google.cloud import storage  # optional dependency
+
+        self.bucket = storage.Client().bucket(bucket_name)
+        self.prefix = prefix.strip("/")
+
+    def _name(self, path: str) -> str:
+        return f"{self.prefix}/{path}" if self.prefix else path
+
+    def read(self, path: str) -> Optional[bytes]:
+        blob = self.bucket.blob(self._name(path))
+        if not blob.exists():
+            return None
+        # Keep the stored (compressed) bytes; we serve Content-Encoding ourselves.
+        return blob.download_as_bytes(raw_download=True)
+
+    def read_with_generation(self, path: str) -> Tuple[Optional[bytes], str]:
+        from google.api_core.exceptions import NotFound
+
+        blob = self.bucket.blob(self._name(path))
+        try:
+            data = blob.download_as_bytes(raw_download=True)
+        except NotFound:
+            return None, MISSING_GENERATION
+        # The download sets the generation of the bytes it returned.
+        return data, str(blob.generation)
+
+    def write(
+        self,
+        path: str,
+        data: bytes,
+        *,
+        content_type: str,
+        content_encoding: Optional[str],
+        cache_control: str,
+        if_generation: Optional[str] = None,
+    ) -> None:
+        from google.api_core.exceptions import PreconditionFailed
+
+        blob = self.bucket.blob(self._name(path))
+        blob.cache_control = cache_control
+        blob.content_encoding = content_encoding
+        # Generation 0 makes GCS accept the upload only if the object is new.
+        condition = (
+            {} if if_generation is None else {"if_generation_match": int(if_generation)}
+        )
+        try:
+            blob.upload_from_string(data, content_type=content_type, **condition)
+        except PreconditionFailed:
+            raise BundleConflict(path)
+
+
+def get_bundle_store() -> Optional[BundleStore]:
+    """Builds the store selected by GLOSSARY_BUNDLE_STORE, or None if disabled."""
+    backend = settings.GLOSSARY_BUNDLE_STORE.strip().lower()
+    if not backend:
+        return None
+    if backend == "local":
+        return LocalBundleStore(settings.GLOSSARY_BUNDLE_DIR)
+    if backend == "gcs":
+        return GCSBundleStore(settings.GCS_BUCKET_NAME, settings.GLOSSARY_BUNDLE_PREFIX)
+    raise ValueError(f"Unknown GLOSSARY_BUNDLE_STORE: {settings.GLOSSARY_BUNDLE_STORE}")
@@ -0,0 +1,190 @@
+# mavito-common-lib/mavito_common/core/auth.py
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import jwt
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.core.config import settings
+from mavito_common.http.conditional import DataVersionCache
+from mavito_common.models.data_version import AUTH_DATA_VERSION, bump_data_version
+from mavito_common.models.user import User
+from mavito_common.observability.metrics import register_cache
+from mavito_common.schemas.token import Principal
+
+# User fields whose change must invalidate principals embedded in tokens.
+REVOKING_FIELDS = frozenset({"email", "role", "is_active", "account_locked"})
+
+
+class InvalidTokenError(Exception):
+    """The bearer token is malformed, has a bad signature or lacks a subject."""
+
+
+class ExpiredTokenError(InvalidTokenError):
+    """The bearer token is well formed but past its expiry."""
+
+
+class UnknownPrincipalError(Exception):
+    """The token is valid but its subject no longer exists."""
+
+
+class PrincipalCache:
+    """
+    Bounded LRU of authenticated principals keyed by token ``(sub, iat)``.
+    Entries expire after ``ttl_seconds`` and the whole cache is dropped when
+    the auth revocation version moves.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._revocation: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync_revocation(self, version: int) -> None:
+        if version != self._revocation:
+            self._entries.clear()
+            self._revocation = version
+
+    def get(self, key: Hashable) -> Optional[Principal]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        principal, expires_at = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return principal
+
+    def put(self, key: Hashable, principal: Principal) -> None:
+        self._entries[key] = (principal, self._clock() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._revocation = None
+
+
+revocation_version = DataVersionCache(
+    AUTH_DATA_VERSION, ttl_seconds=settings.AUTH_REVOCATION_CHECK_SECONDS
+)
+principal_cache = PrincipalCache(
+    maxsize=settings.AUTH_PRINCIPAL_CACHE_SIZE,
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+)
+register_cache("principal", principal_cache)
+
+
+async def token_claims(db: AsyncSession, user: Any) -> Dict[str, Any]:
+    """
+    Builds the access-token claims for ``user``: the subject plus the fields
+    services need to authorise requests without loading the user row.
+    """
+    return {
+        "sub": user.email,
+        "uid": str(user.id),
+        "role": user.role.value if user.role else None,
+        "active": bool(user.is_active),
+        "locked": bool(user.account_locked),
+        "rv": await revocation_version.get(db),
+    }
+
+
+async def revoke_principals(db: AsyncSession) -> None:
+    """
+    Bumps the auth revocation version so every service stops trusting claims
+    minted before this point. Execute before committing the user change.
+    """
+    await db.execute(bump_data_version(AUTH_DATA_VERSION))
+    revocation_version.invalidate()
+    principal_cache.clear()
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    try:
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+    except jwt.ExpiredSignatureError as e:
+        raise ExpiredTokenError(str(e)) from e
+    except jwt.PyJWTError as e:
+        raise InvalidTokenError(str(e)) from e
+    if not payload.get("sub"):
+        raise InvalidTokenError("Token subject missing")
+    return payload
+
+
+def _principal_from_claims(payload: Dict[str, Any]) -> Optional[Principal]:
+    try:
+        return Principal(
+            id=payload["uid"],
+            email=payload["sub"],
+            role=payload["role"],
+            is_active=payload["active"],
+            account_locked=payload["locked"],
+        )
+    except (KeyError, ValidationError):
+        return None
+
+
+async def _load_principal(db: AsyncSession, email: str) -> Optional[Principal]:
+    result = await db.execute(
+        select(
+            User.id,
+            User.email,
+            User.role,
+            User.is_active,
+            User.account_locked,
+            User.deleted_at,
+        ).where(User.email == email)
+    )
+    row = result.one_or_none()
+    return Principal.model_validate(row) if row else None
+
+
+async def authenticate(db: AsyncSession, token: str) -> Principal:
+    """
+    Resolves a bearer token to a Principal. Cached principals and tokens whose
+    claims were minted under the current revocation version need no user
+    lookup; older or claim-less tokens fall back to a single narrow select.
+    The revocation version itself is re-read at most every
+    AUTH_REVOCATION_CHECK_SECONDS.
+    """
+    payload = decode_token(token)
+    current = await revocation_version.get(db)
+    principal_cache.sync_revocation(current)
+
+    key = (payload["sub"], payload.get("iat"))
+    principal = principal_cache.get(key)
+    if principal is not None:
+        return principal
+
+    if payload.get("rv") == current:
+        principal = _principal_from_claims(payload)
+    if principal is None:
+        principal = await _load_principal(db, payload["sub"])
+    if principal is None:
+        raise UnknownPrincipalError(payload["sub"])
+
+    principal_cache.put(key, principal)
+    return principal
@@ -19,6 +19,12 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "!!!CONFIG_ERROR_SECRET_KEY_NOT_SET!!!"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
+    # --- Principal cache (see mavito_common.core.auth) ---
+    AUTH_PRINCIPAL_CACHE_SIZE: int = 10_000
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_REVOCATION_CHECK_SECONDS: float = 5.0
+    # bcrypt worker threads per process; defaults to the CPU count.
+    PASSWORD_HASH_WORKERS: Optional[int] = None
 
     # --- Base Database Connection Fields ---
     DB_USER: Optional[str] = None
@@ -28,6 +34,96 @@ class Settings(BaseSettings):
     DB_PORT: Optional[str] = None
     INSTANCE_CONNECTION_NAME: Optional[str] = None
     GCS_BUCKET_NAME: str = "marito_bucket"
+    # --- Connection pool (per service process) ---
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    # Recycling below the server/proxy idle timeout makes pre-ping unnecessary.
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    # asyncpg prepared statements cached per connection.
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    # Transaction-pooling pgbouncer: disables prepared statement caching and
+    # startup parameters (set statement_timeout on the database role instead).
+    DB_PGBOUNCER_MODE: bool = False
+    # --- Read replicas (see mavito_common.db.replicas) ---
+    # Comma-separated SQLAlchemy URLs; empty sends all reads to the primary.
+    DB_READ_REPLICA_URLS: str = ""
+    DB_READ_REPLICA_URLS_LIST: List[str] = []
+    # How long a replica that failed to connect is skipped.
+    DB_REPLICA_RETRY_SECONDS: float = 30.0
+    # After a client commits a write, route its reads to the primary for this
+    # long so it sees its own writes despite replica lag. 0 disables it.
+    DB_READ_YOUR_WRITES_SECONDS: float = 0.0
+    # --- Observability (see mavito_common.observability) ---
+    # Log requests that run more SQL statements than this; 0 disables it.
+    OBSERVABILITY_QUERY_BUDGET: int = 0
+    # --- Background jobs (see mavito_common.jobs) ---
+    # "postgres" (the jobs table, run by the service's job worker; see
+    # docker-compose.yml) or "memory" (tests only: nothing runs its jobs).
+    JOB_QUEUE_BACKEND: str = "postgres"
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 5.0
+    # Running jobs locked longer than this are assumed orphaned and re-run.
+    JOB_LOCK_TIMEOUT_SECONDS: int = 300
+    JOB_WORKER_BATCH_SIZE: int = 10
+    JOB_WORKER_POLL_SECONDS: float = 1.0
+    # Workers delete done and failed jobs older than this; 0 keeps them.
+    JOB_RETENTION_DAYS: int = 7
+    # --- Internal HTTP client (see mavito_common.http.client) ---
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 10.0
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_TARGET: int = 20
+    HTTP_CLIENT_MAX_KEEPALIVE_PER_TARGET: int = 10
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    # Extra attempts for idempotent requests, with jittered exponential backoff.
+    HTTP_CLIENT_RETRIES: int = 2
+    HTTP_CLIENT_RETRY_BACKOFF_SECONDS: float = 0.1
+    # Consecutive failures that open a target's circuit, and how long it stays open.
+    HTTP_CLIENT_BREAKER_FAILURES: int = 5
+    HTTP_CLIENT_BREAKER_RESET_SECONDS: float = 30.0
+    # Negotiated over TLS when the h2 package is installed.
+    HTTP_CLIENT_HTTP2: bool = True
+    # --- Static glossary bundles ---
+    # "local" writes to GLOSSARY_BUNDLE_DIR, "gcs" to GCS_BUCKET_NAME under
+    # GLOSSARY_BUNDLE_PREFIX; empty disables bundle generation.
+    GLOSSARY_BUNDLE_STORE: str = ""
+    GLOSSARY_BUNDLE_DIR: str = "/tmp/glossary-bundles"
+    GLOSSARY_BUNDLE_PREFIX: str = "glossary-bundles"
+    # Public base URL of the bundle store; glossary-service redirects to it.
+    GLOSSARY_BUNDLE_BASE_URL: Optional[str] = None
+    # --- Comment moderation (see comment-service app.services.moderation) ---
+    # "inline" screens comments before saving them; "deferred" publishes them
+    # at once and screens them on the "comments" job queue, so comment-worker
+    # must be running.
+    COMMENT_MODERATION_MODE: str = "inline"
+    # Concurrent submissions are screened together, up to this many per
+    # model call, waiting at most this long for a batch to fill.
+    COMMENT_MODERATION_BATCH_SIZE: int = 32
+    COMMENT_MODERATION_BATCH_DELAY_SECONDS: float = 0.005
+    # Verdicts remembered by content hash.
+    COMMENT_MODERATION_CACHE_SIZE: int = 4096
+    # --- Vote totals (see vote-service app.services.vote_buffer) ---
+    # Buffer changes to term and comment vote totals in memory and write them
+    # in one batch per interval, instead of locking the target row per vote.
+    VOTE_WRITE_BEHIND: bool = False
+    VOTE_FLUSH_INTERVAL_SECONDS: float = 0.05
+    # Bulk "my votes" lookups, cached per user until the user votes again or
+    # the entry is this old (other users' votes move the totals).
+    VOTE_LOOKUP_CACHE_USERS: int = 10_000
+    VOTE_LOOKUP_CACHE_TTL_SECONDS: float = 5.0
+    # --- Term event stream (see mavito_common.http.term_stream) ---
+    # LISTEN needs a session-pooled connection; set this when
+    # SQLALCHEMY_DATABASE_URL points at a transaction-pooling PgBouncer.
+    TERM_STREAM_DATABASE_URL: Optional[str] = None
+    # Events for one client are gathered this long and sent together.
+    TERM_STREAM_COALESCE_SECONDS: float = 0.25
+    TERM_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    TERM_STREAM_MAX_SUBSCRIBERS: int = 10_000
+    # --- Achievement catalog (see gamification-service achievement_catalog) ---
+    # Reload interval for the in-process copy of the active achievements.
+    ACHIEVEMENT_CATALOG_TTL_SECONDS: float = 60.0
     # --- Base CORS Settings ---
     BACKEND_CORS_ORIGINS: str = ""
     BACKEND_CORS_ORIGINS_LIST: List[str] = []
@@ -71,6 +167,12 @@ class Settings(BaseSettings):
 
         data["SQLALCHEMY_DATABASE_URL"] = db_url
 
+        # --- Parse read replica URLs ---
+        raw_replicas = data.get("DB_READ_REPLICA_URLS", "")
+        data["DB_READ_REPLICA_URLS_LIST"] = [
+            url.strip() for url in raw_replicas.split(",") if url.strip()
+        ]
+
         # --- Parse CORS origins ---
         raw_origins = data.get("BACKEND_CORS_ORIGINS", "")
         if raw_origins:
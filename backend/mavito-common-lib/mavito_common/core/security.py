@@ -1,14 +1,33 @@
 # app/core/security.py
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
 from passlib.context import CryptContext
 import jwt
 from mavito_common.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Stored for accounts that never log in with a password (guests, Google
+# sign-ins). It is not a valid bcrypt hash, so no password can match it.
+UNUSABLE_PASSWORD = "!"
+
+T = TypeVar("T")
+
+
+def is_password_usable(hashed_password: Optional[str]) -> bool:
+    if not hashed_password:
+        return False
+    return not hashed_password.startswith(UNUSABLE_PASSWORD)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if not is_password_usable(hashed_password):
+        return False
     return pwd_context.verify(plain_password, hashed_password)
 
 
@@ -16,6 +35,81 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded thread pool so hashing never blocks the event
+    loop. bcrypt releases the GIL while it works, so throughput scales with
+    the number of workers; calls beyond that wait in the executor queue.
+    """
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.queued = 0
+            self.in_flight = 0
+            self.completed = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="bcrypt"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        submitted = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+
+        def call() -> T:
+            waited = time.perf_counter() - submitted
+            with self._lock:
+                self.queued -= 1
+                self.in_flight += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+                    self.completed += 1
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queued": self.queued,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    if not is_password_usable(hashed_password):
+        return False
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hasher.run(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
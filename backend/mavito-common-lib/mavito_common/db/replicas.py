@@ -0,0 +1,176 @@
+# mavito-common-lib/mavito_common/db/replicas.py
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from mavito_common.core.config import settings
+from mavito_common.db import session as primary
+from mavito_common.db.session import engine_options, get_db
+
+logger = logging.getLogger(__name__)
+
+
+class RequestRouting:
+    """Per-request routing state shared by the middleware and the sessions."""
+
+    __slots__ = ("prefer_primary", "wrote")
+
+    def __init__(self, prefer_primary: bool = False) -> None:
+        self.prefer_primary = prefer_primary
+        self.wrote = False
+
+
+# Set by ReadYourWritesMiddleware; None outside a routed request.
+request_routing: ContextVar[Optional[RequestRouting]] = ContextVar(
+    "request_routing", default=None
+)
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.sessionmaker = async_sessionmaker(
+            bind=engine, autoflush=False, expire_on_commit=False
+        )
+        self.down_until = 0.0
+
+
+class ReplicaSet:
+    """
+    Round-robin over the configured read replicas. A replica that fails to
+    connect is skipped for ``retry_seconds`` before it is tried again.
+    """
+
+    def __init__(
+        self,
+        engines: List[AsyncEngine],
+        retry_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.replicas = [Replica(engine) for engine in engines]
+        self.retry_seconds = retry_seconds
+        self._clock = clock
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def candidates(self) -> List[Replica]:
+        """Healthy replicas, starting from the next one in rotation."""
+        if not self.replicas:
+            return []
+        start = self._next % len(self.replicas)
+        self._next = start + 1
+        now = self._clock()
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if replica.down_until <= now]
+
+    def mark_down(self, replica: Replica) -> None:
+        replica.down_until = self._clock() + self.retry_seconds
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def status(self) -> List[Dict[str, Any]]:
+        now = self._clock()
+        return [
+            {
+                "host": replica.engine.url.host,
+                "healthy": replica.down_until <= now,
+                "checked_out": replica.engine.pool.checkedout(),
+            }
+            for replica in self.replicas
+        ]
+
+
+_replicas: Optional[ReplicaSet] = None
+
+
+def get_replicas() -> ReplicaSet:
+    """
+    The configured replicas, created on first use (service_lifespan does it
+    at startup) so that importing this module does not build engines.
+    """
+    global _replicas
+    if _replicas is None:
+        _replicas = ReplicaSet(
+            [
+                create_async_engine(url, **engine_options(settings))
+                for url in settings.DB_READ_REPLICA_URLS_LIST
+            ],
+            retry_seconds=settings.DB_REPLICA_RETRY_SECONDS,
+        )
+    return _replicas
+
+
+async def dispose_replicas() -> None:
+    """Closes the replicas' pooled connections, if they were ever created."""
+    if _replicas is not None:
+        await _replicas.dispose()
+
+
+def __getattr__(name: str) -> Any:
+    # ``replicas`` used to be built at import time; it is now created on
+    # first access.
+    if name == "replicas":
+        return get_replicas()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@event.listens_for(Engine, "commit")
+def _note_primary_commit(conn: Any) -> None:
+    # Listens on the class because the primary engine is created lazily.
+    state = request_routing.get()
+    if state is not None and not state.wrote:
+        engine = primary.get_engine()
+        state.wrote = engine is not None and conn.engine is engine.sync_engine
+
+
+async def get_read_db(
+    db: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session for read-only endpoints. Uses a healthy replica when one is
+    configured, and the primary session otherwise: when no replica is up,
+    after this client's recent write (read-your-writes), or after a commit
+    earlier in the same request. Never write through this session.
+    """
+    replicas = get_replicas()
+    state = request_routing.get()
+    if not replicas or (state is not None and (state.prefer_primary or state.wrote)):
+        yield db
+        return
+
+    for replica in replicas.candidates():
+        read_db = replica.sessionmaker()
+        try:
+            await read_db.connection()
+        except (OSError, DBAPIError, asyncio.TimeoutError) as e:
+            logger.warning(
+                f"Read replica {replica.engine.url.host} unavailable, "
+                f"skipping for {replicas.retry_seconds}s: {e}"
+            )
+            replicas.mark_down(replica)
+            await read_db.close()
+            continue
+        try:
+            yield read_db
+        finally:
+            await read_db.close()
+        return
+
+    yield db
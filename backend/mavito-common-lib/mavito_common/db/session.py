@@ -1,61 +1,189 @@
 # app/db/session.py
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from mavito_common.core.config import settings
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from mavito_common.core.config import Settings, settings
 import logging
 
 logger = logging.getLogger(__name__)
-engine = None
-AsyncSessionLocal = None
+_engine: Optional[AsyncEngine] = None
+_sessionmaker: Optional[Callable[[], AsyncSession]] = None
+_engine_failed = False
+
+
+class PoolStats:
+    """Checkout wait statistics for this process's connection pool."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):  # type: ignore[no-untyped-def]
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        finally:
+            pool_stats.record_wait(time.perf_counter() - start)
+
+
+def engine_options(config: Settings) -> Dict[str, Any]:
+    """Builds create_async_engine keyword arguments from the DB_* settings."""
+    options: Dict[str, Any] = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": config.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+    if make_url(config.SQLALCHEMY_DATABASE_URL).get_driver_name() != "asyncpg":
+        return options
+
+    connect_args: Dict[str, Any] = {}
+    if config.DB_PGBOUNCER_MODE:
+        # Server-side prepared statements do not survive transaction pooling.
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = (
+            lambda: f"__asyncpg_{uuid.uuid4()}__"
+        )
+    else:
+        connect_args["statement_cache_size"] = config.DB_STATEMENT_CACHE_SIZE
+        connect_args["prepared_statement_cache_size"] = config.DB_STATEMENT_CACHE_SIZE
+        if config.DB_STATEMENT_TIMEOUT_MS:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(config.DB_STATEMENT_TIMEOUT_MS)
+            }
+    options["connect_args"] = connect_args
+    return options
 
-if settings.SQLALCHEMY_DATABASE_URL:
+
+def pool_metrics() -> Dict[str, Any]:
+    """Current pool occupancy plus checkout wait statistics."""
+    if _engine is None:
+        return {}
+    pool = _engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # QueuePool counts overflow from -pool_size until the pool is full.
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        **pool_stats.snapshot(),
+    }
+
+
+def _display_url(url: str) -> str:
+    return url.split("@")[-1] if "@" in url else url
+
+
+def get_engine() -> Optional[AsyncEngine]:
+    """
+    The shared engine, created on first use so that importing models or
+    services does not load the database driver. Returns None when the
+    database is not configured or the engine could not be created.
+    """
+    global _engine, _sessionmaker, _engine_failed
+    if _engine is not None or _engine_failed:
+        return _engine
+    if not settings.SQLALCHEMY_DATABASE_URL:
+        logger.critical(
+            "SQLALCHEMY_DATABASE_URL is not set after config initialization. Database functionality will be unavailable."
+        )
+        _engine_failed = True
+        return None
     try:
-        engine = create_async_engine(
+        _engine = create_async_engine(
             settings.SQLALCHEMY_DATABASE_URL,
-            pool_pre_ping=True,
+            **engine_options(settings),
             # echo=True, # Uncomment for SQL query debugging
         )
-        AsyncSessionLocal = sessionmaker(
-            bind=engine,
+        _sessionmaker = sessionmaker(
+            bind=_engine,
             class_=AsyncSession,
             autoflush=False,
             expire_on_commit=False,
             autocommit=False,
         )  # type: ignore[call-overload]
-        db_url_display = (
-            str(engine.url).split("@")[-1]
-            if "@" in str(engine.url)
-            else str(engine.url)
-        )
         logger.info(
-            f"Database engine initialized successfully for: ...@{db_url_display}"
+            f"Database engine initialized successfully for: ...@{_display_url(str(_engine.url))}"
         )
     except Exception as e:
-        db_url_display_err = (
-            settings.SQLALCHEMY_DATABASE_URL.split("@")[-1]
-            if "@" in settings.SQLALCHEMY_DATABASE_URL
-            else settings.SQLALCHEMY_DATABASE_URL
-        )
+        _engine_failed = True
         logger.error(
-            f"Failed to initialize database engine with URL ...@{db_url_display_err}: {e}",
+            f"Failed to initialize database engine with URL ...@{_display_url(settings.SQLALCHEMY_DATABASE_URL)}: {e}",
             exc_info=True,
         )
-else:
-    logger.critical(
-        "SQLALCHEMY_DATABASE_URL is not set after config initialization. Database functionality will be unavailable."
-    )
+    return _engine
 
 
-async def get_db():
-    if AsyncSessionLocal is None:
+def get_sessionmaker() -> Callable[[], AsyncSession]:
+    """The session factory bound to the shared engine."""
+    get_engine()
+    if _sessionmaker is None:
         logger.error(
             "AsyncSessionLocal is None. Database might not be configured or initialization failed."
         )
         raise RuntimeError(
             "Database session factory (AsyncSessionLocal) is not available."
         )
+    return _sessionmaker
+
+
+async def dispose_engine() -> None:
+    """Closes the shared engine's pooled connections, if it was ever created."""
+    if _engine is not None:
+        await _engine.dispose()
+
 
-    db = AsyncSessionLocal()
+def __getattr__(name: str) -> Any:
+    # ``engine`` and ``AsyncSessionLocal`` used to be created at import time;
+    # they remain readable as attributes but are now created on first access.
+    if name == "engine":
+        return get_engine()
+    if name == "AsyncSessionLocal":
+        get_engine()
+        return _sessionmaker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def get_db():
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
@@ -0,0 +1,226 @@
+# mavito-common-lib/mavito_common/http/client.py
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from mavito_common.core.config import settings
+from mavito_common.http.lifespan import on_shutdown
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # HTTP/2 needs the optional h2 package
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised without touching the network while a target's breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Opens after ``failure_threshold`` consecutive failures and rejects calls
+    for ``reset_seconds``. After that a single trial call is let through; its
+    outcome closes the breaker again or re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._clock() - self.opened_at < self.reset_seconds:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._trial_in_flight or self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Frees the trial slot of a call that ended without an outcome."""
+        self._trial_in_flight = False
+
+
+class InternalHTTPClient:
+    """
+    Process-wide HTTP client for service-to-service and third-party calls.
+    Keeps one pooled keep-alive ``httpx.AsyncClient`` per target origin, so
+    connection limits apply per target and warm connections are reused
+    across requests. Idempotent requests are retried with jittered
+    exponential backoff, and each target has its own circuit breaker.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+        connect_timeout: float = settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS,
+        max_connections: int = settings.HTTP_CLIENT_MAX_CONNECTIONS_PER_TARGET,
+        max_keepalive: int = settings.HTTP_CLIENT_MAX_KEEPALIVE_PER_TARGET,
+        keepalive_expiry: float = settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+        retries: int = settings.HTTP_CLIENT_RETRIES,
+        backoff_seconds: float = settings.HTTP_CLIENT_RETRY_BACKOFF_SECONDS,
+        breaker_failures: int = settings.HTTP_CLIENT_BREAKER_FAILURES,
+        breaker_reset_seconds: float = settings.HTTP_CLIENT_BREAKER_RESET_SECONDS,
+        http2: bool = settings.HTTP_CLIENT_HTTP2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.breaker_failures = breaker_failures
+        self.breaker_reset_seconds = breaker_reset_seconds
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._transport = transport
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def _target(self, url: str) -> str:
+        parsed = httpx.URL(url)
+        return f"{parsed.scheme}://{parsed.netloc.decode('ascii')}"
+
+    def _client_for(self, target: str) -> httpx.AsyncClient:
+        client = self._clients.get(target)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._transport,
+            )
+            self._clients[target] = client
+        return client
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        target = self._target(url)
+        breaker = self._breakers.get(target)
+        if breaker is None:
+            breaker = CircuitBreaker(self.breaker_failures, self.breaker_reset_seconds)
+            self._breakers[target] = breaker
+        return breaker
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Sends a request through the target's pooled client. ``retry``
+        defaults to True for idempotent methods only; pass it explicitly to
+        retry a POST that is safe to repeat.
+        """
+        method = method.upper()
+        if retry is None:
+            retry = method in IDEMPOTENT_METHODS
+        attempts = 1 + (self.retries if retry else 0)
+        target = self._target(url)
+        breaker = self.breaker(url)
+        client = self._client_for(target)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {target}")
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                breaker.record_failure()
+                if attempt >= attempts:
+                    raise
+                logger.warning(f"{method} {url} failed ({e!r}), retrying")
+            except Exception:
+                # Too many redirects, an undecodable body and the like: the
+                # target answered badly, so count it, but do not retry.
+                breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancelled: no verdict on the target, but a half-open trial
+                # must not hold the only slot forever.
+                breaker.release()
+                raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if attempt >= attempts:
+                    return response
+                await response.aclose()
+            # Full jitter keeps retries from many workers from synchronising.
+            await asyncio.sleep(
+                random.uniform(0, self.backoff_seconds * 2 ** (attempt - 1))
+            )
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            target: {"state": breaker.state, "failures": breaker.failures}
+            for target, breaker in self._breakers.items()
+        }
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+http_client = InternalHTTPClient()
+on_shutdown(http_client.aclose)
+
+
+def get_http_client() -> InternalHTTPClient:
+    """Dependency returning the shared client; override it in tests."""
+    return http_client
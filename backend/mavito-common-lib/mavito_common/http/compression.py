@@ -0,0 +1,181 @@
+# mavito-common-lib/mavito_common/http/compression.py
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is an optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "text/",
+)
+
+
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token.strip().lower()] = quality
+    return accepted
+
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows the given content-coding."""
+    accepted = _parse_accept_encoding(accept_encoding)
+    return accepted.get(encoding, accepted.get("*", 0.0)) > 0
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Picks the best supported content-coding from an Accept-Encoding header,
+    preferring brotli over gzip when both are acceptable.
+    """
+    accepted = _parse_accept_encoding(accept_encoding)
+    candidates: List[str] = ["br", "gzip"] if brotli is not None else ["gzip"]
+    wildcard = accepted.get("*", 0.0)
+    best: Optional[Tuple[float, str]] = None
+    for encoding in candidates:
+        quality = accepted.get(encoding, wildcard)
+        if quality > 0 and (best is None or quality > best[0]):
+            best = (quality, encoding)
+    return best[1] if best else None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._gz.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """
+    Compresses JSON/text responses with brotli or gzip once they exceed
+    ``minimum_size`` bytes. Strong ETags get an encoding suffix so each
+    representation keeps a distinct validator.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            send,
+            _Compressor(encoding, self.gzip_level, self.brotli_quality),
+            self.minimum_size,
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, compressor: _Compressor, minimum_size: int) -> None:
+        self._send = send
+        self.compressor = compressor
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.started = False
+        self.passthrough = False
+
+    def _eligible(self, headers: Headers) -> bool:
+        status = self.start_message["status"] if self.start_message else 200
+        if status < 200 or status in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _rewrite_headers(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.compressor.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and etag.startswith('"') and etag.endswith('"'):
+            headers["ETag"] = f'{etag[:-1]}-{self.compressor.encoding}"'
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            assert self.start_message is not None
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if not self._eligible(headers) or (
+                not more_body and len(body) < self.minimum_size
+            ):
+                self.passthrough = True
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+
+            self._rewrite_headers(headers)
+            if more_body:
+                del headers["Content-Length"]
+                payload = self.compressor.compress(body)
+            else:
+                payload = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(payload))
+            await self._send(self.start_message)
+            await self._send(
+                {"type": "http.response.body", "body": payload, "more_body": more_body}
+            )
+            return
+
+        payload = self.compressor.compress(body)
+        if not more_body:
+            payload += self.compressor.finish()
+        await self._send(
+            {"type": "http.response.body", "body": payload, "more_body": more_body}
+        )
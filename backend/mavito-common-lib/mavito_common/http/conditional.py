@@ -0,0 +1,139 @@
+# mavito-common-lib/mavito_common/http/conditional.py
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.db.session import get_db
+from mavito_common.models.data_version import select_data_version
+from mavito_common.observability.metrics import register_cache
+
+DEFAULT_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+# Suffixes CompressionMiddleware appends to a strong ETag per content-coding.
+ENCODING_SUFFIXES = ("-br", "-gzip")
+
+
+class NotModified(Exception):
+    """Raised by a conditional dependency when the client's copy is current."""
+
+    def __init__(self, etag: str, cache_control: str) -> None:
+        self.etag = etag
+        self.cache_control = cache_control
+
+
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return Response(
+        status_code=304, headers={"ETag": exc.etag, "Cache-Control": exc.cache_control}
+    )
+
+
+def make_etag(version: Any, *parts: Any) -> str:
+    """Builds a strong ETag from a data version and the request identity."""
+    digest = hashlib.sha1(
+        "\x1f".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()[:16]
+    return f'"v{version}-{digest}"'
+
+
+def _strip_encoding(tag: str) -> str:
+    for suffix in ENCODING_SUFFIXES:
+        if tag.endswith(suffix + '"'):
+            return tag[: -len(suffix) - 1] + '"'
+    return tag
+
+
+def matching_etag(if_none_match: Optional[str], etag: str) -> Optional[str]:
+    """
+    Evaluates an If-None-Match header against ``etag`` and returns the tag the
+    client holds, including any encoding suffix, or None if nothing matches.
+    Weak comparison is used, as RFC 9110 requires for If-None-Match, and
+    encoding suffixes are ignored. A 304 should carry the returned tag, since
+    that is the representation it confirms.
+    """
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if _strip_encoding(candidate) == etag:
+            return candidate
+    return None
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether If-None-Match matches ``etag``; see matching_etag."""
+    return matching_etag(if_none_match, etag) is not None
+
+
+class DataVersionCache:
+    """
+    Caches a ``data_versions`` row in-process for ``ttl_seconds`` so validating
+    a request usually costs no database round trip at all.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._version: Optional[int] = None
+        self._expires_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        register_cache(f"data_version:{name}", self)
+
+    async def get(self, db: AsyncSession) -> int:
+        now = self._clock()
+        if self._version is None or now >= self._expires_at:
+            self.misses += 1
+            result = await db.execute(select_data_version(self.name))
+            self._version = result.scalar_one_or_none() or 0
+            self._expires_at = now + self.ttl_seconds
+        else:
+            self.hits += 1
+        return self._version
+
+    def invalidate(self) -> None:
+        self._version = None
+
+
+def conditional_get(
+    versions: DataVersionCache,
+    cache_control: str = DEFAULT_CACHE_CONTROL,
+    db_dependency: Callable[..., Any] = get_db,
+) -> Callable[..., Awaitable[Optional[str]]]:
+    """
+    Returns a route dependency that tags GET/HEAD responses with a strong ETag
+    derived from the dataset version and answers a matching If-None-Match with
+    304 before the endpoint body runs. Pass the endpoints' own session
+    dependency as ``db_dependency`` so the version and the data come from the
+    same database. Register ``not_modified_handler`` for ``NotModified`` on
+    the app (``install_http_pipeline`` does this).
+    """
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(db_dependency),
+    ) -> Optional[str]:
+        if request.method not in ("GET", "HEAD"):
+            return None
+        version = await versions.get(db)
+        etag = make_etag(version, request.url.path, request.url.query)
+        matched = matching_etag(request.headers.get("if-none-match"), etag)
+        if matched is not None:
+            raise NotModified(matched, cache_control)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control
+        return etag
+
+    return dependency
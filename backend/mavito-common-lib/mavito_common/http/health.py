@@ -0,0 +1,15 @@
+# mavito-common-lib/mavito_common/http/health.py
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from mavito_common.db.replicas import get_replicas
+from mavito_common.db.session import pool_metrics
+
+router = APIRouter()
+
+
+@router.get("/health/db", tags=["Health Check"])
+async def database_pool_health() -> Dict[str, Any]:
+    """Connection pool occupancy, checkout wait times and replica health."""
+    return {"pool": pool_metrics(), "replicas": get_replicas().status()}
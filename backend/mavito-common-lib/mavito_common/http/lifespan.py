@@ -0,0 +1,49 @@
+# mavito-common-lib/mavito_common/http/lifespan.py
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Awaitable, Callable, List
+
+from fastapi import FastAPI
+
+from mavito_common.db.replicas import dispose_replicas, get_replicas
+from mavito_common.db.session import dispose_engine, get_engine
+
+Hook = Callable[[], Awaitable[None]]
+
+# Cleanups registered by shared resources that were actually imported.
+_shutdown_hooks: List[Hook] = []
+
+
+def on_shutdown(hook: Hook) -> Hook:
+    """Runs ``hook`` when any service_lifespan app shuts down."""
+    _shutdown_hooks.append(hook)
+    return hook
+
+
+def make_lifespan(
+    *on_startup: Hook,
+) -> Callable[[FastAPI], AsyncContextManager[None]]:
+    """
+    Builds a service lifespan. Startup creates the database engines, so
+    nothing pays for the driver at import time and the first request does
+    not either, then awaits ``on_startup`` in order. Shutdown closes pooled
+    database and HTTP connections.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        get_engine()
+        get_replicas()
+        for hook in on_startup:
+            await hook()
+        try:
+            yield
+        finally:
+            for hook in _shutdown_hooks:
+                await hook()
+            await dispose_replicas()
+            await dispose_engine()
+
+    return lifespan
+
+
+service_lifespan = make_lifespan()
@@ -0,0 +1,33 @@
+# mavito-common-lib/mavito_common/http/pagination.py
+"""
+Opaque cursors for keyset pagination. A cursor names the last row a client
+has seen by its sort key, typically ``(created_at, id)``; the next page is
+every row after it in sort order. Unlike offsets, pages stay cheap however
+deep the client goes and do not shift when rows are added in front.
+"""
+
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+Position = Tuple[datetime, uuid.UUID]
+
+
+class InvalidCursorError(ValueError):
+    """A cursor was not produced by encode_cursor."""
+
+
+def encode_cursor(position: Position) -> str:
+    posted_at, row_id = position
+    raw = f"{posted_at.isoformat()}|{row_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Position:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        posted_at, row_id = raw.decode("ascii").split("|")
+        return datetime.fromisoformat(posted_at), uuid.UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError(cursor) from e
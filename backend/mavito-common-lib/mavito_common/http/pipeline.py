@@ -0,0 +1,26 @@
+# mavito-common-lib/mavito_common/http/pipeline.py
+from fastapi import FastAPI
+
+from mavito_common.http.compression import CompressionMiddleware
+from mavito_common.http.conditional import NotModified, not_modified_handler
+
+
+def install_http_pipeline(
+    app: FastAPI,
+    *,
+    minimum_size: int = 1024,
+    gzip_level: int = 6,
+    brotli_quality: int = 4,
+) -> None:
+    """
+    Adds response compression and 304 handling for ``conditional_get``
+    dependencies to a service app. Create the app with
+    ``default_response_class=ORJSONResponse`` for fast JSON rendering.
+    """
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=minimum_size,
+        gzip_level=gzip_level,
+        brotli_quality=brotli_quality,
+    )
+    app.add_exception_handler(NotModified, not_modified_handler)
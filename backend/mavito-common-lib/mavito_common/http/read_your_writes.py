@@ -0,0 +1,70 @@
+# mavito-common-lib/mavito_common/http/read_your_writes.py
+import math
+import time
+from typing import Callable
+
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mavito_common.core.config import settings
+from mavito_common.db.replicas import RequestRouting, request_routing
+
+COOKIE_NAME = "mavito_primary_until"
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pins a client's reads to the primary for ``window_seconds`` after one of
+    its requests commits a write, so replica lag never hides its own changes.
+    The deadline travels in a cookie; values beyond the window are ignored.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        window_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.app = app
+        self.window_seconds = window_seconds
+        self._clock = clock
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        now = self._clock()
+        try:
+            until = float(HTTPConnection(scope).cookies.get(COOKIE_NAME, 0))
+        except ValueError:
+            until = 0.0
+        state = RequestRouting(prefer_primary=now < until <= now + self.window_seconds)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.wrote:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{COOKIE_NAME}={now + self.window_seconds:.3f}; "
+                    f"Max-Age={math.ceil(self.window_seconds)}; Path=/; "
+                    "HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        token = request_routing.set(state)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_routing.reset(token)
+
+
+def install_read_your_writes(app: FastAPI) -> None:
+    """Adds ReadYourWritesMiddleware when DB_READ_YOUR_WRITES_SECONDS is set."""
+    if settings.DB_READ_YOUR_WRITES_SECONDS > 0:
+        app.add_middleware(
+            ReadYourWritesMiddleware,
+            window_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+        )
@@ -0,0 +1,128 @@
+# mavito-common-lib/mavito_common/http/responses.py
+"""
+JSON responses that skip FastAPI's generic encoding.
+
+A route that returns plain dicts is run through ``jsonable_encoder`` and then
+the response class's encoder, which walks the payload twice in Python. Typed
+routes fare better, but still validate the value against the response model
+first. For large read endpoints, encode once with a ``JSONSerializer`` and
+return the bytes directly; keep encoded bodies in an ``EncodedResponseCache``
+to serve repeats without encoding at all.
+"""
+
+import json
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Mapping, Optional, Type, TypeVar
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from mavito_common.observability.metrics import register_cache
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+T = TypeVar("T")
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson when it is installed, falling back to the
+    stdlib encoder otherwise.
+
+    Note that making this an app's ``default_response_class`` also applies it
+    to routes with a response model, where FastAPI would otherwise encode with
+    pydantic-core directly; prefer it for services whose routes return dicts.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class EncodedJSONResponse(Response):
+    """A response whose body is JSON that was already encoded."""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: bytes,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        super().__init__(content, status_code=status_code, headers=headers)
+
+
+class JSONSerializer(Generic[T]):
+    """
+    Encodes values of one type straight to JSON bytes with pydantic-core,
+    without validating them first. ``T`` may be a model, a TypedDict or a
+    container of either, e.g. ``JSONSerializer(List[CommentResponse])``.
+    Build serializers once at import time; building the schema is the slow
+    part.
+    """
+
+    def __init__(self, type_: Type[T]) -> None:
+        self._adapter: TypeAdapter[T] = TypeAdapter(type_)
+
+    def encode(self, value: T) -> bytes:
+        return self._adapter.dump_json(value)
+
+    def response(
+        self,
+        value: T,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> EncodedJSONResponse:
+        """
+        Returning a Response bypasses headers set on the injected ``Response``
+        by dependencies such as ``conditional_get``; pass them on here.
+        """
+        return EncodedJSONResponse(
+            self.encode(value), status_code=status_code, headers=headers
+        )
+
+
+class EncodedResponseCache:
+    """
+    Least-recently-used cache of encoded response bodies. Key entries by
+    something that changes with the data, such as the ETag from
+    ``conditional_get``, so stale bodies are never served and simply age out.
+    """
+
+    def __init__(self, name: str, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        register_cache(f"encoded_response:{name}", self)
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return body
+
+    def set(self, key: Hashable, body: bytes) -> None:
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
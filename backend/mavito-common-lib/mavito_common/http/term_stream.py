@@ -0,0 +1,243 @@
+# mavito-common-lib/mavito_common/http/term_stream.py
+"""
+Live updates for a term page over server-sent events. Writers add a
+``pg_notify`` on the ``term_events`` channel to the statement or transaction
+that changes a term's votes or comments, so the event goes out exactly when
+the change commits. Each process holds one LISTEN connection and hands every
+event to the open streams for its term in memory: one notification reaches
+any number of clients without a query per client. Each stream gathers the
+events that arrive within TERM_STREAM_COALESCE_SECONDS and sends only the
+latest event per item, so a burst of votes costs a client one message.
+
+Events are JSON objects with ``type`` and ``term_id``:
+
+* ``term_votes``: ``upvotes``, ``downvotes``
+* ``comment_votes``: ``comment_id``, ``upvotes``, ``downvotes``
+* ``comment``: ``comment_id``, ``parent_id``, ``action`` (created, updated
+  or deleted)
+* ``reset``: the listener reconnected and events may have been missed;
+  refetch the page.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Optional, Set
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Text, cast, func, literal, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.core.config import settings
+from mavito_common.http.lifespan import on_shutdown
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "term_events"
+
+
+def term_event(term_id: Any, type_: str, **fields: Any) -> Any:
+    """
+    A ``pg_notify`` expression for one event. Field values may be SQL
+    expressions, so the event can be sent from a statement's RETURNING
+    clause with the values it just wrote.
+    """
+    pairs: List[Any] = [literal("type"), literal(type_)]
+    pairs += [literal("term_id"), term_id]
+    for name, value in fields.items():
+        pairs += [literal(name), value]
+    return func.pg_notify(CHANNEL, cast(func.json_build_object(*pairs), Text))
+
+
+async def publish_term_event(
+    db: AsyncSession, term_id: uuid.UUID, type_: str, **fields: Any
+) -> None:
+    """Queues an event that is sent when ``db`` commits."""
+    values = {name: _param(value) for name, value in fields.items()}
+    await db.execute(select(term_event(_param(term_id), type_, **values)))
+
+
+def _param(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        value = str(value)
+    # A bare NULL parameter has no type json_build_object can accept.
+    return literal(value, Text) if value is None else literal(value)
+
+
+class Subscription:
+    """One client's stream: the latest pending event per item."""
+
+    def __init__(self) -> None:
+        self._pending: Dict[Hashable, Dict[str, Any]] = {}
+        self._ready = asyncio.Event()
+
+    def push(self, event: Dict[str, Any]) -> None:
+        self._pending[(event["type"], event.get("comment_id"))] = event
+        self._ready.set()
+
+    async def next_batch(self, timeout: float, coalesce: float) -> List[Dict[str, Any]]:
+        """Waits up to ``timeout`` for events; [] if none came."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        await asyncio.sleep(coalesce)
+        self._ready.clear()
+        batch, self._pending = list(self._pending.values()), {}
+        return batch
+
+
+class TermEventHub:
+    """Fans out ``term_events`` notifications to the streams in this process."""
+
+    def __init__(self, dsn: Optional[str] = None) -> None:
+        self._dsn = dsn
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._connection: Any = None
+        self._lock = asyncio.Lock()
+        self._reconnect: Optional["asyncio.Task[None]"] = None
+        self.received = 0
+        self.delivered = 0
+
+    @property
+    def subscribers(self) -> int:
+        return sum(len(subs) for subs in self._subscriptions.values())
+
+    async def subscribe(self, term_id: uuid.UUID) -> Subscription:
+        await self._listen()
+        subscription = Subscription()
+        self._subscriptions[str(term_id)].add(subscription)
+        return subscription
+
+    def unsubscribe(self, term_id: uuid.UUID, subscription: Subscription) -> None:
+        key = str(term_id)
+        subs = self._subscriptions.get(key)
+        if subs is not None:
+            subs.discard(subscription)
+            if not subs:
+                del self._subscriptions[key]
+
+    def dispatch(self, payload: str) -> None:
+        self.received += 1
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed {CHANNEL} payload: {payload!r}")
+            return
+        for subscription in self._subscriptions.get(event.get("term_id"), ()):
+            subscription.push(event)
+            self.delivered += 1
+
+    async def _listen(self) -> None:
+        if self._connection is not None and not self._connection.is_closed():
+            return
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+            import asyncpg
+
+            connection = await asyncpg.connect(self._dsn or _listen_dsn())
+            await connection.add_listener(CHANNEL, self._on_notification)
+            connection.add_termination_listener(self._on_lost)
+            self._connection = connection
+
+    def _on_notification(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        self.dispatch(payload)
+
+    def _on_lost(self, connection: Any) -> None:
+        if connection is not self._connection:
+            return  # closed on purpose
+        self._connection = None
+        if self._subscriptions and self._reconnect is None:
+            self._reconnect = asyncio.get_running_loop().create_task(self._relisten())
+
+    async def _relisten(self) -> None:
+        delay = 0.5
+        try:
+            while self._subscriptions:
+                try:
+                    await self._listen()
+                except Exception:
+                    logger.warning(f"Reconnecting {CHANNEL} listener", exc_info=True)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 30.0)
+                    continue
+                for subs in self._subscriptions.values():
+                    for subscription in subs:
+                        subscription.push({"type": "reset"})
+                return
+        finally:
+            self._reconnect = None
+
+    async def close(self) -> None:
+        if self._reconnect is not None:
+            self._reconnect.cancel()
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            await connection.close()
+
+
+def _listen_dsn() -> str:
+    url = make_url(
+        settings.TERM_STREAM_DATABASE_URL or settings.SQLALCHEMY_DATABASE_URL
+    )
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+term_event_hub = TermEventHub()
+on_shutdown(term_event_hub.close)
+
+router = APIRouter(prefix="/api/v1/stream", tags=["Stream"])
+
+
+def _encode(event: Dict[str, Any]) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/terms/{term_id}")
+async def stream_term_events(term_id: uuid.UUID, request: Request) -> StreamingResponse:
+    """
+    Server-sent events for one term's votes and comments; see the module
+    docstring for the event types. Comments at heartbeat intervals keep idle
+    connections open through proxies.
+    """
+    if term_event_hub.subscribers >= settings.TERM_STREAM_MAX_SUBSCRIBERS:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many open streams",
+        )
+    try:
+        subscription = await term_event_hub.subscribe(term_id)
+    except Exception as e:
+        logger.error(f"Could not listen for {CHANNEL}: {e!r}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Live updates are unavailable",
+        )
+
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                batch = await subscription.next_batch(
+                    settings.TERM_STREAM_HEARTBEAT_SECONDS,
+                    settings.TERM_STREAM_COALESCE_SECONDS,
+                )
+                if not batch:
+                    yield ": keepalive\n\n"
+                for event in batch:
+                    yield _encode(event)
+        finally:
+            term_event_hub.unsubscribe(term_id, subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,275 @@
+# mavito-common-lib/mavito_common/jobs/queue.py
+import logging
+import random
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Set
+
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.core.config import settings
+from mavito_common.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[AsyncSession, Dict[str, Any]], Awaitable[None]]
+
+_handlers: Dict[str, JobHandler] = {}
+
+
+class UnknownJobError(LookupError):
+    """No handler is registered for a job name in this process."""
+
+
+def job(name: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    Registers ``handler(db, payload)`` for jobs called ``name``. Names are
+    ``"<queue>.<task>"``; a worker for a queue must import its handlers.
+    Jobs run at least once, so handlers must tolerate repeats. Work left
+    uncommitted is committed together with marking the job done.
+    """
+
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[name] = handler
+        return handler
+
+    return register
+
+
+def get_handler(name: str) -> JobHandler:
+    try:
+        return _handlers[name]
+    except KeyError:
+        raise UnknownJobError(name) from None
+
+
+def queue_for(name: str) -> str:
+    return name.split(".", 1)[0]
+
+
+def retry_delay(attempts: int) -> float:
+    """Jittered exponential backoff before retry number ``attempts``."""
+    base = settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return base + random.uniform(0, base)
+
+
+class JobQueue(Protocol):
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        name: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        idempotency_key: Optional[str] = None,
+        delay_seconds: float = 0,
+        max_attempts: Optional[int] = None,
+    ) -> None: ...
+
+
+class PostgresJobQueue:
+    """
+    Durable queue in the ``jobs`` table. ``enqueue`` writes through the
+    caller's session, so a job exists only if the caller's transaction
+    commits. Workers claim due rows with ``FOR UPDATE SKIP LOCKED`` and never
+    block each other.
+    """
+
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        name: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        idempotency_key: Optional[str] = None,
+        delay_seconds: float = 0,
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        stmt = insert(Job).values(
+            queue=queue_for(name),
+            name=name,
+            payload=payload or {},
+            idempotency_key=idempotency_key,
+            status=JobStatus.QUEUED.value,
+            max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+            run_at=func.now() + timedelta(seconds=delay_seconds),
+        )
+        await db.execute(
+            stmt.on_conflict_do_nothing(index_elements=[Job.idempotency_key])
+        )
+
+    async def claim(self, db: AsyncSession, queue: str, limit: int) -> List[Job]:
+        """
+        Marks up to ``limit`` due jobs as running and returns them. Jobs whose
+        worker died mid-run are reclaimed after JOB_LOCK_TIMEOUT_SECONDS, or
+        marked failed if that was their last attempt, so a job that kills its
+        worker is not run forever.
+        """
+        stale = func.now() - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+        orphaned = and_(
+            Job.queue == queue,
+            Job.status == JobStatus.RUNNING.value,
+            Job.locked_at < stale,
+        )
+        await db.execute(
+            update(Job)
+            .where(orphaned, Job.attempts >= Job.max_attempts)
+            .values(
+                status=JobStatus.FAILED.value,
+                finished_at=func.now(),
+                locked_at=None,
+                last_error="Worker stopped during the last attempt",
+            )
+        )
+        due = (
+            select(Job.id)
+            .where(
+                Job.queue == queue,
+                or_(
+                    and_(
+                        Job.status == JobStatus.QUEUED.value, Job.run_at <= func.now()
+                    ),
+                    and_(orphaned, Job.attempts < Job.max_attempts),
+                ),
+            )
+            .order_by(Job.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            update(Job)
+            .where(Job.id.in_(due.scalar_subquery()))
+            .values(
+                status=JobStatus.RUNNING.value,
+                attempts=Job.attempts + 1,
+                locked_at=func.now(),
+            )
+            .returning(Job)
+        )
+        jobs = list(result.scalars().all())
+        await db.commit()
+        return jobs
+
+    async def purge(self, db: AsyncSession, older_than_days: int) -> int:
+        """Deletes jobs that finished more than ``older_than_days`` ago."""
+        cutoff = func.now() - timedelta(days=older_than_days)
+        result = await db.execute(
+            delete(Job).where(
+                Job.status.in_([JobStatus.DONE.value, JobStatus.FAILED.value]),
+                Job.finished_at < cutoff,
+            )
+        )
+        await db.commit()
+        return result.rowcount
+
+    async def run(self, job: Job, session_factory: Callable[[], AsyncSession]) -> bool:
+        """Runs one claimed job; returns whether it succeeded."""
+        async with session_factory() as db:
+            try:
+                await get_handler(job.name)(db, job.payload)
+                await db.execute(
+                    update(Job)
+                    .where(Job.id == job.id)
+                    .values(
+                        status=JobStatus.DONE.value,
+                        finished_at=func.now(),
+                        last_error=None,
+                    )
+                )
+                await db.commit()
+                return True
+            except Exception as e:
+                await db.rollback()
+                gave_up = job.attempts >= job.max_attempts
+                logger.warning(
+                    f"Job {job.id} ({job.name}) failed on attempt {job.attempts}"
+                    f"{', giving up' if gave_up else ''}: {e!r}"
+                )
+                values: Dict[str, Any] = {"last_error": repr(e), "locked_at": None}
+                if gave_up:
+                    values.update(status=JobStatus.FAILED.value, finished_at=func.now())
+                else:
+                    values.update(
+                        status=JobStatus.QUEUED.value,
+                        run_at=func.now()
+                        + timedelta(seconds=retry_delay(job.attempts)),
+                    )
+                await db.execute(update(Job).where(Job.id == job.id).values(**values))
+                await db.commit()
+                return False
+
+
+class InMemoryJobQueue:
+    """
+    Process-local queue for tests. Jobs wait in ``jobs`` until the test calls
+    ``run_pending`` against the session it is given; nothing else runs them,
+    so a service using this backend silently drops its jobs.
+    """
+
+    def __init__(self) -> None:
+        self.jobs: List[Job] = []
+        self._keys: Set[str] = set()
+
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        name: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        idempotency_key: Optional[str] = None,
+        delay_seconds: float = 0,
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        if idempotency_key is not None:
+            if idempotency_key in self._keys:
+                return
+            self._keys.add(idempotency_key)
+        self.jobs.append(
+            Job(
+                queue=queue_for(name),
+                name=name,
+                payload=dict(payload or {}),
+                idempotency_key=idempotency_key,
+                status=JobStatus.QUEUED.value,
+                attempts=0,
+                max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+            )
+        )
+
+    def pending(self, name: Optional[str] = None) -> List[Job]:
+        return [
+            job
+            for job in self.jobs
+            if job.status == JobStatus.QUEUED.value and name in (None, job.name)
+        ]
+
+    async def run_pending(self, db: AsyncSession) -> int:
+        """Runs queued jobs, retrying failures immediately; returns jobs run."""
+        ran = 0
+        while self.pending():
+            for job in self.pending():
+                job.attempts += 1
+                ran += 1
+                try:
+                    await get_handler(job.name)(db, job.payload)
+                    await db.commit()
+                    job.status = JobStatus.DONE.value
+                except Exception as e:
+                    await db.rollback()
+                    job.last_error = repr(e)
+                    if job.attempts >= job.max_attempts:
+                        job.status = JobStatus.FAILED.value
+        return ran
+
+
+def _default_queue() -> JobQueue:
+    if settings.JOB_QUEUE_BACKEND == "memory":
+        return InMemoryJobQueue()
+    return PostgresJobQueue()
+
+
+job_queue: JobQueue = _default_queue()
+
+
+def get_job_queue() -> JobQueue:
+    return job_queue
@@ -0,0 +1,116 @@
+# mavito-common-lib/mavito_common/jobs/worker.py
+"""
+Runs queued jobs for one or more queues.
+
+    python -m mavito_common.jobs.worker app.services.jobs --queue auth
+
+The positional arguments are modules to import so their ``@job`` handlers
+are registered; run it from the service directory.
+"""
+
+import argparse
+import asyncio
+import importlib
+import logging
+import signal
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.core.config import settings
+from mavito_common.db.session import get_sessionmaker
+from mavito_common.jobs.queue import PostgresJobQueue
+
+logger = logging.getLogger(__name__)
+
+# How often a worker deletes old finished jobs.
+PURGE_INTERVAL_SECONDS = 3600.0
+
+
+async def run_worker(
+    queues: Sequence[str],
+    *,
+    session_factory: Optional[Callable[[], AsyncSession]] = None,
+    batch_size: int = settings.JOB_WORKER_BATCH_SIZE,
+    poll_seconds: float = settings.JOB_WORKER_POLL_SECONDS,
+    retention_days: int = settings.JOB_RETENTION_DAYS,
+    stop: Optional[asyncio.Event] = None,
+    once: bool = False,
+) -> int:
+    """
+    Claims and runs jobs until ``stop`` is set, sleeping ``poll_seconds``
+    whenever every queue is empty. With ``once`` it returns after the first
+    pass. Every PURGE_INTERVAL_SECONDS it deletes jobs that finished more
+    than ``retention_days`` ago (0 keeps them). Returns the number of jobs
+    run.
+    """
+    factory = session_factory or get_sessionmaker()
+    stop = stop or asyncio.Event()
+    queue = PostgresJobQueue()
+    loop = asyncio.get_running_loop()
+    next_purge = loop.time()
+    ran = 0
+
+    while not stop.is_set():
+        if retention_days and loop.time() >= next_purge:
+            async with factory() as db:
+                purged = await queue.purge(db, retention_days)
+            if purged:
+                logger.info(f"Purged {purged} finished jobs")
+            next_purge = loop.time() + PURGE_INTERVAL_SECONDS
+        claimed = 0
+        for name in queues:
+            async with factory() as db:
+                jobs = await queue.claim(db, name, batch_size)
+            claimed += len(jobs)
+            for job in jobs:
+                await queue.run(job, factory)
+            ran += len(jobs)
+        if once:
+            break
+        if not claimed:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+    return ran
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="+", help="modules defining @job handlers")
+    parser.add_argument("--queue", action="append", required=True, dest="queues")
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.JOB_WORKER_BATCH_SIZE
+    )
+    parser.add_argument(
+        "--poll-seconds", type=float, default=settings.JOB_WORKER_POLL_SECONDS
+    )
+    parser.add_argument(
+        "--retention-days", type=int, default=settings.JOB_RETENTION_DAYS
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    for module in args.modules:
+        importlib.import_module(module)
+
+    async def serve() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        logger.info(f"Job worker started for queues {args.queues}")
+        await run_worker(
+            args.queues,
+            batch_size=args.batch_size,
+            poll_seconds=args.poll_seconds,
+            retention_days=args.retention_days,
+            stop=stop,
+        )
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
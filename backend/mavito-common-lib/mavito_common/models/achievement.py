@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 from enum import Enum
 
 from sqlalchemy import String, DateTime, Integer, Boolean, Text
@@ -39,6 +39,11 @@ class Achievement(Base):
     )
     target_value: Mapped[int] = mapped_column(Integer, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Weekly goals belong to one ISO week, e.g. "2025W03"; regular
+    # achievements have none.
+    week_id: Mapped[Optional[str]] = mapped_column(String(7), nullable=True, index=True)
+    # XP awarded when a weekly goal is completed.
+    xp_reward: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
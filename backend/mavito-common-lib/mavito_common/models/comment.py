@@ -4,7 +4,7 @@ import uuid  # Must be the very first import
 from pydantic import BaseModel, UUID4
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
-from sqlalchemy import String, Boolean, DateTime, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Index, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from mavito_common.db.base_class import Base
@@ -32,6 +32,19 @@ class Comment(Base):
     Maps to the 'comments' table in the database.
     """
 
+    __table_args__ = (
+        # Keyset pagination: a term's threads newest first, and a comment's
+        # replies oldest first.
+        Index(
+            "ix_comments_term_threads",
+            "term_id",
+            "date_posted",
+            "id",
+            postgresql_where=text("parent_id IS NULL"),
+        ),
+        Index("ix_comments_parent_posted", "parent_id", "date_posted", "id"),
+    )
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
@@ -49,6 +62,19 @@ class Comment(Base):
         DateTime(timezone=True), server_default=func.now()
     )
     tombstone: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Live direct replies, kept current by crud_comment so thread pages can
+    # show counts without counting.
+    reply_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    # Vote totals, kept current by the vote service in the same transaction
+    # as the commentvotes row they count.
+    upvotes: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    downvotes: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
 
     # Relationships
     if TYPE_CHECKING:
@@ -1,6 +1,6 @@
 import uuid
 import enum
-from sqlalchemy import ForeignKey, Enum as SAEnum
+from sqlalchemy import ForeignKey, UniqueConstraint, Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from mavito_common.db.base_class import Base
@@ -13,6 +13,10 @@ class VoteType(str, enum.Enum):
 
 
 class CommentVote(Base):
+    # One vote per user per comment; voting upserts against it.
+    __table_args__ = (
+        UniqueConstraint("user_id", "comment_id", name="uq_commentvotes_user_comment"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -0,0 +1,44 @@
+# mavito-common-lib/mavito_common/models/data_version.py
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, String, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from mavito_common.db.base_class import Base
+
+# Name of the version row bumped on every write to terms or term_translations.
+TERMS_DATA_VERSION = "terms"
+# Bumped whenever a user's role, lock or active state changes; tokens minted
+# under an older version stop being trusted for their embedded claims.
+AUTH_DATA_VERSION = "auth"
+
+
+class DataVersion(Base):
+    """Monotonic version counter per dataset, used to derive cache validators."""
+
+    __tablename__ = "data_versions"  # type: ignore
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+def bump_data_version(name: str) -> Any:
+    """
+    Returns an upsert that increments the version of ``name``. Execute it in the
+    same transaction as the write it describes.
+    """
+    stmt = insert(DataVersion).values(name=name, version=1)
+    return stmt.on_conflict_do_update(
+        index_elements=[DataVersion.name],
+        set_={"version": DataVersion.version + 1, "updated_at": func.now()},
+    )
+
+
+def select_data_version(name: str) -> Any:
+    return select(DataVersion.version).where(DataVersion.name == name)
@@ -0,0 +1,62 @@
+# mavito-common-lib/mavito_common/models/job.py
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from mavito_common.db.base_class import Base
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"  # Gave up after max_attempts
+
+
+class Job(Base):
+    """A unit of deferred work, claimed by workers with FOR UPDATE SKIP LOCKED."""
+
+    __tablename__ = "jobs"  # type: ignore
+    __table_args__ = (
+        # Workers only ever scan runnable rows, oldest due first.
+        Index(
+            "ix_jobs_runnable",
+            "queue",
+            "run_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    queue: Mapped[str] = mapped_column(String(50), nullable=False, default="default")
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb")
+    )
+    # A second enqueue with the same key is a no-op, whatever the first's state.
+    idempotency_key: Mapped[Optional[str]] = mapped_column(
+        String(200), nullable=True, unique=True
+    )
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=JobStatus.QUEUED.value
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    locked_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 import uuid
-from sqlalchemy import Column, DateTime, Table, ForeignKey, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    Table,
+    ForeignKey,
+    String,
+    Text,
+    func,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.orm import Mapped, aliased, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from mavito_common.db.base_class import Base
-from typing import List, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, TYPE_CHECKING
 from mavito_common.models.term_status import TermStatus
 from sqlalchemy import Enum as SAEnum
 
@@ -91,7 +103,21 @@ class Term(Base):
     ven_pos_or_descriptor_info: Mapped[str | None] = mapped_column(Text, nullable=True)
     tso_pos_or_descriptor: Mapped[str | None] = mapped_column(String(50), nullable=True)
     tso_pos_or_descriptor_info: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Denormalized pivot of ``translations``: {language: {"id": ..., "term": ...}}.
+    # Kept in sync by term-addition-service so readers can skip the join.
+    translation_map: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb")
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Vote totals, kept current by the vote service in the same statement as
+    # the termvotes row they count.
+    upvotes: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    downvotes: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
 
     # Relationships
     owner_id: Mapped[uuid.UUID] = mapped_column(
@@ -151,3 +177,41 @@ class Term(Base):
         cascade="all, delete-orphan",
         lazy="selectin",
     )
+
+
+def build_translation_map(translations: Iterable[Term]) -> Dict[str, Any]:
+    """
+    Builds the ``translation_map`` pivot from already-loaded translation terms.
+    """
+    return {t.language: {"id": str(t.id), "term": t.term} for t in translations}
+
+
+def refresh_translation_maps(term_ids: Iterable[Any]) -> Any:
+    """
+    Returns an UPDATE that rebuilds ``translation_map`` for the given terms, and
+    for every term that lists one of them as a translation, in one statement.
+    Instances already loaded in the session are not refreshed.
+    """
+    ids = list(term_ids)
+    translation = aliased(Term)
+    pivot = (
+        select(
+            func.jsonb_object_agg(
+                translation.language,
+                func.jsonb_build_object("id", translation.id, "term", translation.term),
+            )
+        )
+        .select_from(term_translations)
+        .join(translation, translation.id == term_translations.c.translation_id)
+        .where(term_translations.c.term_id == Term.id)
+        .scalar_subquery()
+    )
+    referrers = select(term_translations.c.term_id).where(
+        term_translations.c.translation_id.in_(ids)
+    )
+    return (
+        update(Term)
+        .where(Term.id.in_(ids) | Term.id.in_(referrers))
+        .values(translation_map=func.coalesce(pivot, text("'{}'::jsonb")))
+        .execution_options(synchronize_session=False)
+    )
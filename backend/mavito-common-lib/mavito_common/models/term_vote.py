@@ -1,7 +1,7 @@
 # mavito-common-lib/mavito_common/models/term_vote.py
 import uuid
 import enum
-from sqlalchemy import ForeignKey, Enum as SAEnum
+from sqlalchemy import ForeignKey, UniqueConstraint, Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 from mavito_common.db.base_class import Base
@@ -13,6 +13,11 @@ class VoteType(str, enum.Enum):
 
 
 class TermVote(Base):
+    # One vote per user per term; voting upserts against it.
+    __table_args__ = (
+        UniqueConstraint("user_id", "term_id", name="uq_termvotes_user_term"),
+    )
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
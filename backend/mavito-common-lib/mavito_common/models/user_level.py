@@ -1,11 +1,13 @@
+import math
 import uuid
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
-from sqlalchemy import Integer, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Integer, ForeignKey, cast, func
+from sqlalchemy.dialects.postgresql import UUID, insert
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from mavito_common.db.base_class import Base
+from mavito_common.models.user_xp import UserXP
 
 if TYPE_CHECKING:
     from mavito_common.models.user import User
@@ -35,22 +37,12 @@ def calculate_level_from_xp(total_xp: int) -> int:
     """
     Calculate user level based on total XP.
     Level progression: Level 1 = 0-99 XP, Level 2 = 100-299 XP, etc.
-    Formula: Each level requires 100 + (level-1) * 100 additional XP
+    Formula: Each level requires 100 + (level-1) * 100 additional XP, so
+    level L starts at 50 * L * (L - 1) XP; solved for L in integers.
     """
     if total_xp < 0:
         return 1
-
-    level = 1
-    xp_required = 0
-
-    while total_xp >= xp_required:
-        xp_for_next_level = 100 * level
-        if total_xp < xp_required + xp_for_next_level:
-            break
-        xp_required += xp_for_next_level
-        level += 1
-
-    return level
+    return (1 + math.isqrt(1 + 4 * (total_xp // 50))) // 2
 
 
 def calculate_xp_for_level(level: int) -> int:
@@ -59,12 +51,7 @@ def calculate_xp_for_level(level: int) -> int:
     """
     if level <= 1:
         return 0
-
-    total_xp = 0
-    for current_level in range(1, level):
-        total_xp += 100 * current_level
-
-    return total_xp
+    return 50 * level * (level - 1)
 
 
 def calculate_xp_for_next_level(current_level: int) -> int:
@@ -72,3 +59,27 @@ def calculate_xp_for_next_level(current_level: int) -> int:
     Calculate XP required for the next level.
     """
     return 100 * (current_level + 1)
+
+
+def level_from_xp_sql(total_xp: Any) -> Any:
+    """``calculate_level_from_xp`` as a SQL expression over ``total_xp``."""
+    steps = func.greatest(total_xp, 0, type_=Integer) // 50
+    return (1 + cast(func.floor(func.sqrt(1 + 4 * steps)), Integer)) // 2
+
+
+def record_xp_level(xp: UserXP) -> Any:
+    """
+    Returns an upsert that adds the XP record ``xp`` to its user's level row.
+    Execute it in the same transaction that inserts the record.
+    """
+    stmt = insert(UserLevel).values(
+        id=uuid.uuid4(),
+        user_id=xp.user_id,
+        total_xp=xp.xp_amount,
+        current_level=calculate_level_from_xp(xp.xp_amount),
+    )
+    total_xp = UserLevel.total_xp + stmt.excluded.total_xp
+    return stmt.on_conflict_do_update(
+        index_elements=[UserLevel.user_id],
+        set_={"total_xp": total_xp, "current_level": level_from_xp_sql(total_xp)},
+    )
@@ -0,0 +1,149 @@
+# mavito-common-lib/mavito_common/models/user_stats.py
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, String, case, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, array, insert
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from mavito_common.db.base_class import Base
+from mavito_common.models.term import Term
+from mavito_common.models.term_application import TermApplication
+from mavito_common.models.user_xp import UserXP, XPSource
+
+# XP descriptions that achievements count separately within a source.
+TERM_UPVOTE_DESCRIPTION = "Received an upvote on published term"
+TERM_ADDED_DESCRIPTION = "Added a new term"
+TERM_VERIFIED_DESCRIPTION = "Term application verified by linguist"
+
+# (source, description) -> counter column; a None description counts every
+# record from the source.
+_COUNTERS = {
+    (XPSource.COMMENT, None): "comments",
+    (XPSource.UPVOTE_RECEIVED, TERM_UPVOTE_DESCRIPTION): "term_upvotes_received",
+    (XPSource.TERM_ADDITION, TERM_ADDED_DESCRIPTION): "terms_added",
+    (XPSource.TERM_ADDITION, TERM_VERIFIED_DESCRIPTION): "terms_verified",
+    (XPSource.FEEDBACK_SUBMISSION, None): "feedback_submissions",
+}
+
+
+class UserStats(Base):
+    """
+    Running totals of a user's XP records, so achievements are checked
+    against one row instead of counting ``userxps``. Kept by the upsert from
+    ``record_xp_stats`` in the transaction that inserts each record.
+    """
+
+    __tablename__ = "user_stats"  # type: ignore
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True
+    )
+    total_xp: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    comments: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    term_upvotes_received: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    terms_added: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    terms_verified: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    feedback_submissions: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    # Distinct languages of the terms behind the user's term XP.
+    languages: Mapped[List[str]] = mapped_column(
+        ARRAY(String(50)), nullable=False, server_default="{}"
+    )
+    # Consecutive days, ending on last_login_date, with login XP.
+    login_streak: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    longest_login_streak: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    last_login_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    @classmethod
+    def empty(cls, user_id: uuid.UUID) -> "UserStats":
+        """Stats of a user with no XP yet (not added to any session)."""
+        return cls(
+            user_id=user_id,
+            total_xp=0,
+            comments=0,
+            term_upvotes_received=0,
+            terms_added=0,
+            terms_verified=0,
+            feedback_submissions=0,
+            languages=[],
+            login_streak=0,
+            longest_login_streak=0,
+            last_login_date=None,
+        )
+
+    def current_login_streak(self, today: date) -> int:
+        """The streak only counts while it includes ``today``."""
+        return self.login_streak if self.last_login_date == today else 0
+
+
+def xp_counter(source: XPSource, description: Optional[str]) -> Optional[str]:
+    """The UserStats counter an XP record adds one to, if any."""
+    return _COUNTERS.get((source, description)) or _COUNTERS.get((source, None))
+
+
+def record_xp_stats(xp: UserXP) -> Any:
+    """
+    Returns an upsert that adds the XP record ``xp`` to its user's stats.
+    Execute it in the same transaction that inserts the record. A login
+    record counts for the date of its ``created_at`` when that is set.
+    """
+    table = UserStats.__table__
+    values: Dict[str, Any] = {"user_id": xp.user_id, "total_xp": xp.xp_amount}
+    counter = xp_counter(xp.xp_source, xp.description)
+    if counter is not None:
+        values[counter] = 1
+    if xp.xp_source == XPSource.TERM_ADDITION and xp.source_reference_id:
+        language = (
+            select(Term.language)
+            .join(TermApplication, TermApplication.term_id == Term.id)
+            .where(TermApplication.id == xp.source_reference_id)
+            .scalar_subquery()
+        )
+        values["languages"] = func.array_remove(array([language]), None)
+    if xp.xp_source == XPSource.LOGIN_STREAK:
+        login_date = (
+            func.current_date() if xp.created_at is None else xp.created_at.date()
+        )
+        values.update(
+            login_streak=1, longest_login_streak=1, last_login_date=login_date
+        )
+
+    stmt = insert(UserStats).values(**values)
+    new = stmt.excluded
+    updates: Dict[str, Any] = {
+        name: table.c[name] + new[name]
+        for name in values
+        if name in ("total_xp", *_COUNTERS.values())
+    }
+    if "languages" in values:
+        updates["languages"] = case(
+            (new.languages.contained_by(table.c.languages), table.c.languages),
+            else_=table.c.languages.concat(new.languages),
+        )
+    if "last_login_date" in values:
+        streak = case(
+            (table.c.last_login_date >= new.last_login_date, table.c.login_streak),
+            (
+                table.c.last_login_date == new.last_login_date - 1,
+                table.c.login_streak + 1,
+            ),
+            else_=1,
+        )
+        updates.update(
+            login_streak=streak,
+            longest_login_streak=func.greatest(table.c.longest_login_streak, streak),
+            last_login_date=func.greatest(table.c.last_login_date, new.last_login_date),
+        )
+    updates["updated_at"] = func.now()
+    return stmt.on_conflict_do_update(index_elements=[table.c.user_id], set_=updates)
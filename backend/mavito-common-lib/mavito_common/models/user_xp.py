@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from enum import Enum
 
-from sqlalchemy import String, DateTime, Integer, ForeignKey
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -32,6 +32,9 @@ class XPSource(str, Enum):
 class UserXP(Base):
     """Individual XP transaction records for detailed tracking"""
 
+    # A user's records in a time range, e.g. one week's for weekly goals.
+    __table_args__ = (Index("ix_userxps_user_id_created_at", "user_id", "created_at"),)
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True
     )
@@ -0,0 +1,214 @@
+# mavito-common-lib/mavito_common/observability/metrics.py
+import math
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+# (metric name, type, help text, [(labels, value), ...])
+MetricFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def collect(self) -> Iterable[MetricFamily]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> Iterable[MetricFamily]:
+        samples = [(self._labels(key), value) for key, value in self._values.items()]
+        yield self.name, self.type, self.help, samples
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (+Inf last), sum, count.
+        self._series: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            self._series[key] = series
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def count(self, **labels: Any) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def collect(self) -> Iterable[MetricFamily]:
+        samples: List[Tuple[Dict[str, str], float]] = []
+        for key, (counts, total, count) in self._series.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                samples.append(
+                    ({**labels, "le": _format_value(bound)}, float(cumulative))
+                )
+            samples.append(({**labels, "__suffix__": "_sum"}, total))
+            samples.append(({**labels, "__suffix__": "_count"}, float(count)))
+        yield self.name, self.type, self.help, samples
+
+
+class Registry:
+    """
+    Process-local metrics plus collectors that read other components' stats
+    (pool, caches) at scrape time. Renders the Prometheus text format.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+    def register(self, metric: _Metric) -> Any:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        self._collectors.append(collector)
+
+    def collect(self) -> Iterable[MetricFamily]:
+        for metric in self._metrics.values():
+            yield from metric.collect()
+        for collector in self._collectors:
+            yield from collector()
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for name, type_, help, samples in self.collect():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {type_}")
+            for labels, value in samples:
+                suffix = labels.pop("__suffix__", "")
+                if type_ == "histogram" and not suffix:
+                    suffix = "_bucket"
+                lines.append(
+                    f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# Caches that count ``hits`` and ``misses``; see register_cache.
+_caches: Dict[str, Any] = {}
+
+
+def register_cache(name: str, cache: Any) -> None:
+    """Exposes an in-process cache's ``hits``/``misses`` counters on /metrics."""
+    _caches[name] = cache
+
+
+def _collect_caches() -> Iterable[MetricFamily]:
+    hits, misses, ratios = [], [], []
+    for name, cache in sorted(_caches.items()):
+        labels = {"cache": name}
+        lookups = cache.hits + cache.misses
+        hits.append((labels, float(cache.hits)))
+        misses.append((labels, float(cache.misses)))
+        ratios.append((labels, cache.hits / lookups if lookups else 0.0))
+    yield "cache_hits_total", "counter", "In-process cache hits.", hits
+    yield "cache_misses_total", "counter", "In-process cache misses.", misses
+    yield "cache_hit_ratio", "gauge", "Hits over lookups since start.", ratios
+
+
+registry.add_collector(_collect_caches)
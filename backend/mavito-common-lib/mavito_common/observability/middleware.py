@@ -0,0 +1,212 @@
+# mavito-common-lib/mavito_common/observability/middleware.py
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Iterable, Optional
+
+from fastapi import APIRouter, FastAPI, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mavito_common.core.config import settings
+from mavito_common.core.security import password_hasher
+from mavito_common.db.session import pool_metrics
+from mavito_common.observability.metrics import (
+    CONTENT_TYPE,
+    QUERY_COUNT_BUCKETS,
+    MetricFamily,
+    registry,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RequestStats:
+    """SQL work done while handling one request."""
+
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+# Set by ObservabilityMiddleware; None outside an instrumented request.
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests handled.", ("method", "route", "status")
+)
+LATENCY = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds.",
+    ("method", "route"),
+)
+IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled."
+)
+REQUEST_QUERIES = registry.histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request.",
+    ("route",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+REQUEST_DB_SECONDS = registry.histogram(
+    "http_request_db_seconds", "Time spent in SQL per request.", ("route",)
+)
+STATEMENTS = registry.counter(
+    "db_statements_total", "SQL statements executed by this process."
+)
+QUERY_BUDGET_EXCEEDED = registry.counter(
+    "http_query_budget_exceeded_total",
+    "Requests that ran more SQL statements than OBSERVABILITY_QUERY_BUDGET.",
+    ("route",),
+)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    context._mavito_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    STATEMENTS.inc()
+    stats = request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - context._mavito_started
+
+
+def instrument_engines() -> None:
+    """Counts and times statements on every engine, replicas included."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# (metric name, type, key in pool_metrics() / PasswordHasher.snapshot())
+POOL_METRICS = (
+    ("db_pool_size", "gauge", "size"),
+    ("db_pool_checked_out", "gauge", "checked_out"),
+    ("db_pool_overflow", "gauge", "overflow"),
+    ("db_pool_checkouts_total", "counter", "checkouts"),
+    ("db_pool_timeouts_total", "counter", "timeouts"),
+    ("db_pool_wait_seconds_total", "counter", "wait_seconds_total"),
+    ("db_pool_wait_seconds_max", "gauge", "wait_seconds_max"),
+)
+PASSWORD_HASH_METRICS = (
+    ("password_hash_queued", "gauge", "queued"),
+    ("password_hash_in_flight", "gauge", "in_flight"),
+    ("password_hash_completed_total", "counter", "completed"),
+    ("password_hash_wait_seconds_total", "counter", "wait_seconds_total"),
+)
+
+
+def _collect_pool() -> Iterable[MetricFamily]:
+    pool = pool_metrics()
+    if pool:
+        for name, type_, key in POOL_METRICS:
+            yield name, type_, f"Connection pool {key}.", [({}, pool[key])]
+    hasher = password_hasher.snapshot()
+    for name, type_, key in PASSWORD_HASH_METRICS:
+        yield name, type_, f"bcrypt worker pool {key}.", [({}, hasher[key])]
+
+
+registry.add_collector(_collect_pool)
+
+
+def _route_label(scope: Scope) -> str:
+    """
+    The matched route template, e.g. ``/api/v1/glossary/terms/{term_id}``.
+    Templates rather than raw paths keep label cardinality bounded.
+    """
+    template = getattr(scope.get("route"), "path", None)
+    if template is None:
+        return "unmatched"
+    # Routes of an included router may report their template relative to
+    # the router's prefix, so recover the prefix from the concrete path.
+    params = scope.get("path_params", {})
+    segments = 0
+    for part in template.strip("/").split("/"):
+        if part.startswith("{") and part.endswith(":path}"):
+            segments += len(str(params.get(part[1:-6], "")).split("/"))
+        elif part:
+            segments += 1
+    concrete = scope["path"].rstrip("/").split("/")
+    return "/".join(concrete[: len(concrete) - segments]) + template
+
+
+class ObservabilityMiddleware:
+    """
+    Records latency, status and in-flight counts per route, plus the number
+    of SQL statements and DB time each request used. With a ``query_budget``
+    it logs routes that exceed it, which usually points at an N+1 pattern.
+    """
+
+    def __init__(self, app: ASGIApp, query_budget: int = 0) -> None:
+        self.app = app
+        self.query_budget = query_budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            IN_FLIGHT.dec()
+            request_stats.reset(token)
+
+            method, route = scope["method"], _route_label(scope)
+            REQUESTS.inc(method=method, route=route, status=status_code)
+            LATENCY.observe(elapsed, method=method, route=route)
+            REQUEST_QUERIES.observe(stats.queries, route=route)
+            REQUEST_DB_SECONDS.observe(stats.db_seconds, route=route)
+            if self.query_budget and stats.queries > self.query_budget:
+                QUERY_BUDGET_EXCEEDED.inc(route=route)
+                logger.warning(
+                    f"{method} {route} ran {stats.queries} SQL statements "
+                    f"(budget {self.query_budget}, {stats.db_seconds * 1000:.1f}ms "
+                    "in the database); check for N+1 queries"
+                )
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
+def install_observability(
+    app: FastAPI, *, query_budget: int = settings.OBSERVABILITY_QUERY_BUDGET
+) -> None:
+    """
+    Instruments a service app and serves its metrics on ``/metrics`` in the
+    Prometheus text format. Call it after the app's other middleware so the
+    timings include them.
+    """
+    instrument_engines()
+    app.add_middleware(ObservabilityMiddleware, query_budget=query_budget)
+    app.include_router(router)
@@ -13,6 +13,8 @@ class AchievementBase(BaseModel):
     achievement_type: AchievementType
     target_value: int
     is_active: bool = True
+    week_id: Optional[str] = None
+    xp_reward: Optional[int] = None
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -26,6 +28,8 @@ class AchievementUpdate(BaseModel):
     achievement_type: Optional[AchievementType] = None
     target_value: Optional[int] = None
     is_active: Optional[bool] = None
+    week_id: Optional[str] = None
+    xp_reward: Optional[int] = None
 
 
 class AchievementResponse(AchievementBase):
@@ -72,6 +72,17 @@ class CommentResponse(CommentBase):
     replies: List["CommentResponse"] = Field(
         [], description="List of replies to this comment."
     )
+    reply_count: int = Field(
+        0, description="Number of direct replies that have not been deleted."
+    )
+    replies_cursor: Optional[str] = Field(
+        None,
+        description=(
+            "Cursor for GET /comments/{id}/replies to continue after the "
+            "replies included here, when only some are. Null when all are "
+            "included, or none are and the list starts from the beginning."
+        ),
+    )
 
     class Config:
         from_attributes = True
@@ -80,3 +91,10 @@ class CommentResponse(CommentBase):
 
 
 CommentResponse.model_rebuild()
+
+
+class CommentPage(BaseModel):
+    """One page of comments, with the cursor for the next page if any."""
+
+    items: List[CommentResponse]
+    next_cursor: Optional[str] = None
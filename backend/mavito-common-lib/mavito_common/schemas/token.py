@@ -1,7 +1,11 @@
 # app/schemas/token.py
-from pydantic import BaseModel
+import uuid
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
+from mavito_common.models.user import UserRole
+
 
 class Token(BaseModel):
     access_token: str
@@ -12,3 +16,19 @@ class TokenPayload(BaseModel):
     sub: Optional[str] = (
         None  # "sub" (subject) is a standard JWT claim, typically user ID or email
     )
+
+
+class Principal(BaseModel):
+    """
+    The authenticated caller as seen by downstream services: just enough of the
+    user row to authorise a request, rebuilt from token claims where possible.
+    """
+
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: uuid.UUID
+    email: str
+    role: Optional[UserRole] = None
+    is_active: bool = True
+    account_locked: bool = False
+    deleted_at: Optional[datetime] = None
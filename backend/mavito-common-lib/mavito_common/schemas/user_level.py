@@ -20,7 +20,8 @@ class UserLevelUpdate(BaseModel):
 
 
 class UserLevelResponse(UserLevelBase):
-    id: uuid.UUID
+    # None until the user's first XP creates their level row.
+    id: Optional[uuid.UUID] = None
     user_id: uuid.UUID
     xp_for_next_level: int
     xp_progress_in_level: int
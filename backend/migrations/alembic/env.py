@@ -26,6 +26,9 @@ import mavito_common.models.user_xp  # noqa: F401
 import mavito_common.models.user_level  # noqa: F401
 import mavito_common.models.achievement  # noqa: F401
 import mavito_common.models.user_achievement  # noqa: F401
+import mavito_common.models.data_version  # noqa: F401
+import mavito_common.models.job  # noqa: F401
+import mavito_common.models.user_stats  # noqa: F401
 
 config = context.config
 
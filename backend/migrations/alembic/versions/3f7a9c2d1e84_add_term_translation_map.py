@@ -0,0 +1,56 @@
+"""add term translation_map pivot
+
+Revision ID: 3f7a9c2d1e84
+Revises: a1b2c3d4e5f6
+Create Date: 2025-10-06 11:12:40.218734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f7a9c2d1e84"
+down_revision: Union[str, Sequence[str], None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "terms",
+        sa.Column(
+            "translation_map",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+    # Backfill the pivot from the existing term_translations links.
+    op.execute(
+        """
+        UPDATE terms AS t
+        SET translation_map = pivot.translation_map
+        FROM (
+            SELECT tt.term_id,
+                   jsonb_object_agg(
+                       tr.language,
+                       jsonb_build_object('id', tr.id, 'term', tr.term)
+                   ) AS translation_map
+            FROM term_translations AS tt
+            JOIN terms AS tr ON tr.id = tt.translation_id
+            GROUP BY tt.term_id
+        ) AS pivot
+        WHERE t.id = pivot.term_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("terms", "translation_map")
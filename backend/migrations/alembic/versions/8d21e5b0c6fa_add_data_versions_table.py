@@ -0,0 +1,41 @@
+"""add data_versions table
+
+Revision ID: 8d21e5b0c6fa
+Revises: 3f7a9c2d1e84
+Create Date: 2025-10-07 09:03:17.551902
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d21e5b0c6fa"
+down_revision: Union[str, Sequence[str], None] = "3f7a9c2d1e84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "data_versions",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.execute("INSERT INTO data_versions (name, version) VALUES ('terms', 1)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("data_versions")
@@ -0,0 +1,134 @@
+"""add user_stats counters for achievements
+
+Revision ID: a7d3e9c41f52
+Revises: f2c6a8d14b97
+Create Date: 2025-10-13 09:41:18.302615
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3e9c41f52"
+down_revision: Union[str, Sequence[str], None] = "f2c6a8d14b97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_stats",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("total_xp", sa.Integer(), nullable=False),
+        sa.Column("comments", sa.Integer(), nullable=False),
+        sa.Column("term_upvotes_received", sa.Integer(), nullable=False),
+        sa.Column("terms_added", sa.Integer(), nullable=False),
+        sa.Column("terms_verified", sa.Integer(), nullable=False),
+        sa.Column("feedback_submissions", sa.Integer(), nullable=False),
+        sa.Column(
+            "languages",
+            postgresql.ARRAY(sa.String(length=50)),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column("login_streak", sa.Integer(), nullable=False),
+        sa.Column("longest_login_streak", sa.Integer(), nullable=False),
+        sa.Column("last_login_date", sa.Date(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+    # Backfill from the XP history the achievements used to count.
+    op.execute(
+        """
+        INSERT INTO user_stats (
+            user_id, total_xp, comments, term_upvotes_received, terms_added,
+            terms_verified, feedback_submissions, login_streak,
+            longest_login_streak
+        )
+        SELECT user_id,
+               sum(xp_amount),
+               count(*) FILTER (WHERE xp_source = 'COMMENT'),
+               count(*) FILTER (
+                   WHERE xp_source = 'UPVOTE_RECEIVED'
+                     AND description = 'Received an upvote on published term'
+               ),
+               count(*) FILTER (
+                   WHERE xp_source = 'TERM_ADDITION'
+                     AND description = 'Added a new term'
+               ),
+               count(*) FILTER (
+                   WHERE xp_source = 'TERM_ADDITION'
+                     AND description = 'Term application verified by linguist'
+               ),
+               count(*) FILTER (WHERE xp_source = 'FEEDBACK_SUBMISSION'),
+               0,
+               0
+        FROM userxps
+        GROUP BY user_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE user_stats AS s
+        SET languages = l.languages
+        FROM (
+            SELECT x.user_id, array_agg(DISTINCT t.language) AS languages
+            FROM userxps AS x
+            JOIN termapplications AS a ON a.id = x.source_reference_id
+            JOIN terms AS t ON t.id = a.term_id
+            WHERE x.xp_source = 'TERM_ADDITION'
+            GROUP BY x.user_id
+        ) AS l
+        WHERE s.user_id = l.user_id
+        """
+    )
+    # Runs of consecutive login days; the latest run is the current streak.
+    op.execute(
+        """
+        UPDATE user_stats AS s
+        SET login_streak = r.current_run,
+            longest_login_streak = r.longest_run,
+            last_login_date = r.last_day
+        FROM (
+            SELECT user_id,
+                   (array_agg(days ORDER BY last_day DESC))[1] AS current_run,
+                   max(days) AS longest_run,
+                   max(last_day) AS last_day
+            FROM (
+                SELECT user_id, count(*) AS days, max(day) AS last_day
+                FROM (
+                    SELECT user_id, day,
+                           day - (row_number() OVER (
+                               PARTITION BY user_id ORDER BY day
+                           ))::int AS island
+                    FROM (
+                        SELECT DISTINCT user_id, date(created_at) AS day
+                        FROM userxps
+                        WHERE xp_source = 'LOGIN_STREAK'
+                    ) AS login_days
+                ) AS numbered
+                GROUP BY user_id, island
+            ) AS runs
+            GROUP BY user_id
+        ) AS r
+        WHERE s.user_id = r.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("user_stats")
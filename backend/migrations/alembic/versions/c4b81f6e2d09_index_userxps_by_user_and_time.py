@@ -0,0 +1,33 @@
+"""index userxps by user and creation time
+
+Revision ID: c4b81f6e2d09
+Revises: a7d3e9c41f52
+Create Date: 2025-10-14 15:08:52.417093
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4b81f6e2d09"
+down_revision: Union[str, Sequence[str], None] = "a7d3e9c41f52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_userxps_user_id_created_at",
+        "userxps",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_userxps_user_id_created_at", table_name="userxps")
@@ -0,0 +1,67 @@
+"""add comment reply counts and thread paging indexes
+
+Revision ID: c4d9e1f27a53
+Revises: b7e2f4a19c30
+Create Date: 2025-10-10 09:41:17.502981
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d9e1f27a53"
+down_revision: Union[str, Sequence[str], None] = "b7e2f4a19c30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "comments",
+        sa.Column(
+            "reply_count", sa.Integer(), nullable=False, server_default=sa.text("0")
+        ),
+    )
+    # Backfill from the live replies that already exist.
+    op.execute(
+        """
+        UPDATE comments AS c
+        SET reply_count = replies.count
+        FROM (
+            SELECT parent_id, count(*) AS count
+            FROM comments
+            WHERE parent_id IS NOT NULL AND NOT tombstone
+            GROUP BY parent_id
+        ) AS replies
+        WHERE c.id = replies.parent_id
+        """
+    )
+    op.create_index(
+        "ix_comments_term_threads",
+        "comments",
+        ["term_id", "date_posted", "id"],
+        unique=False,
+        postgresql_where=sa.text("parent_id IS NULL"),
+    )
+    op.create_index(
+        "ix_comments_parent_posted",
+        "comments",
+        ["parent_id", "date_posted", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_comments_parent_posted", table_name="comments")
+    op.drop_index(
+        "ix_comments_term_threads",
+        table_name="comments",
+        postgresql_where=sa.text("parent_id IS NULL"),
+    )
+    op.drop_column("comments", "reply_count")
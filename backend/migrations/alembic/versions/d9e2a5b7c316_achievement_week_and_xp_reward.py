@@ -0,0 +1,66 @@
+"""store weekly goal week and xp reward in columns
+
+Revision ID: d9e2a5b7c316
+Revises: c4b81f6e2d09
+Create Date: 2025-10-15 11:26:03.518742
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d9e2a5b7c316"
+down_revision: Union[str, Sequence[str], None] = "c4b81f6e2d09"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("achievements", sa.Column("week_id", sa.String(7), nullable=True))
+    op.add_column("achievements", sa.Column("xp_reward", sa.Integer(), nullable=True))
+    op.create_index(
+        op.f("ix_achievements_week_id"), "achievements", ["week_id"], unique=False
+    )
+    # Weekly goals were named "<name> 2025W03" and described "<text> [XP: 150]".
+    op.execute(
+        r"""
+        UPDATE achievements
+        SET week_id = substring(name FROM '\d{4}W\d{2}'),
+            name = btrim(regexp_replace(name, '\s*\d{4}W\d{2}', ''))
+        WHERE name ~ '\d{4}W\d{2}'
+        """
+    )
+    op.execute(
+        r"""
+        UPDATE achievements
+        SET xp_reward = substring(description FROM '\[XP: (\d+)\]')::integer,
+            description = regexp_replace(description, '\s*\[XP: \d+\]', '')
+        WHERE description ~ '\[XP: \d+\]'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        """
+        UPDATE achievements
+        SET description = description || ' [XP: ' || xp_reward || ']'
+        WHERE xp_reward IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        UPDATE achievements
+        SET name = name || ' ' || week_id
+        WHERE week_id IS NOT NULL
+        """
+    )
+    op.drop_index(op.f("ix_achievements_week_id"), table_name="achievements")
+    op.drop_column("achievements", "xp_reward")
+    op.drop_column("achievements", "week_id")
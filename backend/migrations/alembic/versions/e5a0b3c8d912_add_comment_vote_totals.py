@@ -0,0 +1,51 @@
+"""add comment vote totals
+
+Revision ID: e5a0b3c8d912
+Revises: c4d9e1f27a53
+Create Date: 2025-10-10 16:05:52.118406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a0b3c8d912"
+down_revision: Union[str, Sequence[str], None] = "c4d9e1f27a53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in ("upvotes", "downvotes"):
+        op.add_column(
+            "comments",
+            sa.Column(
+                column, sa.Integer(), nullable=False, server_default=sa.text("0")
+            ),
+        )
+    # Backfill from the votes cast so far.
+    op.execute(
+        """
+        UPDATE comments AS c
+        SET upvotes = totals.upvotes, downvotes = totals.downvotes
+        FROM (
+            SELECT comment_id,
+                   count(*) FILTER (WHERE vote = 'upvote') AS upvotes,
+                   count(*) FILTER (WHERE vote = 'downvote') AS downvotes
+            FROM commentvotes
+            GROUP BY comment_id
+        ) AS totals
+        WHERE c.id = totals.comment_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("comments", "downvotes")
+    op.drop_column("comments", "upvotes")
@@ -0,0 +1,45 @@
+"""backfill user levels from xp totals
+
+Revision ID: e5f1c7a93d42
+Revises: d9e2a5b7c316
+Create Date: 2025-10-16 09:42:18.204611
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f1c7a93d42"
+down_revision: Union[str, Sequence[str], None] = "d9e2a5b7c316"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Level rows are now kept by each XP insert; start every user with XP
+    # from their true total. Level L starts at 50 * L * (L - 1) XP.
+    op.execute(
+        """
+        INSERT INTO userlevels (id, user_id, total_xp, current_level)
+        SELECT gen_random_uuid(), totals.user_id, totals.total_xp,
+               (1 + floor(sqrt(1 + 4 * (greatest(totals.total_xp, 0) / 50)))::int) / 2
+        FROM (
+            SELECT user_id, sum(xp_amount)::int AS total_xp
+            FROM userxps
+            GROUP BY user_id
+        ) AS totals
+        ON CONFLICT (user_id) DO UPDATE
+        SET total_xp = excluded.total_xp,
+            current_level = excluded.current_level
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The backfilled values are still correct totals; nothing to undo.
+    pass
@@ -0,0 +1,75 @@
+"""one vote per user and target, add term vote totals
+
+Revision ID: f2c6a8d14b97
+Revises: e5a0b3c8d912
+Create Date: 2025-10-11 10:22:36.840157
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c6a8d14b97"
+down_revision: Union[str, Sequence[str], None] = "e5a0b3c8d912"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Racing votes could leave a user with two rows for one target; keep one.
+    for table, target in (("termvotes", "term_id"), ("commentvotes", "comment_id")):
+        op.execute(
+            f"""
+            DELETE FROM {table} AS v
+            USING {table} AS keep
+            WHERE v.user_id = keep.user_id
+              AND v.{target} = keep.{target}
+              AND v.ctid > keep.ctid
+            """
+        )
+    op.create_unique_constraint(
+        "uq_termvotes_user_term", "termvotes", ["user_id", "term_id"]
+    )
+    op.create_unique_constraint(
+        "uq_commentvotes_user_comment", "commentvotes", ["user_id", "comment_id"]
+    )
+
+    for column in ("upvotes", "downvotes"):
+        op.add_column(
+            "terms",
+            sa.Column(
+                column, sa.Integer(), nullable=False, server_default=sa.text("0")
+            ),
+        )
+    # Backfill term totals, and recount comment totals after the cleanup.
+    for table, votes, target in (
+        ("terms", "termvotes", "term_id"),
+        ("comments", "commentvotes", "comment_id"),
+    ):
+        op.execute(
+            f"""
+            UPDATE {table} AS t
+            SET upvotes = totals.upvotes, downvotes = totals.downvotes
+            FROM (
+                SELECT {target},
+                       count(*) FILTER (WHERE vote = 'upvote') AS upvotes,
+                       count(*) FILTER (WHERE vote = 'downvote') AS downvotes
+                FROM {votes}
+                GROUP BY {target}
+            ) AS totals
+            WHERE t.id = totals.{target}
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("terms", "downvotes")
+    op.drop_column("terms", "upvotes")
+    op.drop_constraint("uq_commentvotes_user_comment", "commentvotes", type_="unique")
+    op.drop_constraint("uq_termvotes_user_term", "termvotes", type_="unique")
@@ -30,5 +30,9 @@ echo ""
 echo "--- Running tests for Voting Service ---"
 docker-compose exec vote-service sh -c "PYTHONPATH=. pytest"
 
+echo ""
+echo "--- Running tests for Comment Service ---"
+docker-compose exec comment-service sh -c "PYTHONPATH=. pytest"
+
 echo ""
 echo "✅ All tests passed successfully!"
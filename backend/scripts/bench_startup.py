@@ -0,0 +1,130 @@
+# scripts/bench_startup.py
+"""
+Measures what a cold container pays before it can answer: the time to import
+each service's ``app.main``, to run its lifespan startup, and to serve the
+first request. Every service runs in a fresh interpreter, like a new
+container would. Run from backend/ with the usual DB_* settings exported:
+
+    python scripts/bench_startup.py [service ...] [--path /] [--runs 3] [--top 5]
+
+Startup and the first request run in-process through ASGI, so no server or
+network is involved; a lifespan that needs the database needs it reachable.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+BACKEND = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+COMMON_LIB = os.path.join(BACKEND, "mavito-common-lib")
+
+# Runs inside the service directory and prints one JSON line of timings.
+PROBE = """
+import asyncio, json, time
+start = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+import httpx
+
+async def serve():
+    application = app.main.app
+    timings = {"import": imported - start}
+    try:
+        t0 = time.perf_counter()
+        async with application.router.lifespan_context(application):
+            timings["startup"] = time.perf_counter() - t0
+            transport = httpx.ASGITransport(app=application)
+            async with httpx.AsyncClient(transport=transport, base_url="http://probe") as client:
+                t0 = time.perf_counter()
+                response = await client.get(PATH)
+                timings["first_request"] = time.perf_counter() - t0
+                timings["status"] = response.status_code
+                t0 = time.perf_counter()
+                await client.get(PATH)
+                timings["second_request"] = time.perf_counter() - t0
+    except Exception as e:
+        timings["error"] = repr(e)
+    print(json.dumps(timings))
+
+asyncio.run(serve())
+"""
+
+IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+\d+ \| *(\S+)")
+
+
+def services():
+    return sorted(
+        name
+        for name in os.listdir(BACKEND)
+        if name.endswith("-service")
+        and os.path.exists(os.path.join(BACKEND, name, "app", "main.py"))
+    )
+
+
+def probe(service, path, import_time=False):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [".", COMMON_LIB] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    )
+    flags = ["-X", "importtime"] if import_time else []
+    result = subprocess.run(
+        [sys.executable, *flags, "-c", f"PATH = {path!r}\n{PROBE}"],
+        cwd=os.path.join(BACKEND, service),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    lines = result.stdout.strip().splitlines()
+    if result.returncode or not lines:
+        error = (result.stderr.strip().splitlines() or ["no output"])[-1]
+        return {"error": error}, []
+    imports = [
+        (int(match.group(1)), match.group(2))
+        for match in map(IMPORT_TIME.match, result.stderr.splitlines())
+        if match
+    ]
+    return json.loads(lines[-1]), imports
+
+
+def ms(values):
+    return f"{statistics.median(values) * 1000:8.1f}" if values else "       -"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("services", nargs="*", default=None)
+    parser.add_argument("--path", default="/", help="path of the first request")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--top", type=int, default=0, help="also list the N modules slowest to import"
+    )
+    args = parser.parse_args()
+
+    columns = ("import", "startup", "first_request", "second_request")
+    print(f"{'service':<30}" + "".join(f"{c:>16}" for c in columns) + "  (ms)")
+    for service in args.services or services():
+        runs, errors = [], []
+        for _ in range(args.runs):
+            timings, _imports = probe(service, args.path)
+            if "error" in timings:
+                errors.append(timings["error"])
+            runs.append(timings)
+        row = "".join(
+            f"{ms([run[c] for run in runs if c in run]):>16}" for c in columns
+        )
+        print(f"{service:<30}{row}")
+        if errors:
+            print(f"    error: {errors[-1]}")
+        if args.top:
+            # Self times, from a separate run since -X importtime slows
+            # the import down.
+            _timings, imports = probe(service, args.path, import_time=True)
+            for self_us, module in sorted(imports, reverse=True)[: args.top]:
+                print(f"    {self_us / 1000:7.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
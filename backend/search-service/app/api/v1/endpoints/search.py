@@ -15,16 +15,40 @@ Dependencies:
 # search-service/app/api/v1/endpoints/search.py
 from fastapi import APIRouter, Query, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, Dict, Any
+from typing import List, Optional
+from typing_extensions import TypedDict
 from app.crud.crud_search import search_terms_in_db
-from mavito_common.db.session import get_db
+from mavito_common.db.replicas import get_read_db
+from mavito_common.http.responses import JSONSerializer
+from mavito_common.models.term_status import TermStatus
 
 router = APIRouter(redirect_slashes=False)
 
 
-@router.get("", response_model=Dict[str, Any])
+class SearchResult(TypedDict):
+    id: str
+    term: str
+    language: str
+    domain: str
+    definition: str
+    status: TermStatus
+    upvotes: int
+    downvotes: int
+    owner_id: str
+
+
+class SearchPage(TypedDict):
+    items: List[SearchResult]
+    total: int
+
+
+# Pages are encoded straight to bytes rather than through jsonable_encoder.
+search_page = JSONSerializer(SearchPage)
+
+
+@router.get("", response_model=SearchPage)
 async def search_endpoint(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     query: str = Query("", description="Search term"),
     language: Optional[str] = Query(None, description="Language filter"),
     domain: Optional[str] = Query(None, description="Domain filter"),
@@ -44,7 +68,7 @@ async def search_endpoint(
     paginated_results = results[start:end]
 
     # --- NEW: Unpack the tuple and build the response ---
-    response_items = []
+    response_items: List[SearchResult] = []
     for term, upvotes, downvotes in paginated_results:
         response_items.append(
             {
@@ -61,4 +85,4 @@ async def search_endpoint(
             }
         )
 
-    return {"items": response_items, "total": total}
+    return search_page.response({"items": response_items, "total": total})
@@ -18,7 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from typing import List
 from app.crud.crud_search import suggest_terms_in_db
-from mavito_common.db.session import get_db
+from mavito_common.db.replicas import get_read_db
 
 router = APIRouter(redirect_slashes=False)
 
@@ -30,7 +30,7 @@ class Suggestion(BaseModel):
 
 @router.get("", response_model=List[Suggestion])
 async def suggest_endpoint(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     query: str = Query(..., description="Partial search term"),
 ):
     terms = await suggest_terms_in_db(db, query)
@@ -2,13 +2,13 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any
 from app.crud.crud_search import get_all_terms_for_offline
-from mavito_common.db.session import get_db
+from mavito_common.db.replicas import get_read_db
 
 router = APIRouter(redirect_slashes=False)
 
 
 @router.get("/all-for-offline", response_model=Dict[str, Any])
-async def get_all_terms_for_pwa(db: AsyncSession = Depends(get_db)):
+async def get_all_terms_for_pwa(db: AsyncSession = Depends(get_read_db)):
     """
     Provides a single, unpaginated list of all terms for PWA caching.
     """
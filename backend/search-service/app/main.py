@@ -1,9 +1,18 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
+from mavito_common.http import health
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
+from mavito_common.http.read_your_writes import install_read_your_writes
 from app.api.v1.endpoints import search, suggest, terms
 
-app = FastAPI(title="Marito Search Service", redirect_slashes=False)
+app = FastAPI(
+    title="Marito Search Service", redirect_slashes=False, lifespan=service_lifespan
+)
+
+# Pin a client's reads to the primary briefly after it writes
+install_read_your_writes(app)
 
 if settings.BACKEND_CORS_ORIGINS_LIST:
     app.add_middleware(
@@ -17,6 +26,8 @@ if settings.BACKEND_CORS_ORIGINS_LIST:
 app.include_router(search.router, prefix="/api/v1/search", tags=["Search"])
 app.include_router(suggest.router, prefix="/api/v1/suggest", tags=["Suggest"])
 app.include_router(terms.router, prefix="/api/v1/terms", tags=["Terms"])
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
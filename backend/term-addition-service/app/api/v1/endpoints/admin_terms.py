@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from uuid import UUID
 
 from app import deps
 from app.crud.crud_term_application import crud_term_application
+from app.services.glossary_bundles import regenerate_bundles_for_term
 from mavito_common.schemas.user import User as UserSchema
 from mavito_common.schemas.term_application import (
     TermApplicationRead,
@@ -55,12 +56,14 @@ async def get_applications_for_admin_approval(
 )
 async def admin_approve_term_application(
     application_id: UUID,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(deps.get_db),
     current_user: UserSchema = Depends(deps.get_current_active_admin),
 ):
     """
     Allows an admin to approve a term application, moving it to ADMIN_APPROVED status.
-    This action also updates the associated Term record with the proposed content.
+    This action also updates the associated Term record with the proposed content
+    and schedules a rebuild of the affected static glossary bundles.
     """
     application = await crud_term_application.get_application_by_id(db, application_id)
     if not application:
@@ -77,6 +80,12 @@ async def admin_approve_term_application(
             detail=f"Application is in '{application.status}' status and cannot be admin-approved yet.",
         )
 
+    previous_key = (
+        (application.term.domain, application.term.language)
+        if application.term
+        else None
+    )
+
     try:
         updated_application = (
             await crud_term_application.update_application_status_and_term(
@@ -96,6 +105,10 @@ async def admin_approve_term_application(
             detail="Failed to admin-approve application.",
         )
 
+    background_tasks.add_task(
+        regenerate_bundles_for_term, updated_application.term_id, [previous_key]
+    )
+
     response_data = TermApplicationRead.model_validate(updated_application).model_dump()
     response_data["crowd_votes_count"] = (
         await crud_term_application.get_application_vote_count(db, application_id)
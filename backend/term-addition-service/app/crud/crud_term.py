@@ -3,8 +3,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 from typing import Any, Dict, List, Optional
-from mavito_common.models.term import Term as TermModel, term_translations
+from mavito_common.models.term import (
+    Term as TermModel,
+    refresh_translation_maps,
+    term_translations,
+)
 from mavito_common.models.term_status import TermStatus
+from mavito_common.models.data_version import TERMS_DATA_VERSION, bump_data_version
 from mavito_common.schemas.term import Term, TermCreate
 from mavito_common.schemas.term import Term as TermSchema  # noqa: F401
 
@@ -51,7 +56,9 @@ class CRUDTerm:
             # Insert the relationships directly
             if association_values:
                 await db.execute(term_translations.insert().values(association_values))
+                await db.execute(refresh_translation_maps([db_obj.id]))
 
+        await db.execute(bump_data_version(TERMS_DATA_VERSION))
         await db.commit()
         await db.refresh(db_obj)
 
@@ -117,6 +124,7 @@ class CRUDTerm:
     async def update_term(
         self, db: AsyncSession, *, db_obj: TermModel, obj_in: Dict[str, Any]
     ) -> TermModel:
+        refresh_pivot = False
         for field, value in obj_in.items():
             if field == "translations":
                 if value is not None:
@@ -132,6 +140,7 @@ class CRUDTerm:
                                 term_id=db_obj.id, translation_id=translation_id
                             )
                         )
+                    refresh_pivot = True
             elif field in [
                 "term",
                 "definition",
@@ -142,6 +151,8 @@ class CRUDTerm:
             ]:
                 if value is not None:
                     setattr(db_obj, field, value)
+                    # Terms that list this one as a translation embed its text.
+                    refresh_pivot = refresh_pivot or field in ("term", "language")
             elif field in [
                 "id",
                 "upvotes",
@@ -152,6 +163,10 @@ class CRUDTerm:
                 continue
 
         db.add(db_obj)
+        if refresh_pivot:
+            await db.flush()
+            await db.execute(refresh_translation_maps([db_obj.id]))
+        await db.execute(bump_data_version(TERMS_DATA_VERSION))
         await db.commit()
         await db.refresh(db_obj)
 
@@ -208,7 +223,24 @@ class CRUDTerm:
         """
         term = await db.get(TermModel, term_id)
         if term:
+            # The FK cascade drops the link rows, so collect the terms that
+            # embed this one in their translation_map before deleting it.
+            referrers = (
+                (
+                    await db.execute(
+                        select(term_translations.c.term_id).where(
+                            term_translations.c.translation_id == term_id
+                        )
+                    )
+                )
+                .scalars()
+                .all()
+            )
             await db.delete(term)
+            await db.flush()
+            if referrers:
+                await db.execute(refresh_translation_maps(referrers))
+            await db.execute(bump_data_version(TERMS_DATA_VERSION))
             await db.commit()
             return term
         return None
@@ -1,12 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, func, insert
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
 from typing import Optional, List
 from uuid import UUID
 import uuid
 from datetime import datetime
 
-from mavito_common.models.term import term_translations
+from mavito_common.models.term import refresh_translation_maps, term_translations
+from mavito_common.models.data_version import TERMS_DATA_VERSION, bump_data_version
 from mavito_common.models.term_application import TermApplication
 from mavito_common.models.term_application import TermApplicationVote
 from mavito_common.models.user import User as UserModel
@@ -351,6 +353,8 @@ class CRUDTermApplication:
         )
 
         await db.execute(stmt)
+        await db.execute(refresh_translation_maps([main_term_id]))
+        await db.execute(bump_data_version(TERMS_DATA_VERSION))
         await db.commit()
 
     async def delete_application_and_term(
@@ -1,4 +1,3 @@
-import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional, Union, Dict, Any
@@ -6,7 +5,11 @@ from uuid import UUID
 
 from mavito_common.models.user import User as UserModel
 from mavito_common.schemas.user import UserCreate, UserUpdate, UserCreateGoogle
-from mavito_common.core.security import get_password_hash, verify_password
+from mavito_common.core.security import (
+    UNUSABLE_PASSWORD,
+    get_password_hash_async,
+    verify_password_async,
+)
 from mavito_common.core.exceptions import InvalidPasswordError
 
 
@@ -52,9 +55,9 @@ class CRUDUser:
                     "Password must contain at least one uppercase letter."
                 )
 
-            user_data["password_hash"] = get_password_hash(obj_in.password)
+            user_data["password_hash"] = await get_password_hash_async(obj_in.password)
         else:
-            user_data["password_hash"] = get_password_hash(str(uuid.uuid4()))
+            user_data["password_hash"] = UNUSABLE_PASSWORD
 
         db_obj = UserModel(**user_data)
         db.add(db_obj)
@@ -89,7 +92,7 @@ class CRUDUser:
                     "New password must contain at least one uppercase letter."
                 )
 
-            hashed_password = get_password_hash(password)
+            hashed_password = await get_password_hash_async(password)
             db_obj.password_hash = hashed_password
             del update_data["password"]
 
@@ -108,7 +111,7 @@ class CRUDUser:
         user = await self.get_user_by_email(db, email=email)
         if not user:
             return None
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             return None
         return user
 
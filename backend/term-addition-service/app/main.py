@@ -2,12 +2,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
+from mavito_common.http import health
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
 
 # Import new endpoint routers from their respective files
 from app.api.v1.endpoints import terms, term_applications, admin_terms, linguist_terms
 
 # Initialize FastAPI
-app = FastAPI(title="Marito Term Addition Service")
+app = FastAPI(title="Marito Term Addition Service", lifespan=service_lifespan)
 
 # Apply CORS middleware based on settings
 if settings.BACKEND_CORS_ORIGINS_LIST:
@@ -36,6 +39,8 @@ app.include_router(
 app.include_router(
     admin_terms.router, prefix="/api/v1/admin/terms", tags=["Admin Term Management"]
 )
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
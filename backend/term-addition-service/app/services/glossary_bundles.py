@@ -0,0 +1,40 @@
+# app/services/glossary_bundles.py
+import logging
+from typing import Iterable, Optional
+from uuid import UUID
+
+from mavito_common.bundles.builder import (
+    BundleKey,
+    affected_bundle_keys,
+    rebuild_bundles,
+)
+from mavito_common.bundles.store import get_bundle_store
+from mavito_common.db.session import get_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+async def regenerate_bundles_for_term(
+    term_id: UUID, previous_keys: Iterable[Optional[BundleKey]] = ()
+) -> None:
+    """
+    Rebuilds the static glossary bundles affected by a newly approved term.
+    ``previous_keys`` covers the term's (domain, language) before approval so a
+    moved term also disappears from its old bundle. Runs as a background task
+    with its own session; failures are logged and never reach the approver.
+    """
+    store = get_bundle_store()
+    if store is None:
+        return
+    try:
+        async with get_sessionmaker()() as db:
+            keys = await affected_bundle_keys(db, [term_id])
+            keys.update(key for key in previous_keys if key is not None)
+            manifest = await rebuild_bundles(db, store, keys)
+        logger.info(
+            "Rebuilt %d glossary bundle(s) at data version %s",
+            len(keys),
+            manifest["data_version"],
+        )
+    except Exception:
+        logger.exception("Failed to rebuild glossary bundles for term %s", term_id)
@@ -1,18 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import uuid
-from typing import Literal, Optional  # noqa: F401
+from typing import List, Literal, Optional  # noqa: F401
 
+from app.crud.crud_vote import crud_vote
 from app.deps import get_current_active_user
+from app.services.vote_lookup_cache import vote_lookup_cache
 
 
 from mavito_common.db.session import get_db
 from mavito_common.models.user import User as UserModel
-from mavito_common.models.term_vote import TermVote, VoteType
-from mavito_common.models.comment_vote import CommentVote
-from mavito_common.models.comment import Comment
+from mavito_common.models.term_vote import VoteType
 
 router = APIRouter()
 
@@ -46,42 +45,19 @@ async def cast_term_vote(
     """
     Casts, updates, or removes a vote on a term for the current user.
     """
-    existing_vote_stmt = select(TermVote).where(
-        TermVote.user_id == current_user.id, TermVote.term_id == vote_in.term_id
+    tally = await crud_vote.cast_term_vote(
+        db, user_id=current_user.id, term_id=vote_in.term_id, vote=vote_in.vote
     )
-    result = await db.execute(existing_vote_stmt)
-    db_vote = result.scalars().first()
-
-    user_vote_status: VoteType | None = vote_in.vote
-
-    if db_vote:
-        if db_vote.vote == vote_in.vote:
-            await db.delete(db_vote)
-            user_vote_status = None
-        else:
-            db_vote.vote = vote_in.vote
-            db.add(db_vote)
-    else:
-        db_vote = TermVote(
-            user_id=current_user.id, term_id=vote_in.term_id, vote=vote_in.vote
+    if tally is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Term not found"
         )
-        db.add(db_vote)
-
-    await db.commit()
-
-    count_stmt = select(
-        func.count(TermVote.id).filter(TermVote.vote == VoteType.upvote),
-        func.count(TermVote.id).filter(TermVote.vote == VoteType.downvote),
-    ).where(TermVote.term_id == vote_in.term_id)
-
-    result = await db.execute(count_stmt)
-    upvotes, downvotes = result.one()
 
     return TermVoteResponse(
         term_id=vote_in.term_id,
-        upvotes=upvotes,
-        downvotes=downvotes,
-        user_vote=user_vote_status,
+        upvotes=tally.upvotes,
+        downvotes=tally.downvotes,
+        user_vote=tally.user_vote,
     )
 
 
@@ -104,51 +80,68 @@ async def cast_comment_vote(
     """
     Casts, updates, or removes a vote on a comment for the current user.
     """
-    comment_exists_stmt = select(Comment).where(
-        Comment.id == vote_in.comment_id, Comment.tombstone.is_(False)
+    tally = await crud_vote.cast_comment_vote(
+        db, user_id=current_user.id, comment_id=vote_in.comment_id, vote=vote_in.vote
     )
-    comment_result = await db.execute(comment_exists_stmt)
-    if not comment_result.scalars().first():
+    if tally is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Comment not found or is deleted",
         )
 
-    existing_vote_stmt = select(CommentVote).where(
-        CommentVote.user_id == current_user.id,
-        CommentVote.comment_id == vote_in.comment_id,
+    return CommentVoteResponse(
+        comment_id=vote_in.comment_id,
+        upvotes=tally.upvotes,
+        downvotes=tally.downvotes,
+        user_vote=tally.user_vote,
     )
-    result = await db.execute(existing_vote_stmt)
-    db_vote = result.scalars().first()
-
-    user_vote_status: VoteType | None = vote_in.vote
-
-    if db_vote:
-        if db_vote.vote == vote_in.vote:
-            await db.delete(db_vote)
-            user_vote_status = None
-        else:
-            db_vote.vote = vote_in.vote
-            db.add(db_vote)
-    else:
-        db_vote = CommentVote(
-            user_id=current_user.id, comment_id=vote_in.comment_id, vote=vote_in.vote
-        )
-        db.add(db_vote)
 
-    await db.commit()
 
-    count_stmt = select(
-        func.count(CommentVote.id).filter(CommentVote.vote == VoteType.upvote),
-        func.count(CommentVote.id).filter(CommentVote.vote == VoteType.downvote),
-    ).where(CommentVote.comment_id == vote_in.comment_id)
+# --- Bulk Lookup ---
+class VoteLookup(BaseModel):
+    term_ids: List[uuid.UUID] = Field(default_factory=list, max_length=100)
+    comment_ids: List[uuid.UUID] = Field(default_factory=list, max_length=100)
 
-    result = await db.execute(count_stmt)
-    upvotes, downvotes = result.one()
 
-    return CommentVoteResponse(
-        comment_id=vote_in.comment_id,
-        upvotes=upvotes,
-        downvotes=downvotes,
-        user_vote=user_vote_status,
+class VoteLookupResponse(BaseModel):
+    terms: List[TermVoteResponse]
+    comments: List[CommentVoteResponse]
+
+
+@router.post("/mine", response_model=VoteLookupResponse, status_code=200)
+async def get_my_votes(
+    *,
+    db: AsyncSession = Depends(get_db),
+    lookup: VoteLookup,
+    current_user: UserModel = Depends(get_current_active_user)
+):
+    """
+    Returns the totals and the current user's vote for each listed term and
+    comment, e.g. for a page of search results or a comment thread. Unknown
+    terms and missing or deleted comments are left out.
+    """
+    key = (tuple(lookup.term_ids), tuple(lookup.comment_ids))
+    cached = vote_lookup_cache.get(current_user.id, key)
+    if cached is not None:
+        return cached
+
+    terms, comments = await crud_vote.get_votes(
+        db,
+        user_id=current_user.id,
+        term_ids=lookup.term_ids,
+        comment_ids=lookup.comment_ids,
+    )
+    response = VoteLookupResponse(
+        terms=[
+            TermVoteResponse(term_id=term_id, **vars(terms[term_id]))
+            for term_id in dict.fromkeys(lookup.term_ids)
+            if term_id in terms
+        ],
+        comments=[
+            CommentVoteResponse(comment_id=comment_id, **vars(comments[comment_id]))
+            for comment_id in dict.fromkeys(lookup.comment_ids)
+            if comment_id in comments
+        ],
     )
+    vote_lookup_cache.put(current_user.id, key, response)
+    return response
@@ -0,0 +1,238 @@
+# app/crud/crud_vote.py
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import and_, delete, exists, func, literal, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.core.config import settings
+from mavito_common.models.comment import Comment
+from mavito_common.models.comment_vote import CommentVote
+from mavito_common.models.term import Term
+from mavito_common.models.term_vote import TermVote, VoteType
+
+from app.services.vote_buffer import vote_buffer
+from app.services.vote_events import totals_event
+from app.services.vote_lookup_cache import vote_lookup_cache
+
+
+@dataclass
+class VoteTally:
+    upvotes: int
+    downvotes: int
+    user_vote: Optional[VoteType]
+
+
+Tallies = Dict[uuid.UUID, VoteTally]
+
+
+class CRUDVote:
+    """
+    Casting a vote is a single statement: toggle the user's row off, switch
+    it, or insert it, then move the target's stored totals by what actually
+    changed and return them. Row locks and the one-vote-per-user unique
+    constraint keep concurrent votes by the same user from double counting.
+    With VOTE_WRITE_BEHIND, the totals change is buffered instead; see
+    app.services.vote_buffer.
+    """
+
+    async def cast_term_vote(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+        term_id: uuid.UUID,
+        vote: VoteType,
+    ) -> Optional[VoteTally]:
+        """Returns None if the term does not exist."""
+        return await self._cast(db, TermVote, "term_id", Term, term_id, user_id, vote)
+
+    async def cast_comment_vote(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+        comment_id: uuid.UUID,
+        vote: VoteType,
+    ) -> Optional[VoteTally]:
+        """Returns None if the comment does not exist or is deleted."""
+        return await self._cast(
+            db,
+            CommentVote,
+            "comment_id",
+            Comment,
+            comment_id,
+            user_id,
+            vote,
+            Comment.tombstone.is_(False),
+        )
+
+    async def get_votes(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+        term_ids: Sequence[uuid.UUID] = (),
+        comment_ids: Sequence[uuid.UUID] = (),
+    ) -> Tuple[Tallies, Tallies]:
+        """
+        Totals and the user's vote for each existing term and live comment,
+        in one query: primary key lookups joined to the user's votes through
+        the one-vote-per-user unique indexes.
+        """
+        parts = []
+        for kind, ids, vote_model, target_column, target_model, *filters in (
+            ("term", term_ids, TermVote, "term_id", Term),
+            (
+                "comment",
+                comment_ids,
+                CommentVote,
+                "comment_id",
+                Comment,
+                Comment.tombstone.is_(False),
+            ),
+        ):
+            if not ids:
+                continue
+            votes = vote_model.__table__
+            parts.append(
+                select(
+                    literal(kind).label("kind"),
+                    target_model.id,
+                    target_model.upvotes,
+                    target_model.downvotes,
+                    votes.c.vote,
+                )
+                .outerjoin(
+                    votes,
+                    and_(
+                        votes.c[target_column] == target_model.id,
+                        votes.c.user_id == user_id,
+                    ),
+                )
+                .where(target_model.id.in_(ids), *filters)
+            )
+        terms: Tallies = {}
+        comments: Tallies = {}
+        if not parts:
+            return terms, comments
+        stmt = parts[0] if len(parts) == 1 else union_all(*parts)
+        for kind, target_id, upvotes, downvotes, vote in await db.execute(stmt):
+            target_model, tallies = (
+                (Term, terms) if kind == "term" else (Comment, comments)
+            )
+            pending_up, pending_down = vote_buffer.pending(target_model, target_id)
+            tallies[target_id] = VoteTally(
+                upvotes=upvotes + pending_up,
+                downvotes=downvotes + pending_down,
+                user_vote=VoteType(vote) if vote is not None else None,
+            )
+        return terms, comments
+
+    async def _cast(
+        self,
+        db: AsyncSession,
+        vote_model: Type[Any],
+        target_column: str,
+        target_model: Type[Any],
+        target_id: uuid.UUID,
+        user_id: uuid.UUID,
+        vote: VoteType,
+        *target_filters: Any,
+    ) -> Optional[VoteTally]:
+        votes = vote_model.__table__
+        mine = (votes.c.user_id == user_id) & (votes.c[target_column] == target_id)
+        target_exists = exists().where(target_model.id == target_id, *target_filters)
+
+        # Voting the same way again withdraws the vote.
+        removed = (
+            delete(votes)
+            .where(mine, votes.c.vote == vote, target_exists)
+            .returning(votes.c.id)
+            .cte("removed")
+        )
+        switched = (
+            update(votes)
+            .where(mine, votes.c.vote != vote, target_exists)
+            .values(vote=vote)
+            .returning(votes.c.id)
+            .cte("switched")
+        )
+        # A concurrent first vote by the same user wins the unique constraint;
+        # this one then changes nothing rather than counting twice.
+        inserted = (
+            insert(votes)
+            .from_select(
+                ["id", "user_id", target_column, "vote"],
+                select(
+                    literal(uuid.uuid4(), votes.c.id.type),
+                    literal(user_id, votes.c.user_id.type),
+                    literal(target_id, votes.c[target_column].type),
+                    literal(vote, votes.c.vote.type),
+                ).where(
+                    target_exists,
+                    ~exists(select(removed.c.id)),
+                    ~exists(select(switched.c.id)),
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", target_column])
+            .returning(votes.c.id)
+            .cte("inserted")
+        )
+
+        def count(cte: Any) -> Any:
+            return select(func.count()).select_from(cte).scalar_subquery()
+
+        n_removed, n_switched = count(removed), count(switched)
+        gained = count(inserted) + n_switched - n_removed
+        change = {vote: gained, _other(vote): -n_switched}
+        up, down = change[VoteType.upvote], change[VoteType.downvote]
+        is_target = (target_model.id == target_id, *target_filters)
+        if settings.VOTE_WRITE_BEHIND:
+            # Read the stored totals without locking the target row; the
+            # change is written later by vote_buffer.
+            stmt = select(
+                target_model.upvotes, target_model.downvotes, n_removed, up, down
+            ).where(*is_target)
+        else:
+            stmt = (
+                update(target_model)
+                .where(*is_target)
+                .values(
+                    upvotes=target_model.upvotes + up,
+                    downvotes=target_model.downvotes + down,
+                )
+                .returning(
+                    target_model.upvotes,
+                    target_model.downvotes,
+                    n_removed,
+                    literal(0),
+                    literal(0),
+                    # Term page streams hear of the new totals on commit.
+                    totals_event(target_model),
+                )
+            )
+        row = (await db.execute(stmt)).one_or_none()
+        await db.commit()
+        vote_lookup_cache.invalidate(user_id)
+        if row is None:
+            return None
+        upvotes, downvotes, withdrawn, up_change, down_change = row[:5]
+        if settings.VOTE_WRITE_BEHIND:
+            vote_buffer.add(target_model, target_id, (up_change, down_change))
+            pending_up, pending_down = vote_buffer.pending(target_model, target_id)
+            upvotes, downvotes = upvotes + pending_up, downvotes + pending_down
+        return VoteTally(
+            upvotes=upvotes,
+            downvotes=downvotes,
+            user_vote=None if withdrawn else vote,
+        )
+
+
+def _other(vote: VoteType) -> VoteType:
+    return VoteType.downvote if vote is VoteType.upvote else VoteType.upvote
+
+
+crud_vote = CRUDVote()
@@ -2,9 +2,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
+from mavito_common.http import health, term_stream
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
 from app.api.v1.endpoints import vote
 
-app = FastAPI(title="Marito Vote Service")
+app = FastAPI(title="Marito Vote Service", lifespan=service_lifespan)
 
 if settings.BACKEND_CORS_ORIGINS_LIST:
     app.add_middleware(
@@ -16,6 +19,9 @@ if settings.BACKEND_CORS_ORIGINS_LIST:
     )
 
 app.include_router(vote.router, prefix="/api/v1/votes", tags=["Votes"])
+app.include_router(term_stream.router)
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
@@ -0,0 +1,156 @@
+# app/services/vote_buffer.py
+"""
+Write-behind buffer for vote totals. With VOTE_WRITE_BEHIND on, each vote
+still writes its own vote row at once, but the change to the term's or
+comment's stored totals is added here and written for all targets in one
+``UPDATE ... FROM (VALUES ...)`` every VOTE_FLUSH_INTERVAL_SECONDS. Hot
+targets then take one row lock per interval rather than one per vote.
+
+Totals served while changes are buffered are the stored total plus this
+process's pending changes, so other processes see them one interval late.
+Each flush also announces the new totals of every target it touched on
+the term event stream. Buffered changes are flushed on shutdown; a crash loses at most one interval
+of them, which the vote rows can always be recounted from.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import Integer, column, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from mavito_common.core.config import settings
+from mavito_common.db.session import get_sessionmaker
+from mavito_common.http.lifespan import on_shutdown
+
+from app.services.vote_events import totals_event
+
+logger = logging.getLogger(__name__)
+
+# (upvotes, downvotes)
+Change = Tuple[int, int]
+Key = Tuple[Type[Any], uuid.UUID]
+
+
+class VoteBuffer:
+    def __init__(
+        self,
+        interval: float = 0.05,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ) -> None:
+        self.interval = interval
+        self._session_factory = session_factory
+        self._pending: Dict[Key, List[int]] = defaultdict(lambda: [0, 0])
+        # Taken by a flush that has not committed yet; still counted.
+        self._flushing: Dict[Key, List[int]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._lock = asyncio.Lock()
+        self.flushes = 0
+        self.flushed_changes = 0
+
+    def add(self, model: Type[Any], target_id: uuid.UUID, change: Change) -> None:
+        if change == (0, 0):
+            return
+        buffered = self._pending[(model, target_id)]
+        buffered[0] += change[0]
+        buffered[1] += change[1]
+        if self._timer is None and self._task is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.interval, self._start_flush)
+
+    def pending(self, model: Type[Any], target_id: uuid.UUID) -> Change:
+        """Changes to the target's totals not yet visible in the database."""
+        key = (model, target_id)
+        up, down = self._pending.get(key, (0, 0))
+        flushing_up, flushing_down = self._flushing.get(key, (0, 0))
+        return up + flushing_up, down + flushing_down
+
+    def _start_flush(self) -> None:
+        self._timer = None
+        self._task = asyncio.get_running_loop().create_task(self._flush_in_background())
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            logger.warning("Flushing buffered vote totals failed", exc_info=True)
+        finally:
+            self._task = None
+            if self._pending and self._timer is None:
+                loop = asyncio.get_running_loop()
+                self._timer = loop.call_later(self.interval, self._start_flush)
+
+    async def flush(self, db: Optional[AsyncSession] = None) -> None:
+        """Writes every buffered change; failed changes stay buffered."""
+        async with self._lock:
+            if not self._pending:
+                return
+            self._flushing = self._pending
+            self._pending = defaultdict(lambda: [0, 0])
+            try:
+                if db is None:
+                    factory = self._session_factory or get_sessionmaker()
+                    async with factory() as db:
+                        await self._write(db, self._flushing)
+                else:
+                    await self._write(db, self._flushing)
+            except BaseException:
+                for key, (up, down) in self._flushing.items():
+                    self._pending[key][0] += up
+                    self._pending[key][1] += down
+                raise
+            finally:
+                flushed, self._flushing = self._flushing, {}
+            self.flushes += 1
+            self.flushed_changes += len(flushed)
+
+    async def _write(self, db: AsyncSession, changes: Dict[Key, List[int]]) -> None:
+        by_model: Dict[Type[Any], List[Tuple[uuid.UUID, int, int]]] = defaultdict(list)
+        for (model, target_id), (up, down) in changes.items():
+            by_model[model].append((target_id, up, down))
+        # Sorted, so concurrent flushes from other processes lock rows in the
+        # same order.
+        for model, rows in sorted(
+            by_model.items(), key=lambda item: item[0].__tablename__
+        ):
+            rows.sort()
+            delta = values(
+                column("id", UUID(as_uuid=True)),
+                column("up", Integer),
+                column("down", Integer),
+                name="delta",
+            ).data(rows)
+            await db.execute(
+                update(model)
+                .where(model.id == delta.c.id)
+                .values(
+                    upvotes=model.upvotes + delta.c.up,
+                    downvotes=model.downvotes + delta.c.down,
+                )
+                .returning(totals_event(model))
+            )
+        await db.commit()
+
+    async def close(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._task is not None:
+            await self._task
+        try:
+            await self.flush()
+        except Exception:
+            logger.error(
+                "Lost buffered vote totals at shutdown; recount them from the "
+                "vote rows",
+                exc_info=True,
+            )
+
+
+vote_buffer = VoteBuffer(interval=settings.VOTE_FLUSH_INTERVAL_SECONDS)
+on_shutdown(vote_buffer.close)
@@ -0,0 +1,24 @@
+# app/services/vote_events.py
+from typing import Any, Type
+
+from mavito_common.http.term_stream import term_event
+from mavito_common.models.comment import Comment
+from mavito_common.models.term import Term
+
+
+def totals_event(target_model: Type[Any]) -> Any:
+    """
+    The term stream event announcing a target's vote totals, for the
+    RETURNING clause of the statement that just changed them.
+    """
+    if target_model is Term:
+        return term_event(
+            Term.id, "term_votes", upvotes=Term.upvotes, downvotes=Term.downvotes
+        )
+    return term_event(
+        Comment.term_id,
+        "comment_votes",
+        comment_id=Comment.id,
+        upvotes=Comment.upvotes,
+        downvotes=Comment.downvotes,
+    )
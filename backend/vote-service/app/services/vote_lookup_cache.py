@@ -0,0 +1,71 @@
+# app/services/vote_lookup_cache.py
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from mavito_common.core.config import settings
+from mavito_common.observability.metrics import register_cache
+
+
+class VoteLookupCache:
+    """
+    Recent bulk vote lookups, grouped by user so that a user's own vote drops
+    all of theirs at once. Bounded to ``max_users`` users, least recently used
+    first, and ``max_per_user`` lookups each; entries also expire after
+    ``ttl_seconds`` because other users' votes move the totals.
+    """
+
+    def __init__(
+        self,
+        max_users: int = 10_000,
+        max_per_user: int = 8,
+        ttl_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_users = max_users
+        self.max_per_user = max_per_user
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._users: (
+            "OrderedDict[uuid.UUID, OrderedDict[Hashable, Tuple[Any, float]]]"
+        ) = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: uuid.UUID, key: Hashable) -> Optional[Any]:
+        entries = self._users.get(user_id)
+        entry = entries.get(key) if entries is not None else None
+        if entry is None or self._clock() >= entry[1]:
+            self.misses += 1
+            return None
+        self._users.move_to_end(user_id)
+        entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, user_id: uuid.UUID, key: Hashable, value: Any) -> None:
+        entries = self._users.setdefault(user_id, OrderedDict())
+        entries[key] = (value, self._clock() + self.ttl_seconds)
+        entries.move_to_end(key)
+        while len(entries) > self.max_per_user:
+            entries.popitem(last=False)
+        self._users.move_to_end(user_id)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        self._users.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._users.clear()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._users.values())
+
+
+vote_lookup_cache = VoteLookupCache(
+    max_users=settings.VOTE_LOOKUP_CACHE_USERS,
+    ttl_seconds=settings.VOTE_LOOKUP_CACHE_TTL_SECONDS,
+)
+register_cache("vote_lookup", vote_lookup_cache)
@@ -1,6 +1,7 @@
 # vote-service/app/tests/conftest.py
 
 import asyncio
+import pytest
 import pytest_asyncio
 from typing import AsyncGenerator
 from sqlalchemy import text
@@ -17,6 +18,7 @@ from mavito_common.db.base_class import Base
 from mavito_common.core.config import settings
 from app.main import app  # Assuming your FastAPI app is here
 from mavito_common.db.session import get_db
+from mavito_common.core.auth import principal_cache, revocation_version
 
 # Build database URLs
 DEFAULT_DB_URL = str(settings.SQLALCHEMY_DATABASE_URL).replace(
@@ -79,3 +81,10 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[httpx.AsyncClient,
         yield client
 
     del app.dependency_overrides[get_db]
+
+
+@pytest.fixture(autouse=True)
+def reset_principal_cache():
+    """Every test gets a fresh database, so cached principals must not leak."""
+    principal_cache.clear()
+    revocation_version.invalidate()
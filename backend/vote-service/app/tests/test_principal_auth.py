@@ -0,0 +1,99 @@
+"""
+Tests for token-claim authentication and the shared principal cache.
+"""
+
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from mavito_common.core.auth import (
+    PrincipalCache,
+    UnknownPrincipalError,
+    authenticate,
+    principal_cache,
+    revoke_principals,
+    token_claims,
+)
+from mavito_common.core.security import create_access_token
+from mavito_common.models.user import User, UserRole
+from mavito_common.schemas.token import Principal
+
+
+@pytest_asyncio.fixture
+async def user(db_session):
+    user = User(
+        first_name="Claims",
+        last_name="User",
+        email="claims@example.com",
+        password_hash="x",
+        role=UserRole.contributor,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_claims_token_needs_no_user_lookup(db_session, user):
+    token = create_access_token(data=await token_claims(db_session, user))
+
+    # Remove the row: a current-version token must still authenticate.
+    await db_session.delete(user)
+    await db_session.commit()
+
+    principal = await authenticate(db_session, token)
+    assert principal.id == user.id
+    assert principal.role == UserRole.contributor
+    assert len(principal_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_legacy_token_falls_back_to_database(db_session, user):
+    principal = await authenticate(
+        db_session, create_access_token(data={"sub": user.email})
+    )
+    assert principal.id == user.id
+    assert principal.is_active
+
+    with pytest.raises(UnknownPrincipalError):
+        await authenticate(
+            db_session, create_access_token(data={"sub": "ghost@example.com"})
+        )
+
+
+@pytest.mark.asyncio
+async def test_revocation_reloads_stale_claims(db_session, user):
+    token = create_access_token(data=await token_claims(db_session, user))
+    assert (await authenticate(db_session, token)).role == UserRole.contributor
+
+    user.role = UserRole.admin
+    user.account_locked = True
+    await revoke_principals(db_session)
+    await db_session.commit()
+
+    principal = await authenticate(db_session, token)
+    assert principal.role == UserRole.admin
+    assert principal.account_locked
+
+
+def test_principal_cache_lru_and_ttl():
+    now = [0.0]
+    cache = PrincipalCache(maxsize=2, ttl_seconds=10, clock=lambda: now[0])
+    principals = [
+        Principal(id=uuid.uuid4(), email=f"user{i}@example.com") for i in range(3)
+    ]
+
+    cache.put("a", principals[0])
+    cache.put("b", principals[1])
+    assert cache.get("a") is principals[0]  # refreshes "a"
+    cache.put("c", principals[2])  # evicts "b"
+    assert cache.get("b") is None
+    assert cache.get("c") is principals[2]
+
+    now[0] = 10.0
+    assert cache.get("a") is None
+
+    cache.put("a", principals[0])
+    cache.sync_revocation(1)
+    assert cache.get("a") is None
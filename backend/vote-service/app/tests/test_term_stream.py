@@ -0,0 +1,80 @@
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.engine import make_url
+
+from mavito_common.core.security import create_access_token
+from mavito_common.http.term_stream import TermEventHub
+
+from app.tests.conftest import TEST_DATABASE_URL
+from app.tests.test_vote_endpoint import create_test_term, create_test_user
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_events_fan_out_and_coalesce_per_item():
+    hub = TermEventHub()
+    hub._listen = _no_listen  # dispatch only; no database
+    term_id, other_term_id, comment_id = uuid4(), uuid4(), uuid4()
+    first = await hub.subscribe(term_id)
+    second = await hub.subscribe(term_id)
+    elsewhere = await hub.subscribe(other_term_id)
+
+    for upvotes in (1, 2, 3):
+        hub.dispatch(
+            json.dumps(
+                {"type": "term_votes", "term_id": str(term_id), "upvotes": upvotes}
+            )
+        )
+    hub.dispatch(
+        json.dumps(
+            {"type": "comment", "term_id": str(term_id), "comment_id": str(comment_id)}
+        )
+    )
+
+    for subscription in (first, second):
+        batch = await subscription.next_batch(timeout=1, coalesce=0)
+        assert [(e["type"], e.get("upvotes")) for e in batch] == [
+            ("term_votes", 3),
+            ("comment", None),
+        ]
+    assert await elsewhere.next_batch(timeout=0.01, coalesce=0) == []
+
+    hub.unsubscribe(term_id, first)
+    hub.unsubscribe(term_id, second)
+    hub.unsubscribe(other_term_id, elsewhere)
+    assert hub.subscribers == 0
+
+
+async def _no_listen() -> None:
+    return None
+
+
+async def test_vote_is_announced_on_commit(client, db_session):
+    user = await create_test_user(db_session)
+    term = await create_test_term(db_session, owner=user)
+    dsn = make_url(TEST_DATABASE_URL).set(drivername="postgresql")
+    hub = TermEventHub(dsn=dsn.render_as_string(hide_password=False))
+    subscription = await hub.subscribe(term.id)
+    try:
+        response = await client.post(
+            "/api/v1/votes/terms",
+            json={"term_id": str(term.id), "vote": "upvote"},
+            headers={
+                "Authorization": f"Bearer {create_access_token(data={'sub': user.email})}"
+            },
+        )
+        assert response.status_code == 200
+
+        batch = await subscription.next_batch(timeout=5, coalesce=0)
+        assert batch == [
+            {
+                "type": "term_votes",
+                "term_id": str(term.id),
+                "upvotes": 1,
+                "downvotes": 0,
+            }
+        ]
+    finally:
+        await hub.close()
@@ -1,8 +1,10 @@
+import asyncio
+
 import pytest
 import pytest_asyncio  # noqa: F401
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import func, select
 from uuid import uuid4
 
 from mavito_common.models.user import User, UserRole
@@ -10,8 +12,14 @@ from mavito_common.models.term import Term
 from mavito_common.models.comment import Comment
 from mavito_common.models.term_vote import TermVote, VoteType
 from mavito_common.models.comment_vote import CommentVote
+from mavito_common.core.config import settings
 from mavito_common.core.security import create_access_token
 
+from app.crud.crud_vote import crud_vote
+from app.services.vote_buffer import vote_buffer
+from app.services.vote_lookup_cache import VoteLookupCache
+from app.tests.conftest import TEST_DATABASE_URL
+
 
 # Helper function to create a test user
 async def create_test_user(db: AsyncSession) -> User:
@@ -171,6 +179,91 @@ async def test_unvote_an_existing_vote(client: AsyncClient, db_session: AsyncSes
     assert vote_in_db is None
 
 
+async def test_vote_on_missing_term_returns_404(
+    client: AsyncClient, db_session: AsyncSession
+):
+    user = await create_test_user(db_session)
+    token = create_access_token(data={"sub": user.email})
+
+    response = await client.post(
+        "/api/v1/votes/terms",
+        json={"term_id": str(uuid4()), "vote": "upvote"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 404
+
+
+async def test_concurrent_votes_keep_term_totals_exact(db_session: AsyncSession):
+    owner = await create_test_user(db_session)
+    term = await create_test_term(db_session, owner=owner)
+    voters = [await create_test_user(db_session) for _ in range(10)]
+    engine = create_async_engine(TEST_DATABASE_URL, pool_size=20)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def vote(user: User, kind: VoteType) -> None:
+        async with sessions() as db:
+            await crud_vote.cast_term_vote(
+                db, user_id=user.id, term_id=term.id, vote=kind
+            )
+
+    try:
+        # Every voter double-clicks upvote and half of them also downvote,
+        # all at once, so the same user's votes race each other too.
+        await asyncio.gather(
+            *(vote(user, VoteType.upvote) for user in voters * 2),
+            *(vote(user, VoteType.downvote) for user in voters[::2]),
+        )
+    finally:
+        await engine.dispose()
+
+    counted = (
+        await db_session.execute(
+            select(
+                func.count().filter(TermVote.vote == VoteType.upvote),
+                func.count().filter(TermVote.vote == VoteType.downvote),
+            ).where(TermVote.term_id == term.id)
+        )
+    ).one()
+    await db_session.refresh(term)
+    assert (term.upvotes, term.downvotes) == tuple(counted)
+    assert term.upvotes + term.downvotes <= len(voters)
+
+
+async def test_write_behind_serves_buffered_totals_until_flushed(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch
+):
+    monkeypatch.setattr(settings, "VOTE_WRITE_BEHIND", True)
+    monkeypatch.setattr(vote_buffer, "interval", 60.0)
+    owner = await create_test_user(db_session)
+    term = await create_test_term(db_session, owner=owner)
+    voters = [await create_test_user(db_session) for _ in range(3)]
+
+    for user, vote in [
+        (voters[0], "upvote"),
+        (voters[1], "upvote"),
+        (voters[2], "downvote"),
+        (voters[1], "downvote"),  # changes the vote
+    ]:
+        token = create_access_token(data={"sub": user.email})
+        response = await client.post(
+            "/api/v1/votes/terms",
+            json={"term_id": str(term.id), "vote": vote},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+
+    assert (response.json()["upvotes"], response.json()["downvotes"]) == (1, 2)
+    await db_session.refresh(term)
+    assert (term.upvotes, term.downvotes) == (0, 0)
+
+    await vote_buffer.flush(db_session)
+    await db_session.refresh(term)
+    assert (term.upvotes, term.downvotes) == (1, 2)
+    assert vote_buffer.pending(Term, term.id) == (0, 0)
+    await vote_buffer.close()
+
+
 # --- Comment Voting Tests ---
 
 
@@ -272,6 +365,34 @@ async def test_unvote_an_existing_comment_vote(
     assert vote_in_db is None
 
 
+async def test_comment_vote_totals_are_stored_on_the_comment(
+    client: AsyncClient, db_session: AsyncSession
+):
+    author = await create_test_user(db_session)
+    voter = await create_test_user(db_session)
+    term = await create_test_term(db_session, owner=author)
+    comment = await create_test_comment(db_session, user=author, term=term)
+
+    for user, vote in [
+        (author, "upvote"),
+        (voter, "upvote"),
+        (voter, "downvote"),  # changes the vote
+        (author, "upvote"),  # removes the vote
+    ]:
+        token = create_access_token(data={"sub": user.email})
+        response = await client.post(
+            "/api/v1/votes/comments",
+            json={"comment_id": str(comment.id), "vote": vote},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+
+    assert response.json()["upvotes"] == 0
+    assert response.json()["downvotes"] == 1
+    await db_session.refresh(comment)
+    assert (comment.upvotes, comment.downvotes) == (0, 1)
+
+
 async def test_vote_on_deleted_comment_raises_error(
     client: AsyncClient, db_session: AsyncSession
 ):
@@ -292,3 +413,81 @@ async def test_vote_on_deleted_comment_raises_error(
 
     assert response.status_code == 404
     assert "Comment not found or is deleted" in response.json()["detail"]
+
+
+# --- Bulk Lookup Tests ---
+
+
+async def test_my_votes_lists_totals_and_own_votes(
+    client: AsyncClient, db_session: AsyncSession
+):
+    user = await create_test_user(db_session)
+    other = await create_test_user(db_session)
+    voted, unvoted = [await create_test_term(db_session, owner=user) for _ in range(2)]
+    comment = await create_test_comment(db_session, user=user, term=voted)
+    deleted = await create_test_comment(db_session, user=user, term=voted)
+    deleted.tombstone = True
+    await db_session.commit()
+
+    async def vote(voter: User, kind: str, target: str, target_id) -> None:
+        token = create_access_token(data={"sub": voter.email})
+        response = await client.post(
+            f"/api/v1/votes/{kind}s",
+            json={f"{kind}_id": str(target_id), "vote": target},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+
+    async def lookup() -> dict:
+        token = create_access_token(data={"sub": user.email})
+        response = await client.post(
+            "/api/v1/votes/mine",
+            json={
+                "term_ids": [str(voted.id), str(uuid4()), str(unvoted.id)],
+                "comment_ids": [str(comment.id), str(deleted.id)],
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    await vote(user, "term", "upvote", voted.id)
+    await vote(other, "term", "downvote", voted.id)
+    await vote(other, "comment", "upvote", comment.id)
+
+    data = await lookup()
+    assert [
+        (t["term_id"], t["upvotes"], t["downvotes"], t["user_vote"])
+        for t in data["terms"]
+    ] == [(str(voted.id), 1, 1, "upvote"), (str(unvoted.id), 0, 0, None)]
+    assert [
+        (c["comment_id"], c["upvotes"], c["user_vote"]) for c in data["comments"]
+    ] == [(str(comment.id), 1, None)]
+
+    # The user's own vote shows at once, despite the cached lookup.
+    await vote(user, "comment", "downvote", comment.id)
+    data = await lookup()
+    assert data["comments"][0]["user_vote"] == "downvote"
+    assert data["comments"][0]["downvotes"] == 1
+
+
+def test_vote_lookup_cache_drops_a_users_entries_together():
+    now = [0.0]
+    cache = VoteLookupCache(
+        max_users=2, max_per_user=2, ttl_seconds=5, clock=lambda: now[0]
+    )
+    alice, bob, carol = uuid4(), uuid4(), uuid4()
+    cache.put(alice, "a", 1)
+    cache.put(alice, "b", 2)
+    cache.put(bob, "a", 3)
+    assert cache.get(alice, "a") == 1
+
+    cache.invalidate(alice)
+    assert cache.get(alice, "a") is None and cache.get(alice, "b") is None
+    assert cache.get(bob, "a") == 3
+
+    cache.put(alice, "a", 1)
+    cache.put(carol, "a", 4)  # bob is least recently used
+    assert cache.get(bob, "a") is None
+    now[0] = 5.0
+    assert cache.get(carol, "a") is None
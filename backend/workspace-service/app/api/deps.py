@@ -1,12 +1,14 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from mavito_common.core.config import settings
+from mavito_common.core.auth import (
+    InvalidTokenError,
+    UnknownPrincipalError,
+    authenticate,
+)
 from mavito_common.db.session import get_db
-from mavito_common.models.user import User
+from mavito_common.schemas.token import Principal
 
 security = HTTPBearer()
 
@@ -14,40 +16,24 @@ security = HTTPBearer()
 async def get_current_user(
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> User:
+) -> Principal:
     """
-    Get current user from JWT token.
+    Get current user from JWT token, normally from the token claims or the
+    shared principal cache without querying ``users``.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
     try:
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
+        return await authenticate(db, credentials.credentials)
+    except (InvalidTokenError, UnknownPrincipalError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
-
-    if user is None:
-        raise credentials_exception
-
-    return user
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """
     Get current active user (non-disabled).
     """
@@ -8,6 +8,7 @@ import httpx
 from mavito_common.models.term import Term
 from mavito_common.models.user import User
 from mavito_common.db.session import get_db
+from mavito_common.http.client import InternalHTTPClient, get_http_client
 from mavito_common.schemas.bookmark import (
     BookmarkTermRequest,
     BookmarkGlossaryRequest,
@@ -125,30 +126,30 @@ async def bookmark_glossary(
     db: AsyncSession = Depends(get_db),
     bookmark_request: BookmarkGlossaryRequest,
     current_user: User = Depends(deps.get_current_active_user),
+    http_client: InternalHTTPClient = Depends(get_http_client),
 ):
     """
     Bookmark a glossary for the current user.
     """
     # Check if glossary exists by calling the glossary service
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{GLOSSARY_INTERNAL_URL}/api/v1/glossary/categories/{bookmark_request.domain}/terms",
-                timeout=10.0,
+        response = await http_client.get(
+            f"{GLOSSARY_INTERNAL_URL}/api/v1/glossary/categories/{bookmark_request.domain}/terms",
+            timeout=10.0,
+        )
+        if response.status_code == 404:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Glossary not found"
+            )
+        elif response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to validate glossary",
             )
-            if response.status_code == 404:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Glossary not found"
-                )
-            elif response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to validate glossary",
-                )
 
-            # Get the terms to count them
-            terms = response.json()
-            term_count = len(terms) if isinstance(terms, list) else 0
+        # Get the terms to count them
+        terms = response.json()
+        term_count = len(terms) if isinstance(terms, list) else 0
     except httpx.RequestError:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
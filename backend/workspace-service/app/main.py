@@ -1,9 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mavito_common.core.config import settings
+from mavito_common.http import health
+from mavito_common.http.lifespan import service_lifespan
+from mavito_common.observability.middleware import install_observability
 from app.api.v1.endpoints import bookmarks, groups, notes
 
-app = FastAPI(title="Marito Workspace Service")
+app = FastAPI(title="Marito Workspace Service", lifespan=service_lifespan)
 
 if settings.BACKEND_CORS_ORIGINS_LIST:
     app.add_middleware(
@@ -19,6 +22,8 @@ app.include_router(
 )
 app.include_router(groups.router, prefix="/api/v1/workspace/groups", tags=["Groups"])
 app.include_router(notes.router, prefix="/api/v1/workspace/notes", tags=["Notes"])
+app.include_router(health.router)
+install_observability(app)
 
 
 @app.get("/", tags=["Health Check"])
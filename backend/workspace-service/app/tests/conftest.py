@@ -21,6 +21,7 @@ from mavito_common.db.base_class import Base
 from mavito_common.core.config import settings
 from app.main import app
 from mavito_common.db.session import get_db
+from mavito_common.core.auth import principal_cache, revocation_version
 
 # Suppress Pydantic warning about class-based config
 warnings.filterwarnings(
@@ -152,3 +153,10 @@ def mock_user():
     user.username = "testuser"
     user.email = "test@example.com"
     return user
+
+
+@pytest.fixture(autouse=True)
+def reset_principal_cache():
+    """Every test gets a fresh database, so cached principals must not leak."""
+    principal_cache.clear()
+    revocation_version.invalidate()
@@ -4,7 +4,7 @@ Unit tests for bookmark-related functionality.
 
 import pytest
 import uuid
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock, AsyncMock
 from fastapi import HTTPException
 
 from mavito_common.models.bookmark import TermBookmark, GlossaryBookmark
@@ -105,17 +105,15 @@ class TestBookmarkGlossary:
     """Test cases for the bookmark_glossary endpoint."""
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_bookmark_glossary_success(self, mock_client, mock_db, mock_user):
+    async def test_bookmark_glossary_success(self, mock_db, mock_user):
         """Test successful glossary bookmarking."""
         # Setup mock response from glossary service
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = [{"term": "term1"}, {"term": "term2"}]
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.get.return_value = mock_response
-        mock_client.return_value = mock_client_instance
+        mock_http_client = AsyncMock()
+        mock_http_client.get.return_value = mock_response
 
         # Mock database operations
         mock_db.execute.return_value.scalar_one_or_none.return_value = None
@@ -129,7 +127,10 @@ class TestBookmarkGlossary:
 
         # Execute endpoint
         result = await bookmark_glossary(
-            db=mock_db, bookmark_request=bookmark_request, current_user=mock_user
+            db=mock_db,
+            bookmark_request=bookmark_request,
+            current_user=mock_user,
+            http_client=mock_http_client,
         )
 
         # Verify results
@@ -139,16 +140,14 @@ class TestBookmarkGlossary:
         mock_db.commit.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient")
-    async def test_bookmark_glossary_not_found(self, mock_client, mock_db, mock_user):
+    async def test_bookmark_glossary_not_found(self, mock_db, mock_user):
         """Test bookmarking a non-existent glossary."""
         # Setup mock response from glossary service
         mock_response = MagicMock()
         mock_response.status_code = 404
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value.get.return_value = mock_response
-        mock_client.return_value = mock_client_instance
+        mock_http_client = AsyncMock()
+        mock_http_client.get.return_value = mock_response
 
         # Create bookmark request
         bookmark_request = BookmarkGlossaryRequest(domain="NonExistentDomain")
@@ -158,7 +157,10 @@ class TestBookmarkGlossary:
         # Execute endpoint and expect exception
         with pytest.raises(HTTPException) as exc:
             await bookmark_glossary(
-                db=mock_db, bookmark_request=bookmark_request, current_user=mock_user
+                db=mock_db,
+                bookmark_request=bookmark_request,
+                current_user=mock_user,
+                http_client=mock_http_client,
             )
 
         assert exc.value.status_code == 404